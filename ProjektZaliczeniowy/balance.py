@@ -0,0 +1,197 @@
+"""
+HUGO - Testy balansu (Monte Carlo)
+==================================
+Uruchamia tysiące gier bez okna (tryb headless) na wszystkich rdzeniach
+procesora i zbiera: przebyty dystans, wynik i przyczynę końca gry.
+Można przy tym przeglądać różne wartości ustawień z config.py.
+
+Przykłady:
+    python balance.py --games 2000
+    python balance.py --games 1000 --sweep MIN_OBSTACLE_DISTANCE=300,400,500 \\
+                      --sweep ENEMY_SHOOT_CHANCE=0.02,0.03 --out balans.npz
+    python balance.py --policy script --script sterowanie.txt --set SCROLL_SPEED=4
+
+Każdy punkt przeglądu (kombinacja wartości z --sweep) gra te same ziarna,
+więc różnice między punktami wynikają z ustawień, a nie z losowania.
+
+Wyniki (plik .npz, tablice NumPy):
+    param_names   - nazwy przeglądanych ustawień
+    param_values  - [punkt, ustawienie] wartości w każdym punkcie
+    seeds         - [gra] ziarna gier
+    distance_m    - [punkt, gra] przebyty dystans w metrach
+    score         - [punkt, gra] wynik
+    frames        - [punkt, gra] ile klatek trwała gra
+    death_cause   - [punkt, gra] kod przyczyny końca (indeks w cause_labels)
+    cause_labels  - nazwy przyczyn: przeżył / nietoperz / pocisk
+"""
+import argparse
+import itertools
+import multiprocessing
+import os
+import time
+import numpy as np
+from game.game import Game
+from game.controls import ScriptedInput, RandomInput
+from game.tuning import apply_config_overrides, override_error, parse_assignment, parse_value
+
+# Przyczyny końca gry (kolejność = kody w tablicy death_cause)
+CAUSE_LABELS = ('alive', 'obstacle', 'projectile')
+CAUSE_CODES = {None: 0, 'obstacle': 1, 'projectile': 2}
+
+
+def parse_args():
+    """Wczytuje parametry z linii poleceń."""
+    parser = argparse.ArgumentParser(description="HUGO - testy balansu (Monte Carlo)")
+    parser.add_argument('--games', type=int, default=1000,
+                        help="ile gier w każdym punkcie przeglądu")
+    parser.add_argument('--frames', type=int, default=36000,
+                        help="maksymalna długość gry w klatkach (36000 = 10 minut)")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="ziarno pierwszej gry (kolejne: seed+1, seed+2, ...)")
+    parser.add_argument('--policy', choices=('random', 'idle', 'script'), default='random',
+                        help="gracz: losowy, nic nie robiący albo ze scenariusza")
+    parser.add_argument('--script', default=None,
+                        help="plik ze scenariuszem sterowania (dla --policy script)")
+    parser.add_argument('--set', action='append', default=[], metavar='NAZWA=WARTOŚĆ',
+                        help="stała zmiana ustawienia (można powtarzać)")
+    parser.add_argument('--sweep', action='append', default=[], metavar='NAZWA=W1,W2,...',
+                        help="przeglądane wartości ustawienia (można powtarzać)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="ile procesów (domyślnie tyle, ile rdzeni)")
+    parser.add_argument('--chunk', type=int, default=50,
+                        help="ile gier liczy proces w jednym zadaniu")
+    parser.add_argument('--out', default='balans.npz',
+                        help="plik z wynikami (.npz)")
+    return parser.parse_args()
+
+
+# =============================================================================
+# PRACA JEDNEGO PROCESU
+# =============================================================================
+
+def create_policy(policy, seed, script):
+    """Tworzy źródło sterowania dla jednej gry."""
+    if policy == 'random':
+        return RandomInput(seed)
+    if policy == 'script':
+        return ScriptedInput.from_file(script)
+    return ScriptedInput()  # 'idle' - brak wciśniętych klawiszy
+
+
+def run_job(job):
+    """
+    Gra serię gier z podanymi ustawieniami (wywoływane w procesie roboczym).
+    Zwraca (punkt, pierwsza gra, tablice wyników).
+    """
+    point, first_game, overrides, seeds, policy, script, max_frames = job
+
+    previous = apply_config_overrides(overrides)
+    try:
+        count = len(seeds)
+        distance = np.zeros(count, dtype=np.int32)
+        score = np.zeros(count, dtype=np.int32)
+        frames = np.zeros(count, dtype=np.int32)
+        causes = np.zeros(count, dtype=np.int8)
+
+        for i, seed in enumerate(seeds):
+            game = Game(headless=True, seed=seed,
+                        input_source=create_policy(policy, seed, script))
+            stats = game.run_headless(max_frames)
+            distance[i] = stats['distance_m']
+            score[i] = stats['score']
+            frames[i] = stats['frames']
+            causes[i] = CAUSE_CODES[stats['death_cause']]
+    finally:
+        apply_config_overrides(previous)
+
+    return point, first_game, distance, score, frames, causes
+
+
+# =============================================================================
+# PRZEGLĄD I PODSUMOWANIE
+# =============================================================================
+
+def print_summary(param_names, param_values, distance, score, causes):
+    """Wypisuje krótkie podsumowanie każdego punktu przeglądu."""
+    for point in range(len(param_values)):
+        settings = ", ".join(f"{name}={value:g}"
+                             for name, value in zip(param_names, param_values[point]))
+        d = distance[point]
+        cause_counts = np.bincount(causes[point], minlength=len(CAUSE_LABELS))
+        cause_text = ", ".join(f"{label} {count / len(d):.0%}"
+                               for label, count in zip(CAUSE_LABELS, cause_counts))
+        print(f"[BALANS] {settings or 'domyślne ustawienia'}")
+        print(f"         dystans: średnio {d.mean():.0f} m, mediana {np.median(d):.0f} m, "
+              f"p10 {np.percentile(d, 10):.0f} m, p90 {np.percentile(d, 90):.0f} m; "
+              f"wynik średnio {score[point].mean():.0f}; koniec: {cause_text}")
+
+
+def main():
+    args = parse_args()
+    if args.policy == 'script' and not args.script:
+        raise SystemExit("--policy script wymaga --script PLIK")
+
+    fixed = {}
+    for text in args.set:
+        name, value = parse_assignment(text)
+        fixed[name] = parse_value(value)
+
+    param_names = []
+    sweep_values = []
+    for text in args.sweep:
+        name, values = parse_assignment(text)
+        param_names.append(name)
+        sweep_values.append([parse_value(value) for value in values.split(',')])
+
+    # Wszystkie kombinacje przeglądanych wartości
+    grid = list(itertools.product(*sweep_values))
+    seeds = np.arange(args.seed, args.seed + args.games, dtype=np.int64)
+
+    # Sprawdź nazwy od razu, a nie dopiero w procesach roboczych
+    for name in list(fixed) + param_names:
+        error = override_error(name)
+        if error:
+            raise SystemExit(error)
+
+    jobs = []
+    for point, values in enumerate(grid):
+        overrides = dict(fixed)
+        overrides.update(zip(param_names, values))
+        for first in range(0, args.games, args.chunk):
+            chunk_seeds = [int(seed) for seed in seeds[first:first + args.chunk]]
+            jobs.append((point, first, overrides, chunk_seeds,
+                         args.policy, args.script, args.frames))
+
+    shape = (len(grid), args.games)
+    distance = np.zeros(shape, dtype=np.int32)
+    score = np.zeros(shape, dtype=np.int32)
+    frames = np.zeros(shape, dtype=np.int32)
+    causes = np.zeros(shape, dtype=np.int8)
+
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.workers) as pool:
+        for point, first, *arrays in pool.imap_unordered(run_job, jobs):
+            end = first + len(arrays[0])
+            distance[point, first:end], score[point, first:end], \
+                frames[point, first:end], causes[point, first:end] = arrays
+    elapsed = time.perf_counter() - start
+
+    param_values = np.array(grid, dtype=np.float64).reshape(len(grid), len(param_names))
+    np.savez_compressed(args.out,
+                        param_names=np.array(param_names, dtype=str),
+                        param_values=param_values,
+                        seeds=seeds,
+                        distance_m=distance,
+                        score=score,
+                        frames=frames,
+                        death_cause=causes,
+                        cause_labels=np.array(CAUSE_LABELS))
+
+    total_frames = int(frames.sum())
+    print(f"[BALANS] {distance.size} gier, {total_frames} klatek w {elapsed:.1f} s "
+          f"({total_frames / elapsed:.0f} klatek/s, {args.workers} procesów) -> {args.out}")
+    print_summary(param_names, param_values, distance, score, causes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+HUGO - Zgodność jądra NumPy z Game
+==================================
+Gra te same gry (ziarna) naraz w Game(headless=True) i w GameKernel,
+z tym samym sterowaniem, i po KAŻDEJ klatce porównuje: czy gra trwa,
+numer klatki, wynik, dystans, przyczynę końca, położenie gracza, cooldown
+skoku i liczby monet, nietoperzy, przeciwników oraz pocisków.
+Pierwsze różnice są wypisywane, a skrypt kończy się kodem 1 - jądro
+rozjechało się z grą.
+
+Sterowanie: losowy gracz (RandomInput) i autopilot bez limitu czasu
+(powtarzalny, dochodzi daleko - przyspieszanie, przeciwnicy, powerupy).
+Maski klawiszy, które dostała Game, idą w tej samej klatce do jądra.
+
+Uruchomienie (z folderu ProjektZaliczeniowy):
+    python benchmarks/check_kernel.py                          # 200 + 4 gry
+    python benchmarks/check_kernel.py --games 50 --autopilot 12 --frames 10000
+    python benchmarks/check_kernel.py --set ENEMY_SPAWN_DISTANCE=150
+
+Warto uruchomić po każdej zmianie logiki gry - w Game albo w kernel.py.
+"""
+import argparse
+import os
+import sys
+import time
+
+# Bez prawdziwego okna (np. na serwerze CI)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, GAME_DIR)
+
+import numpy as np
+from game.game import Game
+from game.controls import RandomInput
+from game.autopilot import Autopilot
+from game.kernel import GameKernel
+from game.tuning import apply_config_overrides, override_error, parse_assignment, parse_value
+
+# Przyczyny końca gry jak w kolumnie GameKernel.death_cause
+CAUSE_CODES = {None: 0, 'obstacle': 1, 'projectile': 2}
+
+# Porównywane wartości (kolejność jak w game_state i kernel_columns)
+FIELDS = ('gra trwa', 'klatka', 'wynik', 'dystans', 'przyczyna końca', 'gracz x', 'gracz y',
+          'cooldown skoku', 'monety', 'nietoperze', 'przeciwnicy', 'pociski')
+
+# Ile różnic wypisać, zanim skrypt się podda
+MAX_MISMATCHES = 10
+
+
+def parse_args():
+    """Wczytuje parametry z linii poleceń."""
+    parser = argparse.ArgumentParser(description="HUGO - zgodność jądra NumPy z Game")
+    parser.add_argument('--games', type=int, default=200,
+                        help="ile gier losowego gracza")
+    parser.add_argument('--autopilot', type=int, default=4,
+                        help="ile gier autopilota (bez limitu czasu)")
+    parser.add_argument('--frames', type=int, default=6000,
+                        help="najwyżej ile klatek każdej gry")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="ziarno pierwszej gry (kolejne: seed+1, seed+2, ...)")
+    parser.add_argument('--set', action='append', default=[], metavar='NAZWA=WARTOŚĆ',
+                        help="zmiana ustawienia (można powtarzać)")
+    return parser.parse_args()
+
+
+class RecordingInput:
+    """Sterowanie z source, które zapamiętuje maskę klawiszy ostatniej klatki."""
+
+    def __init__(self, source):
+        self.source = source
+        self.mask = 0
+
+    def get_keys(self):
+        """Zwraca stan klawiszy z source (i zapamiętuje maskę)."""
+        keys = self.source.get_keys()
+        self.mask = keys.mask
+        return keys
+
+
+def create_game(seed, autopilot):
+    """Gra headless gotowa do update() - losowy gracz albo autopilot."""
+    source = Autopilot(budget=0) if autopilot else RandomInput(seed)
+    recording = RecordingInput(source)
+    game = Game(headless=True, seed=seed, input_source=recording)
+    if autopilot:
+        source.attach(game)
+    game.game_state = 'playing'
+    game.reset_game()
+    return game, recording
+
+
+def game_state(game):
+    """Porównywane wartości gry (FIELDS)."""
+    player = game.player
+    enemy_manager = game.enemy_manager
+    return (game.game_state == 'playing', game.frame_count, game.get_total_score(),
+            game.distance_pixels, CAUSE_CODES[game.death_cause],
+            player.rect.x, player.rect.y, player.move_cooldown,
+            len(game.coins), len(game.obstacle_manager.obstacles),
+            len(enemy_manager.enemies), len(enemy_manager.projectiles))
+
+
+def kernel_columns(kernel):
+    """Porównywane wartości wszystkich gier jądra - kolumny jak FIELDS."""
+    return (kernel.playing, kernel.frame_count, kernel.total_scores(), kernel.distance,
+            kernel.death_cause, kernel.player_x, kernel.player_y, kernel.move_cooldown,
+            kernel.coins.count(), kernel.bats.count(), kernel.enemies.count(),
+            kernel.projectiles.count())
+
+
+def check(seeds, autopilots, max_frames):
+    """
+    Gra wszystkie gry krok w krok w Game i w jądrze.
+    Zwraca (listę różnic, liczbę porównanych klatek).
+
+    Parametry:
+        seeds - ziarna gier
+        autopilots - dla każdej gry: True = autopilot, False = losowy gracz
+        max_frames - najwyżej ile klatek
+    """
+    games = [create_game(seed, autopilot) for seed, autopilot in zip(seeds, autopilots)]
+    kernel = GameKernel(seeds)
+    actions = np.zeros(len(seeds), dtype=np.int64)
+    running = list(range(len(seeds)))
+
+    mismatches = []
+    compared = 0
+    for frame in range(max_frames):
+        for i in running:
+            game, recording = games[i]
+            if game.game_state == 'playing':
+                game.update()
+                actions[i] = recording.mask
+            else:
+                actions[i] = 0
+        kernel.step(actions)
+
+        columns = kernel_columns(kernel)
+        still_running = []
+        for i in running:
+            expected = game_state(games[i][0])
+            got = tuple(column[i].item() for column in columns)
+            compared += 1
+            if expected != got:
+                fields = [f"{name}: {a} != {b}"
+                          for name, a, b in zip(FIELDS, expected, got) if a != b]
+                mismatches.append(f"ziarno {seeds[i]}, klatka {frame + 1}: " + ", ".join(fields))
+                if len(mismatches) >= MAX_MISMATCHES:
+                    return mismatches, compared
+            elif expected[0]:
+                still_running.append(i)
+        running = still_running
+        if not running:
+            break
+    return mismatches, compared
+
+
+def main():
+    args = parse_args()
+
+    overrides = {}
+    for text in args.set:
+        name, value = parse_assignment(text)
+        error = override_error(name)
+        if error:
+            raise SystemExit(error)
+        overrides[name] = parse_value(value)
+    apply_config_overrides(overrides)
+
+    seeds = list(range(args.seed, args.seed + args.games + args.autopilot))
+    autopilots = [False] * args.games + [True] * args.autopilot
+
+    start = time.perf_counter()
+    mismatches, compared = check(seeds, autopilots, args.frames)
+    elapsed = time.perf_counter() - start
+
+    print(f"[JĄDRO] {len(seeds)} gier ({args.autopilot} z autopilotem), "
+          f"{compared} klatek porównanych w {elapsed:.1f} s")
+    if mismatches:
+        for line in mismatches:
+            print(f"        {line}")
+        print("[JĄDRO] Jądro NumPy NIE zgadza się z Game")
+        sys.exit(1)
+    print("[JĄDRO] Zgodne z Game w każdej klatce")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,435 @@
+"""
+HUGO - Benchmarki podsystemów
+=============================
+Mierzy, ile nanosekund na JEDEN obiekt kosztuje aktualizacja, kolizja
+i rysowanie monet, powerupów, nietoperzy, pocisków, lin oraz HUD,
+a także losowanie wzorców nietoperzy (na jeden wzorzec).
+Scenariusze są zawsze takie same (stałe ziarno, N obiektów, maksymalna
+prędkość scrollowania), a rysowanie idzie na obrazek poza ekranem.
+
+Uruchomienie (z folderu ProjektZaliczeniowy):
+    python benchmarks/run_benchmarks.py                   # porównaj z baseline.json
+    python benchmarks/run_benchmarks.py --output wyniki.json
+    python benchmarks/run_benchmarks.py --save-baseline   # zapisz nowy baseline
+    python benchmarks/run_benchmarks.py --fail-on-regression  # kod 1 przy regresji (CI)
+
+Każdy pomiar trwa co najmniej MIN_ROUND_NS (seria --inner wywołań jest
+powtarzana). Przebieg całego zestawu daje medianę z --rounds pomiarów,
+a wynik to mediana z --passes przebiegów - przebiegi są oddalone o kilka
+sekund, więc chwilowe spowolnienie komputera psuje najwyżej jeden z nich.
+
+Wynik porównania: czas / czas z baseline. Pomiar wolniejszy o więcej niż
+--threshold (domyślnie 20%) jest mierzony jeszcze raz (--confirm razy) i tylko
+jeśli za każdym razem wychodzi wolniejszy, jest zgłaszany jako regresja.
+Z --fail-on-regression skrypt kończy się wtedy kodem 1.
+Porównywać warto tylko wyniki z tego samego komputera.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+# Bez prawdziwego okna (np. na serwerze CI)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, GAME_DIR)
+
+import pygame
+from game.config import *
+from game.game import Game
+from game.patterns import pattern_table
+from game.profiler import machine_info
+
+BASELINE_PATH = os.path.join(GAME_DIR, 'benchmarks', 'baseline.json')
+BENCH_SEED = 1234
+POWERUP_TYPES = ('invincible', 'double_points')
+MIN_ROUND_NS = 10_000_000  # Najkrótszy pojedynczy pomiar (10 ms)
+
+# Hitbox gracza daleko od wszystkiego - kolizja liczy się, ale nie trafia
+MISS_HITBOX = pygame.Rect(-1000, -1000, 10, 10)
+
+
+def parse_args():
+    """Wczytuje parametry z linii poleceń."""
+    parser = argparse.ArgumentParser(description="HUGO - benchmarki podsystemów")
+    parser.add_argument('--count', type=int, default=60,
+                        help="ile obiektów w każdym scenariuszu")
+    parser.add_argument('--rounds', type=int, default=15,
+                        help="ile pomiarów w jednym przebiegu")
+    parser.add_argument('--passes', type=int, default=3,
+                        help="ile przebiegów całego zestawu (wynik to mediana z nich)")
+    parser.add_argument('--inner', type=int, default=50,
+                        help="ile wywołań w jednej serii (seria jest powtarzana "
+                             "do MIN_ROUND_NS)")
+    parser.add_argument('--output', default=None,
+                        help="zapisz wyniki do pliku JSON")
+    parser.add_argument('--baseline', default=BASELINE_PATH,
+                        help="plik z wynikami do porównania")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="zapisz wyniki jako nowy baseline")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="o ile wolniej (ułamek) to już regresja")
+    parser.add_argument('--confirm', type=int, default=2,
+                        help="ile razy powtórzyć pomiar wolniejszy od baseline, "
+                             "zanim zostanie uznany za regresję")
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help="zakończ z kodem 1, jeśli są regresje")
+    return parser.parse_args()
+
+
+# =============================================================================
+# POMIAR
+# =============================================================================
+
+def measure(func, entities, inner, rounds, setup=None):
+    """
+    Zwraca medianę czasu jednego wywołania func podzieloną przez entities
+    (nanosekundy na obiekt).
+
+    Jeden pomiar to serie po inner wywołań (setup przed każdą serią, poza
+    mierzonym czasem), powtarzane aż uzbiera się MIN_ROUND_NS - kilka
+    mikrosekund mierzyłoby głównie zegar i przerwania. Mediana z rounds
+    pomiarów nie ulega pojedynczym skokom w żadną stronę.
+
+    Parametry:
+        func - mierzona funkcja (bez parametrów)
+        entities - ilu obiektów dotyczy jedno wywołanie
+        inner - ile wywołań w jednej serii
+        rounds - ile pomiarów
+        setup - funkcja przywracająca scenariusz przed każdą serią
+    """
+    def series():
+        if setup:
+            setup()
+        start = time.perf_counter_ns()
+        for _ in range(inner):
+            func()
+        return time.perf_counter_ns() - start
+
+    series()  # Rozgrzewka
+
+    times = []
+    for _ in range(rounds):
+        elapsed = 0
+        calls = 0
+        while elapsed < MIN_ROUND_NS:
+            elapsed += series()
+            calls += inner
+        times.append(elapsed / calls)
+    return statistics.median(times) / entities
+
+
+def snapshot_store(store):
+    """Zwraca funkcję przywracającą pozycje obiektów w magazynie (po scroll)."""
+    y = store.y[:store.count].copy()
+    anim = store.anim[:store.count].copy()
+    scrolled = store.scrolled
+
+    def restore():
+        store.y[:store.count] = y
+        store.anim[:store.count] = anim
+        store.scrolled = scrolled
+    return restore
+
+
+# =============================================================================
+# SCENARIUSZE
+# =============================================================================
+
+def create_game():
+    """Gra z załadowanymi grafikami, rysująca na obrazek poza ekranem."""
+    pygame.init()
+    game = Game(seed=BENCH_SEED)
+    while not game.sprite_manager.finish_loading():
+        time.sleep(0.001)
+    game.start_game()
+    game.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    return game
+
+
+def fresh_world(game):
+    """Pusty świat przy maksymalnej prędkości."""
+    game.reset_game()
+    game.screen.fill(BLACK)
+    game.scroll_speed = MAX_SCROLL_SPEED
+
+
+def spread(index, count, low, high):
+    """Równe rozłożenie count wartości w przedziale [low, high)."""
+    return low + (high - low) * index // count
+
+
+def bench_collectibles(game, count, inner, rounds):
+    """Monety i powerupy: update (magazyn), kolizja i rysowanie."""
+    results = {}
+    fresh_world(game)
+
+    # Na ekranie, ale tak nisko, żeby inner kroków nie zepchnęło ich za dół
+    bottom = SCREEN_HEIGHT - MAX_SCROLL_SPEED * (inner + 1) - COIN_SIZE
+    for i in range(count):
+        coin = game.coin_pool.acquire()
+        coin.spawn(i % NUM_ROPES, spread(i, count, 0, bottom), game.sprite_manager,
+                   game.coin_store, game.lane_geometry)
+        powerup = game.powerup_pool.acquire()
+        powerup.spawn(i % NUM_ROPES, spread(i, count, 0, bottom),
+                      POWERUP_TYPES[i % len(POWERUP_TYPES)], game.sprite_manager,
+                      game.powerup_store, game.lane_geometry)
+
+    def update_coins():
+        game.coin_store.scroll(game.scroll_speed)
+        game.coin_store.advance_animation()
+
+    results['coins.update'] = measure(update_coins, count, inner, rounds,
+                                      setup=snapshot_store(game.coin_store))
+    results['coins.collision'] = measure(
+        lambda: [coin.check_collision(MISS_HITBOX) for coin in game.coins],
+        count, inner, rounds)
+    results['coins.draw'] = measure(
+        lambda: [coin.draw(game.screen, 0) for coin in game.coins],
+        count, inner, rounds)
+
+    results['powerups.update'] = measure(
+        lambda: game.powerup_store.scroll(game.scroll_speed), count, inner, rounds,
+        setup=snapshot_store(game.powerup_store))
+    results['powerups.collision'] = measure(
+        lambda: [powerup.check_collision(MISS_HITBOX) for powerup in game.powerups],
+        count, inner, rounds)
+    results['powerups.draw'] = measure(
+        lambda: [powerup.draw(game.screen, 0) for powerup in game.powerups],
+        count, inner, rounds)
+    return results
+
+
+def bench_obstacles(game, count, inner, rounds):
+    """Nietoperze ze wszystkich wzorców: update managera, kolizja i rysowanie."""
+    results = {}
+    fresh_world(game)
+    manager = game.obstacle_manager
+
+    bottom = SCREEN_HEIGHT - MAX_SCROLL_SPEED * (inner + 1) - OBSTACLE_SIZE
+    spawned = 0
+    pattern_index = 0
+    while spawned < count:
+        lanes = OBSTACLE_PATTERNS[pattern_index % len(OBSTACLE_PATTERNS)][0]
+        for lane in lanes:
+            if spawned == count:
+                break
+            bat_type = 'bat_1' if spawned % 2 == 0 else 'bat_2'
+            obstacle = manager.pool.acquire()
+            obstacle.spawn(lane, spread(spawned, count, 0, bottom), bat_type,
+                           game.sprite_manager, spawned % 30, manager.store, game.lane_geometry)
+            spawned += 1
+        pattern_index += 1
+
+    results['obstacles.update'] = measure(
+        lambda: manager.update(game.scroll_speed), count, inner, rounds,
+        setup=snapshot_store(manager.store))
+    results['obstacles.collision'] = measure(
+        lambda: [obstacle.check_collision(MISS_HITBOX) for obstacle in manager.obstacles],
+        count, inner, rounds)
+    results['obstacles.draw'] = measure(
+        lambda: manager.draw(game.screen, 0), count, inner, rounds)
+    return results
+
+
+def bench_projectiles(game, count, inner, rounds):
+    """Pociski: update managera (ruch + usuwanie), kolizja i rysowanie."""
+    results = {}
+    fresh_world(game)
+    manager = game.enemy_manager
+
+    # Środek ekranu - inner kroków w dowolną stronę nie wyrzuci ich za ekran
+    margin = 7 * (inner + 1)
+    for i in range(count):
+        projectile = manager.projectile_pool.acquire()
+        projectile.spawn(spread(i, count, margin, SCREEN_WIDTH - margin),
+                         spread(i, count, 50, SCREEN_HEIGHT - 50),
+                         1 if i % 2 == 0 else -1)
+        projectile.index = len(manager.projectiles)
+        manager.projectiles.append(projectile)
+    start_x = [projectile.x for projectile in manager.projectiles]
+
+    def restore():
+        for projectile, x in zip(manager.projectiles, start_x):
+            projectile.spawn(x, projectile.y, projectile.direction)
+
+    results['projectiles.update'] = measure(
+        lambda: manager.update(game.scroll_speed), count, inner, rounds, setup=restore)
+    results['projectiles.collision'] = measure(
+        lambda: manager.check_projectile_collisions(MISS_HITBOX), count, inner, rounds)
+    results['projectiles.draw'] = measure(
+        lambda: manager.draw(game.screen, 1.0), count, inner, rounds)
+    return results
+
+
+def bench_ropes(game, inner, rounds):
+    """Liny: przesuwanie tekstury i rysowanie."""
+    fresh_world(game)
+    ropes = game.ropes
+
+    def update():
+        for rope in ropes:
+            rope.update(game.scroll_speed)
+
+    return {
+        'ropes.update': measure(update, len(ropes), inner, rounds),
+        'ropes.draw': measure(lambda: [rope.draw(game.screen, 0) for rope in ropes],
+                              len(ropes), inner, rounds),
+    }
+
+
+def bench_hud(game, inner, rounds):
+    """HUD (Game.draw_ui): te same wartości i wartości zmieniające się co klatkę."""
+    fresh_world(game)
+
+    def draw_changing():
+        game.score += 1
+        game.draw_ui()
+
+    return {
+        'hud.draw_ui.static': measure(game.draw_ui, 1, inner, rounds),
+        'hud.draw_ui.changing': measure(draw_changing, 1, inner, rounds),
+    }
+
+
+def bench_patterns(count, inner, rounds):
+    """Losowanie wzorców nietoperzy: pojedynczo (jak w grze) i ciągami (NumPy)."""
+    table = pattern_table()
+    rng = random.Random(BENCH_SEED)
+
+    def sample():
+        state = 0
+        for _ in range(count):
+            state = table.next_state[state][table.sample(rng, state, 0)]
+
+    return {
+        'patterns.sample': measure(sample, count, inner, rounds),
+        'patterns.generate': measure(lambda: table.generate(count, 100, seed=BENCH_SEED),
+                                     count * 100, inner, rounds),
+    }
+
+
+def run_pass(count, inner, rounds):
+    """Jeden przebieg wszystkich scenariuszy. Zwraca {nazwa: ns na obiekt}."""
+    game = create_game()
+    results = {}
+    results.update(bench_collectibles(game, count, inner, rounds))
+    results.update(bench_obstacles(game, count, inner, rounds))
+    results.update(bench_projectiles(game, count, inner, rounds))
+    results.update(bench_ropes(game, inner, rounds))
+    results.update(bench_hud(game, inner, rounds))
+    results.update(bench_patterns(count, inner, rounds))
+    pygame.quit()
+    return results
+
+
+def run_benchmarks(count, inner, rounds, passes):
+    """
+    Uruchamia wszystkie scenariusze passes razy.
+    Zwraca {nazwa: mediana ns na obiekt z przebiegów}.
+    """
+    runs = [run_pass(count, inner, rounds) for _ in range(passes)]
+    return {name: statistics.median(run[name] for run in runs) for name in runs[0]}
+
+
+# =============================================================================
+# PORÓWNANIE Z BASELINE
+# =============================================================================
+
+def slower_than_baseline(results, baseline, threshold):
+    """Nazwy benchmarków wolniejszych od baseline o więcej niż threshold."""
+    base_results = baseline['results_ns_per_entity'] if baseline else {}
+    return [name for name, value in results.items()
+            if name in base_results and value > base_results[name] * (1 + threshold)]
+
+
+def compare(results, baseline, threshold):
+    """
+    Wypisuje tabelę porównania z baseline. Zwraca listę regresji.
+
+    Parametry:
+        results - {nazwa: ns na obiekt} z tego uruchomienia
+        baseline - zawartość pliku baseline (albo None)
+        threshold - o ile wolniej (ułamek) to już regresja
+    """
+    base_results = baseline['results_ns_per_entity'] if baseline else {}
+    if baseline and baseline['machine'] != machine_info():
+        print("[BENCH] Uwaga: baseline pochodzi z innego komputera/wersji - "
+              "porównanie jest tylko orientacyjne")
+
+    regressions = []
+    print(f"{'benchmark':<26} {'ns/obiekt':>11} {'baseline':>11} {'zmiana':>8}")
+    for name, value in results.items():
+        base = base_results.get(name)
+        if base is None:
+            print(f"{name:<26} {value:>11.1f} {'-':>11} {'':>8}")
+            continue
+        ratio = value / base
+        status = ''
+        if ratio > 1 + threshold:
+            status = '  WOLNIEJ'
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            status = '  szybciej'
+        print(f"{name:<26} {value:>11.1f} {base:>11.1f} {ratio - 1:>+8.0%}{status}")
+    return regressions
+
+
+def main():
+    args = parse_args()
+
+    # Gra ładuje grafiki ze ścieżek względnych - pracujemy z folderu gry,
+    # a ścieżki z linii poleceń liczymy od folderu, z którego uruchomiono skrypt
+    if args.output:
+        args.output = os.path.abspath(args.output)
+    args.baseline = os.path.abspath(args.baseline)
+    os.chdir(GAME_DIR)
+
+    results = run_benchmarks(args.count, args.inner, args.rounds, args.passes)
+
+    report = {
+        'machine': machine_info(),
+        'settings': {'count': args.count, 'inner': args.inner, 'rounds': args.rounds,
+                     'passes': args.passes,
+                     'min_round_ns': MIN_ROUND_NS,
+                     'scroll_speed': MAX_SCROLL_SPEED},
+        'results_ns_per_entity': results,
+    }
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    # Wolniejszy pomiar może być przypadkiem - mierzymy jeszcze raz
+    # i zostawiamy lepszy wynik; regresja musi się powtórzyć
+    for _ in range(args.confirm):
+        suspects = slower_than_baseline(results, baseline, args.threshold)
+        if not suspects:
+            break
+        print(f"[BENCH] Mierzę ponownie: {', '.join(suspects)}")
+        again = run_benchmarks(args.count, args.inner, args.rounds, args.passes)
+        for name in suspects:
+            results[name] = min(results[name], again[name])
+    regressions = compare(results, baseline, args.threshold)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"[BENCH] Zapisano baseline: {args.baseline}")
+
+    if regressions:
+        print(f"[BENCH] Regresje: {', '.join(regressions)}")
+        if args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
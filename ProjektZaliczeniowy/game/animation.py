@@ -0,0 +1,55 @@
+"""
+HUGO - Klipy animacji
+=====================
+Wybór klatki animacji to zawsze to samo: licznik // szybkość % liczba klatek
+(dla skoku dodatkowo przeliczenie postępu na klatkę i wybór kierunku).
+Liczenie tego co klatkę dla każdego obiektu jest zbędne - wynik zależy
+tylko od licznika.
+
+AnimationClip liczy RAZ tabelę "licznik -> obrazek" na cały cykl animacji.
+Obiekt trzyma referencję do swojego klipu (kierunek wybrany przy tworzeniu)
+i bierze klatkę jednym odczytem z tabeli.
+
+Klipy opisuje ANIMATION_CLIPS w config.py, a tworzy je SpriteManager.
+"""
+
+
+class AnimationClip:
+    """
+    Animacja: lista klatek + gotowa tabela "licznik -> klatka".
+    """
+
+    def __init__(self, ticks_per_frame, loop=True):
+        """
+        Parametry:
+            ticks_per_frame - ile klatek gry trwa jedna klatka animacji
+            loop - True: animacja się powtarza, False: po ostatniej klatce
+                   zostaje na niej (np. skok)
+        """
+        self.ticks_per_frame = ticks_per_frame
+        self.loop = loop
+
+        # Klatki dochodzą później (set_frames) - klip może istnieć, zanim
+        # grafiki się załadują, a obiekty już trzymają do niego referencję
+        self.frames = []
+        self.table = []
+        self.length = 0  # Długość cyklu w klatkach gry
+
+    def set_frames(self, frames):
+        """Ustawia klatki i liczy tabelę na cały cykl animacji."""
+        self.frames = list(frames)
+        self.length = len(self.frames) * self.ticks_per_frame
+        self.table = [self.frames[tick // self.ticks_per_frame]
+                      for tick in range(self.length)]
+        if not self.loop:
+            # Licznik równy długości (koniec animacji) - ostatnia klatka
+            self.table.append(self.frames[-1])
+
+    def frame(self, tick):
+        """
+        Zwraca klatkę dla licznika tick.
+        Dla animacji bez powtarzania tick musi być w [0, length].
+        """
+        if self.loop:
+            return self.table[tick % self.length]
+        return self.table[tick]
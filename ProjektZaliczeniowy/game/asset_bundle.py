@@ -0,0 +1,165 @@
+"""
+HUGO - Paczka grafik (szybki start)
+===================================
+Przy każdym uruchomieniu SpriteManager dekoduje 11 plików PNG, zamienia je
+na format ekranu (convert_alpha), tnie arkusze na klatki, odbija klatki
+przeciwnika, skleja paski lin i obraca monetę. To kosztuje sporo czasu,
+a wynik jest za każdym razem ten sam.
+
+Paczka (plik ASSET_BUNDLE_PATH) zawiera GOTOWE piksele wszystkich
+obrazków - już pociętych, odbitych i obróconych - w formacie ekranu.
+Przy starcie plik jest mapowany do pamięci (mmap), a obrazki powstają
+przez pygame.image.frombuffer bez kopiowania i bez dekodowania.
+
+Budowanie paczki:
+    python main.py --build-assets
+
+Układ pliku:
+    nagłówek  '<8s4sI' - znacznik, format pikseli (np. b'BGRA'), długość spisu
+    spis      JSON - gdzie w pliku leży każdy obrazek (offset, szer., wys.)
+    piksele   surowe dane obrazków, jeden za drugim
+
+Gdy paczki nie ma, jest starsza niż pliki PNG albo zbudowano ją przy innych
+ustawieniach - SpriteManager ładuje grafiki z PNG, jak wcześniej.
+"""
+import json
+import mmap
+import os
+import struct
+import pygame
+from .config import *
+
+BUNDLE_MAGIC = b'HUGOAST1'
+HEADER_FORMAT = '<8s4sI'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+# Maski kolorów (R, G, B, A) -> nazwa formatu dla frombuffer/tobytes
+PIXEL_FORMATS = {
+    (0xff0000, 0xff00, 0xff, 0xff000000): 'BGRA',
+    (0xff, 0xff00, 0xff0000, 0xff000000): 'RGBA',
+    (0xff00, 0xff0000, 0xff000000, 0xff): 'ARGB',
+}
+
+
+def display_pixel_format():
+    """
+    Format pikseli, który daje convert_alpha() na obecnym ekranie
+    (None - format nietypowy, wtedy paczka zapisuje RGBA).
+    """
+    probe = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+    return PIXEL_FORMATS.get(tuple(probe.get_masks()))
+
+
+def bundle_settings():
+    """Ustawienia, od których zależy zawartość paczki."""
+    return {
+        'screen_height': SCREEN_HEIGHT,
+        'rope_tile_height': ROPE_TILE_HEIGHT,
+        'coin_rotation_step': COIN_ROTATION_STEP,
+        'sprite_files': SPRITE_FILES,
+    }
+
+
+def build_bundle(sprite_manager, path=None):
+    """
+    Zapisuje grafiki ze SpriteManager (załadowane z PNG) do paczki.
+
+    Parametry:
+        sprite_manager - SpriteManager z wszystkimi grafikami
+        path - gdzie zapisać paczkę (None = ASSET_BUNDLE_PATH)
+    """
+    if path is None:
+        path = ASSET_BUNDLE_PATH
+    pixel_format = display_pixel_format() or 'RGBA'
+    chunks = []
+    offset = 0
+
+    def add(surface):
+        """Dopisuje piksele obrazka, zwraca jego opis [offset, szer., wys.]."""
+        nonlocal offset
+        data = pygame.image.tobytes(surface, pixel_format)
+        chunks.append(data)
+        entry = [offset, surface.get_width(), surface.get_height()]
+        offset += len(data)
+        return entry
+
+    index = {'settings': bundle_settings(), 'sprites': {}, 'animations': {}}
+    for name, sprite in sprite_manager.sprites.items():
+        if isinstance(sprite, list):
+            index['animations'][name] = [add(frame) for frame in sprite]
+        else:
+            index['sprites'][name] = add(sprite)
+    index['rope_strips'] = {name: add(strip)
+                            for name, strip in sprite_manager.rope_strips.items()}
+    index['coin_frames'] = [add(frame) + list(frame_offset)
+                            for frame, frame_offset in sprite_manager.coin_frames]
+
+    index_data = json.dumps(index).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(struct.pack(HEADER_FORMAT, BUNDLE_MAGIC,
+                            pixel_format.encode('ascii'), len(index_data)))
+        f.write(index_data)
+        for data in chunks:
+            f.write(data)
+
+
+class AssetBundle:
+    """
+    Otwarta (zmapowana do pamięci) paczka grafik.
+
+    Obrazki z frombuffer korzystają bezpośrednio z pamięci pliku, więc
+    paczka musi być otwarta tak długo, jak długo gra ich używa.
+    """
+
+    def __init__(self, file, data, pixel_format, index, pixels_start):
+        self._file = file
+        self._data = data
+        self._view = memoryview(data)
+        self.pixel_format = pixel_format
+        self.index = index
+        self._pixels_start = pixels_start
+
+        # Paczka z innego komputera/ekranu - trzeba przekonwertować obrazki
+        self._needs_convert = pixel_format != display_pixel_format()
+
+    @classmethod
+    def open(cls, path=None):
+        """
+        Otwiera paczkę (None = ASSET_BUNDLE_PATH). Zwraca None, gdy paczki
+        nie da się użyć (brak pliku, zły format, starsza niż PNG, inne ustawienia).
+        """
+        if path is None:
+            path = ASSET_BUNDLE_PATH
+        try:
+            bundle_time = os.path.getmtime(path)
+            for filename in SPRITE_FILES.values():
+                if os.path.getmtime(os.path.join(SPRITES_DIR, filename)) > bundle_time:
+                    return None  # PNG zmienione po zbudowaniu paczki
+            file = open(path, 'rb')
+        except OSError:
+            return None
+
+        try:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, pixel_format, index_size = struct.unpack_from(HEADER_FORMAT, data)
+            if magic != BUNDLE_MAGIC:
+                raise ValueError("to nie jest paczka grafik HUGO")
+            index_end = HEADER_SIZE + index_size
+            index = json.loads(bytes(data[HEADER_SIZE:index_end]))
+            if index['settings'] != json.loads(json.dumps(bundle_settings())):
+                raise ValueError("paczka zbudowana przy innych ustawieniach")
+        except (ValueError, struct.error, KeyError):
+            file.close()
+            return None
+
+        return cls(file, data, pixel_format.decode('ascii'), index, index_end)
+
+    def surface(self, entry):
+        """Tworzy obrazek z opisu [offset, szer., wys.] (bez kopiowania pikseli)."""
+        offset, width, height = entry[:3]
+        start = self._pixels_start + offset
+        pixels = self._view[start:start + width * height * 4]
+        surface = pygame.image.frombuffer(pixels, (width, height), self.pixel_format)
+        if self._needs_convert:
+            surface = surface.convert_alpha()
+        return surface
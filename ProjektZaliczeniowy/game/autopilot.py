@@ -0,0 +1,408 @@
+"""
+HUGO - Autopilot
+================
+Bot grający na żywo (60 FPS): źródło sterowania jak KeyboardInput, tylko
+zamiast czytać klawiaturę, co klatkę szuka najlepszego ruchu.
+
+Szukanie (beam search):
+- stan to położenie gracza (x, y, lina, skok w toku, cooldown skoku) -
+  ruch liczymy tak samo jak Player.handle_input,
+- jeden krok szukania = AUTOPILOT_STEP_FRAMES klatek z tym samym ruchem
+  (nic / góra / dół / skok w lewo / skok w prawo),
+- świat przewidujemy: nietoperze i monety jadą w dół z aktualną prędkością,
+  pociski lecą poziomo; przeciwnicy mogą strzelić w swoim rzędzie, więc
+  stanie na ich wysokości (albo pod zjeżdżającym przeciwnikiem) kosztuje,
+- po każdym kroku zostaje AUTOPILOT_BEAM_WIDTH najlepszych stanów
+  (przeżycie, zebrane monety, wolna lina nad graczem, bezpieczna wysokość),
+  z każdego pasa wysokości na każdej linie - najwyżej jeden.
+
+Limit czasu: szukanie sprawdza zegar przed każdym ruchem (przed liczeniem
+ruchu i komórek, których potrzebuje) i przerywa ("anytime") na
+AUTOPILOT_BUDGET_MARGIN przed końcem AUTOPILOT_BUDGET - zapas na ostatni
+rozpoczęty ruch. Ruch bierzemy z najgłębszego pełnego kroku, więc bot
+nigdy nie gubi klatki. Limitu nie przekroczy samo szukanie; pojedyncze
+dłuższe klatki to sprzątanie pamięci Pythona albo system.
+
+Pamięć komórek: zagrożenia w danym kroku liczymy raz (komórka czasu),
+a dla gracza wiszącego na linie - raz na (krok, lina) jako przedziały Y
+(komórka liny). Sprawdzenie stanu to wtedy kilka porównań liczb, wspólne
+dla wszystkich stanów na tej linie w tym kroku.
+"""
+import time
+from .config import *
+from .controls import KeyState, KEY_UP, KEY_DOWN, KEY_LEFT, KEY_RIGHT
+from .player import player_hitbox
+
+# Ruchy rozważane w każdym kroku: (maska klawiszy, kierunek w pionie, kierunek skoku)
+MOVES = (
+    (0, 0, 0),
+    (KEY_UP, -1, 0),
+    (KEY_DOWN, 1, 0),
+    (KEY_LEFT, 0, -1),
+    (KEY_RIGHT, 0, 1),
+)
+
+
+class Autopilot:
+    """
+    Źródło sterowania, które samo gra (get_keys() jak w controls.py).
+
+    Potrzebuje dostępu do gry - po utworzeniu Game wywołaj attach(game).
+    """
+
+    def __init__(self, budget=None, step_frames=None, horizon=None, beam_width=None):
+        """
+        Parametry (None = wartość z config.py w chwili tworzenia bota):
+            budget - ile sekund na klatkę może trwać szukanie
+                     (0 = bez limitu: zawsze pełny horyzont, powtarzalne wyniki)
+            step_frames - ile klatek trwa jeden krok szukania
+            horizon - ile kroków do przodu szukać
+            beam_width - ile stanów zostaje po każdym kroku
+        """
+        self.game = None
+        self.budget = AUTOPILOT_BUDGET if budget is None else budget
+        self.step_frames = AUTOPILOT_STEP_FRAMES if step_frames is None else step_frames
+        self.horizon = AUTOPILOT_HORIZON if horizon is None else horizon
+        self.beam_width = AUTOPILOT_BEAM_WIDTH if beam_width is None else beam_width
+        self._keys = KeyState()
+
+        # Statystyki ostatniego szukania (do nakładek / testów)
+        self.last_depth = 0
+        self.last_nodes = 0
+
+    def attach(self, game):
+        """Podłącza bota do gry, którą ma sterować."""
+        self.game = game
+
+    def get_keys(self):
+        """Zwraca stan klawiszy w tej klatce (wynik szukania)."""
+        self._keys.mask = self.search() if self.game else 0
+        return self._keys
+
+    # =========================================================================
+    # PRZEWIDYWANIE ŚWIATA
+    # =========================================================================
+
+    def _player_box(self, left, right, top, bottom, margin):
+        """
+        Zamienia prostokąt obiektu na przedziały (x_lo, x_hi, y_lo, y_hi)
+        położenia PROSTOKĄTA gracza, przy których hitbox gracza (powiększony
+        o margin) nachodzi na obiekt.
+        """
+        offset_x, offset_y, width, height = self._hitbox
+        return (left - offset_x - width - margin,
+                right - offset_x + margin,
+                top - offset_y - height - margin,
+                bottom - offset_y + margin)
+
+    def _collect_world(self):
+        """
+        Zapisuje położenie zagrożeń i monet w prostych krotkach
+        (szukanie nie dotyka już obiektów gry).
+        """
+        game = self.game
+        speed = game.scroll_speed
+        geometry = game.lane_geometry
+
+        # Nietoperze: (lewo, prawo, góra hitboxa, dół hitboxa) w klatce 0
+        bats = []
+        bat_lanes = []  # (lina, góra, dół hitboxa) - do _clearance
+        store = game.obstacle_manager.store
+        for i in range(store.count):
+            lane = int(store.lane[i])
+            _, hitbox = geometry.obstacle[lane]
+            top = int(store.y[i]) + hitbox.y
+            bats.append((hitbox.x, hitbox.right, top, top + hitbox.height))
+            bat_lanes.append((lane, top, top + hitbox.height))
+
+        # Pociski: (x, y środka, przesunięcie X na klatkę)
+        projectiles = [(p.x, p.y, p.speed * p.direction, p.radius)
+                       for p in game.enemy_manager.projectiles]
+
+        # Rzędy, w których może przelecieć pocisk: (y, przesunięcie Y na klatkę).
+        # Przeciwnik może strzelić w każdej chwili, a z rzędu lecącego pocisku
+        # trzeba zejść, zanim doleci - inaczej gracz wpada w pułapkę
+        rows = []
+        for enemy in game.enemy_manager.enemies:
+            # Boczni (także ci, którzy dopiero wjeżdżają) zjeżdżają ze światem
+            scroll = 0 if enemy.from_bottom else speed
+            rows.append((enemy.y + ENEMY_HEIGHT // 2, scroll))
+        player_x = game.player.hitbox.centerx
+        for x, y, dx, _ in projectiles:
+            if (x - player_x) * dx < 0:  # Jeszcze leci w stronę gracza
+                rows.append((y, 0))
+
+        # Monety: (lewo, prawo, góra, dół) w klatce 0
+        coins = []
+        store = game.coin_store
+        for i in range(store.count):
+            if store.alive[i]:
+                rect = geometry.coin[store.lane[i]][0]
+                top = int(store.y[i])
+                coins.append((rect.x, rect.right, top, top + rect.height))
+
+        return speed, bats, projectiles, rows, coins, bat_lanes
+
+    def _time_cell(self, step):
+        """
+        Zagrożenia i monety w kroku step jako prostokąty w układzie
+        prostokąta gracza: gracz w (x, y) trafia w prostokąt, gdy
+        x_lo < x < x_hi i y_lo < y < y_hi. Prostokąt obejmuje cały ruch
+        zagrożenia w tym kroku. Liczone raz na krok szukania.
+        """
+        cached = self._time_cells.get(step)
+        if cached is not None:
+            return cached
+
+        last = step * self.step_frames
+        first = last - self.step_frames + 1
+        speed, bats, projectiles, _, coins, _ = self._world
+
+        # Z nieśmiertelnością (do końca jej czasu) nic nie jest groźne
+        threats = []
+        if last >= self._invincible_frames:
+            # Nietoperze jadą w dół: od first do last klatki
+            for left, right, top, bottom in bats:
+                threats.append(self._player_box(left, right, top + speed * first,
+                                                bottom + speed * last, AUTOPILOT_MARGIN))
+            for x, y, dx, radius in projectiles:
+                x_first = x + dx * first
+                x_last = x + dx * last
+                threats.append(self._player_box(min(x_first, x_last) - radius,
+                                                max(x_first, x_last) + radius,
+                                                y - radius, y + radius, AUTOPILOT_MARGIN))
+
+        coin_boxes = [self._player_box(left, right, top + speed * first, bottom + speed * last, 0)
+                      + (1 << i,)
+                      for i, (left, right, top, bottom) in enumerate(coins)]
+
+        cached = (threats, coin_boxes)
+        self._time_cells[step] = cached
+        return cached
+
+    def _lane_cell(self, step, rope):
+        """
+        Komórka (krok, lina) dla gracza, który w tym kroku wisi na linie:
+        przedziały Y zagrożeń i monet na tej linie oraz wolne miejsce nad
+        graczem (_clearance). Wszystkie stany na tej linie w tym kroku
+        korzystają z jednej komórki.
+        """
+        key = (step, rope)
+        cached = self._lane_cells.get(key)
+        if cached is not None:
+            return cached
+
+        x = self._lane_x[rope]
+        threats, coin_boxes = self._time_cell(step)
+        danger = [(y_lo, y_hi) for x_lo, x_hi, y_lo, y_hi in threats if x_lo < x < x_hi]
+        coins = [(y_lo, y_hi, bit) for x_lo, x_hi, y_lo, y_hi, bit in coin_boxes
+                 if x_lo < x < x_hi]
+        cached = (danger, coins, self._clearance(step, rope) * AUTOPILOT_CLEARANCE_WEIGHT)
+        self._lane_cells[key] = cached
+        return cached
+
+    def _check(self, step, start, end):
+        """
+        Sprawdza ruch gracza z punktu start do end (x, y) w kroku step.
+        Zwraca None przy kolizji, inaczej maskę zebranych monet.
+        W kroku gracz i zagrożenia poruszają się w jedną stronę, więc
+        wystarczy porównać prostokąty obejmujące całą drogę - wynik jest
+        ostrożny, a żadna klatka między krokami nie umknie.
+        """
+        (x0, y0), (x1, y1) = start, end
+        y_min, y_max = (y0, y1) if y0 <= y1 else (y1, y0)
+        coin_mask = 0
+
+        if x0 == x1 and x0 in self._rope_at:
+            # Na linie - gotowa komórka (krok, lina)
+            danger, coins, _ = self._lane_cell(step, self._rope_at[x0])
+            for y_lo, y_hi in danger:
+                if y_lo < y_max and y_min < y_hi:
+                    return None
+            for y_lo, y_hi, bit in coins:
+                if y_lo < y_max and y_min < y_hi:
+                    coin_mask |= bit
+            return coin_mask
+
+        # W trakcie skoku - wszystkie zagrożenia z kroku
+        x_min, x_max = (x0, x1) if x0 <= x1 else (x1, x0)
+        threats, coin_boxes = self._time_cell(step)
+        for x_lo, x_hi, y_lo, y_hi in threats:
+            if x_lo < x_max and x_min < x_hi and y_lo < y_max and y_min < y_hi:
+                return None
+        for x_lo, x_hi, y_lo, y_hi, bit in coin_boxes:
+            if x_lo < x_max and x_min < x_hi and y_lo < y_max and y_min < y_hi:
+                coin_mask |= bit
+        return coin_mask
+
+    def _score(self, step, rope, y):
+        """Ocena położenia gracza po kroku step (bez monet i skoków)."""
+        key = (step, rope, y)
+        cached = self._scores.get(key)
+        if cached is None:
+            cached = (self._lane_cell(step, rope)[2]
+                      - self._row_penalty(step, y)
+                      - abs(y - PLAYER_START_Y) * AUTOPILOT_CENTER_WEIGHT)
+            self._scores[key] = cached
+        return cached
+
+    def _clearance(self, step, rope):
+        """
+        Ile pikseli wolnej liny jest nad graczem (do najbliższego nietoperza
+        na linie rope, najwyżej AUTOPILOT_CLEARANCE). Nietoperz nad graczem
+        na tej samej linie to pewny skok w bok - im bliżej, tym gorzej.
+        Liczone od położenia gracza na początku szukania, żeby ucieczka
+        w dół (w ślepy zaułek) nie wyglądała na lepszą linę.
+        """
+        shift = self._world[0] * step * self.step_frames
+        top, bottom = self._root_span
+        clearance = AUTOPILOT_CLEARANCE
+        for lane, bat_top, bat_bottom in self._world[5]:
+            # Nietoperze całkiem pod graczem już go nie dogonią
+            if lane == rope and bat_top + shift < bottom:
+                gap = max(0, top - (bat_bottom + shift))
+                if gap < clearance:
+                    clearance = gap
+        return clearance
+
+    def _row_penalty(self, step, y):
+        """
+        Kara za stanie w rzędzie, w którym może przelecieć pocisk.
+        Rząd przeciwnika zjeżdżającego ze światem prędzej czy później
+        przejdzie przez każdego gracza pod nim - tam też jest kara.
+        """
+        frame = step * self.step_frames
+        _, offset_y, _, height = self._hitbox
+        top = y + offset_y - AUTOPILOT_MARGIN
+        bottom = y + offset_y + height + AUTOPILOT_MARGIN
+        penalty = 0
+        for row_y, scroll in self._world[3]:
+            row_y += scroll * frame
+            if row_y - 10 < bottom and (scroll or top < row_y + 10):
+                penalty += AUTOPILOT_ROW_PENALTY
+        return penalty
+
+    # =========================================================================
+    # RUCH GRACZA (tak jak Player.handle_input)
+    # =========================================================================
+
+    def _advance(self, state, dy, jump):
+        """
+        Przesuwa stan gracza o step_frames klatek z tym samym ruchem.
+        Stan: (x, y, lina, skok w toku, cel X, cooldown).
+        """
+        x, y, rope, moving, target_x, cooldown = state
+        frames = self.step_frames
+        if not moving and not jump:
+            # Sam ruch w pionie - bez pętli po klatkach
+            y = min(max(y + dy * frames, PLAYER_MIN_Y), PLAYER_MAX_Y)
+            return (x, y, rope, False, target_x, max(cooldown - frames, 0))
+
+        lane_x = self._lane_x
+        for _ in range(frames):
+            y += dy
+            if y < PLAYER_MIN_Y:
+                y = PLAYER_MIN_Y
+            elif y > PLAYER_MAX_Y:
+                y = PLAYER_MAX_Y
+
+            if cooldown > 0:
+                cooldown -= 1
+
+            if jump and not moving and cooldown == 0 and 0 <= rope + jump < NUM_ROPES:
+                rope += jump
+                cooldown = PLAYER_JUMP_COOLDOWN
+                moving = True
+                target_x = lane_x[rope]
+
+            if moving:
+                distance = abs(x - target_x)
+                if distance > PLAYER_JUMP_SNAP_DISTANCE:
+                    speed = min(PLAYER_JUMP_SPEED, distance)
+                    x += speed if x < target_x else -speed
+                else:
+                    x = target_x
+                    moving = False
+        return (x, y, rope, moving, target_x, cooldown)
+
+    # =========================================================================
+    # SZUKANIE
+    # =========================================================================
+
+    def search(self):
+        """Zwraca maskę klawiszy najlepszego ruchu w tej klatce."""
+        start = time.perf_counter()
+        deadline = (None if not self.budget
+                    else start + self.budget - AUTOPILOT_BUDGET_MARGIN)
+
+        game = self.game
+        player = game.player
+        self._world = self._collect_world()
+        self._time_cells = {}
+        self._lane_cells = {}
+        self._scores = {}
+        self._root_span = (player.hitbox.top, player.hitbox.bottom)
+        self._hitbox = player_hitbox()
+        self._lane_x = [rope.x + ROPE_WIDTH // 2 - PLAYER_WIDTH // 2 for rope in game.ropes]
+        self._rope_at = {x: rope for rope, x in enumerate(self._lane_x)}
+        self._invincible_frames = player.invincible_timer if player.invincible else 0
+
+        root = (player.rect.x, player.rect.y, player.current_rope,
+                player.is_moving, player.target_x, player.move_cooldown)
+
+        # Węzeł: (wartość, stan, pierwszy ruch, zebrane monety)
+        beam = [(0.0, root, 0, 0)]
+        best = beam
+        depth = 0
+        nodes = 0
+        band = AUTOPILOT_BAND
+
+        timed_out = False
+        for step in range(1, self.horizon + 1):
+            children = {}
+            for value, state, first_mask, collected in beam:
+                for mask, direction, jump in MOVES:
+                    # Skok, który się nie zacznie, to to samo co "nic"
+                    if jump and (state[3] or state[5] > self.step_frames
+                                 or not 0 <= state[2] + jump < NUM_ROPES):
+                        continue
+                    # Zegar przed każdym ruchem - także przed pierwszymi
+                    # komórkami kroku, które liczy _check
+                    if deadline is not None and time.perf_counter() > deadline:
+                        timed_out = True
+                        break
+                    nodes += 1
+                    child = self._advance(state, direction * PLAYER_SPEED, jump)
+                    coin_mask = self._check(step, (state[0], state[1]), (child[0], child[1]))
+                    if coin_mask is None:
+                        continue  # Kolizja
+
+                    child_value = value + self._score(step, child[2], child[1])
+                    new_coins = coin_mask & ~collected
+                    if new_coins:
+                        child_value += AUTOPILOT_COIN_VALUE * bin(new_coins).count('1')
+                    if jump:
+                        child_value -= AUTOPILOT_JUMP_COST
+
+                    # Podobne stany (ta sama lina i pas wysokości) - zostaje
+                    # lepszy; dzięki temu wiązka nie skupia się w jednym miejscu
+                    key = (child[2], child[3], child[1] // band)
+                    previous = children.get(key)
+                    if previous is None or previous[0] < child_value:
+                        children[key] = (child_value, child,
+                                         mask if step == 1 else first_mask,
+                                         collected | coin_mask)
+                if timed_out:
+                    break
+            if timed_out:
+                break  # Skończył się czas - zostaje najgłębszy pełny krok
+            if not children:
+                break  # Każdy ruch kończy się kolizją - zostaje najlepszy z poprzedniego kroku
+            beam = sorted(children.values(), key=lambda node: node[0],
+                          reverse=True)[:self.beam_width]
+            best = beam
+            depth = step
+
+        self.last_depth = depth
+        self.last_nodes = nodes
+        return best[0][2]
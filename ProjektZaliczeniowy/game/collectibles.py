@@ -2,9 +2,18 @@
 HUGO - Przedmioty do zbierania
 ==============================
 Monety i powerupy które gracz może zebrać.
+
+Pozycja, animacja i stan "zebrany" są w magazynie EntityStore
+(przesuwanie wszystkich monet naraz robi magazyn, nie każda moneta osobno).
+
+Obiekty są używane wielokrotnie (ObjectPool): konstruktor tworzy pusty
+obiekt, a spawn() ustawia go na nowo przy każdym pojawieniu się w grze.
+Prostokąt obiektu też jest jeden na całe życie - X i rozmiar kopiujemy
+przy spawn() z LaneGeometry, a co klatkę zmieniamy tylko Y.
 """
 import pygame
 from .config import *
+from .entity_store import KIND_COIN, KIND_POWERUP_INVINCIBLE, KIND_POWERUP_DOUBLE_POINTS
 
 
 class Coin:
@@ -12,63 +21,82 @@ class Coin:
     Moneta - zbierz ją żeby dostać punkty!
     """
 
-    def __init__(self, rope_index, y, sprite_manager):
+    def __init__(self):
+        """Tworzy pustą monetę (do puli) - w grze pojawia się przez spawn()."""
+        self.rope_index = 0
+        self.sprite_manager = None
+        self.rect = pygame.Rect(0, 0, COIN_SIZE, COIN_SIZE)
+        self.store = None
+        self.slot = -1
+
+    def spawn(self, rope_index, y, sprite_manager, store, lane_geometry):
         """
-        Tworzy monetę.
+        Umieszcza monetę w grze.
         
         Parametry:
             rope_index - na której linie (0, 1 lub 2)
             y - pozycja Y (zwykle ujemna - powyżej ekranu)
             sprite_manager - do pobierania grafiki
+            store - EntityStore z danymi monet
+            lane_geometry - LaneGeometry z położeniem obiektów na linach
         """
         self.rope_index = rope_index
-        self.y = y
         self.sprite_manager = sprite_manager
+        self.rect.update(lane_geometry.coin[rope_index][0])
         
-        self.collected = False  # Czy już zebrana
-        self.rotation = 0  # Kąt obrotu (animacja)
+        # Dopisz się do magazynu (ustawia self.store i self.slot)
+        store.add(self, rope_index, y, KIND_COIN)
 
-    def get_rect(self, ropes):
-        """Oblicza prostokąt monety (potrzebne do rysowania i kolizji)."""
-        # Środek liny minus połowa rozmiaru monety
-        x = ropes[self.rope_index].x + ROPE_WIDTH // 2 - COIN_SIZE // 2
-        return pygame.Rect(x, self.y, COIN_SIZE, COIN_SIZE)
+    @property
+    def y(self):
+        """Pozycja Y (z magazynu)."""
+        return self.store.y[self.slot]
 
-    def update(self, scroll_speed):
-        """Aktualizuje monetę (ruch w dół + obracanie)."""
-        # Przesuń w dół (scrollowanie)
-        self.y += scroll_speed
-        
-        # Obracaj monetę (efekt wizualny)
-        self.rotation += 3
-        if self.rotation >= 360:
-            self.rotation = 0
+    @property
+    def collected(self):
+        """Czy moneta jest już zebrana."""
+        return not self.store.alive[self.slot]
+
+    @collected.setter
+    def collected(self, value):
+        self.store.alive[self.slot] = not value
+
+    @property
+    def rotation(self):
+        """Kąt obrotu (animacja) - wynika z licznika animacji."""
+        return (int(self.store.anim[self.slot]) * COIN_ROTATION_STEP) % 360
 
-    def draw(self, screen, ropes):
-        """Rysuje monetę na ekranie."""
+    def get_rect(self):
+        """Prostokąt monety (do rysowania i kolizji) - ustawia w nim aktualne Y."""
+        self.rect.y = int(self.y)
+        return self.rect
+
+    def draw(self, screen, offset_y=0):
+        """
+        Rysuje monetę na ekranie. Zwraca zamalowany prostokąt (albo None).
+        
+        Parametry:
+            offset_y - przesunięcie interpolacji (między krokami symulacji)
+        """
         if self.collected:
-            return  # Nie rysuj zebranych monet
+            return None  # Nie rysuj zebranych monet
         
-        rect = self.get_rect(ropes)
-        coin_sprite = self.sprite_manager.get_sprite('coin')
+        rect = self.get_rect()
+        rect.y += offset_y
         
-        # Obróć sprite
-        rotated = pygame.transform.rotate(coin_sprite, self.rotation)
+        # Gotowa obrócona klatka (obracanie robi SpriteManager przy starcie)
+        rotated, (dx, dy) = self.sprite_manager.get_coin_frame(self.rotation)
         
         # Wyśrodkuj obrócony obrazek
-        new_rect = rotated.get_rect(center=rect.center)
-        screen.blit(rotated, new_rect)
-
-    def is_off_screen(self):
-        """Sprawdza czy moneta wyszła poza ekran (do usunięcia)."""
-        return self.y > SCREEN_HEIGHT
+        center_x, center_y = rect.center
+        return screen.blit(rotated, (center_x + dx, center_y + dy))
 
-    def check_collision(self, player_hitbox, ropes):
+    def check_collision(self, player_hitbox):
         """Sprawdza czy gracz zebrał monetę."""
         if self.collected:
             return False
         
-        my_rect = self.get_rect(ropes)
+        my_rect = self.get_rect()
         if my_rect.colliderect(player_hitbox):
             self.collected = True
             return True
@@ -85,45 +113,72 @@ class PowerUp:
     - 'double_points' - podwójne punkty (5 sekund)
     """
 
-    def __init__(self, rope_index, y, powerup_type, sprite_manager):
+    def __init__(self):
+        """Tworzy pusty powerup (do puli) - w grze pojawia się przez spawn()."""
+        self.rope_index = 0
+        self.type = None
+        self.sprite_manager = None
+        self.float_offset = 0  # Do animacji "unoszenia się"
+        self.rect = pygame.Rect(0, 0, POWERUP_SIZE, POWERUP_SIZE)
+        self.store = None
+        self.slot = -1
+
+    def spawn(self, rope_index, y, powerup_type, sprite_manager, store, lane_geometry):
         """
-        Tworzy powerup.
+        Umieszcza powerup w grze.
         
         Parametry:
             rope_index - na której linie
             y - pozycja Y
             powerup_type - typ powerupa ('invincible' lub 'double_points')
             sprite_manager - do pobierania grafiki
+            store - EntityStore z danymi powerupów
+            lane_geometry - LaneGeometry z położeniem obiektów na linach
         """
         self.rope_index = rope_index
-        self.y = y
         self.type = powerup_type
         self.sprite_manager = sprite_manager
+        self.rect.update(lane_geometry.powerup[rope_index][0])
         
-        self.collected = False
-        self.float_offset = 0  # Do animacji "unoszenia się"
+        if powerup_type == 'invincible':
+            kind = KIND_POWERUP_INVINCIBLE
+        else:
+            kind = KIND_POWERUP_DOUBLE_POINTS
+        store.add(self, rope_index, y, kind)
 
-    def get_rect(self, ropes):
-        """Oblicza prostokąt powerupa."""
-        x = ropes[self.rope_index].x + ROPE_WIDTH // 2 - POWERUP_SIZE // 2
-        return pygame.Rect(x, self.y, POWERUP_SIZE, POWERUP_SIZE)
+    @property
+    def y(self):
+        """Pozycja Y (z magazynu)."""
+        return self.store.y[self.slot]
 
-    def update(self, scroll_speed):
-        """Aktualizuje powerup (ruch w dół + unoszenie)."""
-        self.y += scroll_speed
-        
+    @property
+    def collected(self):
+        """Czy powerup jest już zebrany."""
+        return not self.store.alive[self.slot]
+
+    @collected.setter
+    def collected(self, value):
+        self.store.alive[self.slot] = not value
 
+    def get_rect(self):
+        """Prostokąt powerupa - ustawia w nim aktualne Y."""
+        self.rect.y = int(self.y)
+        return self.rect
 
-    def draw(self, screen, ropes):
-        """Rysuje powerup na ekranie."""
+    def draw(self, screen, offset_y=0):
+        """
+        Rysuje powerup na ekranie. Zwraca zamalowany prostokąt (albo None).
+        
+        Parametry:
+            offset_y - przesunięcie interpolacji (między krokami symulacji)
+        """
         if self.collected:
-            return
+            return None
         
-        rect = self.get_rect(ropes)
+        rect = self.get_rect()
         
         # Dodaj efekt unoszenia
-        draw_y = rect.y - self.float_offset
-        draw_rect = pygame.Rect(rect.x, draw_y, rect.width, rect.height)
+        rect.y += offset_y - self.float_offset
         
         # Wybierz odpowiedni sprite
         if self.type == 'invincible':
@@ -131,18 +186,14 @@ class PowerUp:
         else:
             sprite = self.sprite_manager.get_sprite('powerup_star')
         
-        screen.blit(sprite, draw_rect)
-
-    def is_off_screen(self):
-        """Sprawdza czy powerup wyszedł poza ekran."""
-        return self.y > SCREEN_HEIGHT
+        return screen.blit(sprite, rect)
 
-    def check_collision(self, player_hitbox, ropes):
+    def check_collision(self, player_hitbox):
         """Sprawdza czy gracz zebrał powerup."""
         if self.collected:
             return False
         
-        my_rect = self.get_rect(ropes)
+        my_rect = self.get_rect()
         if my_rect.colliderect(player_hitbox):
             self.collected = True
             return True
@@ -11,6 +11,32 @@ SCREEN_WIDTH = 1000   # Szerokość okna
 SCREEN_HEIGHT = 1000  # Wysokość okna
 FPS = 60              # Klatki na sekundę (płynność animacji)
 
+# =============================================================================
+# PĘTLA GRY (stały krok symulacji)
+# =============================================================================
+# Logika gry zawsze liczy się w krokach o stałej długości (tak jak przy 60 FPS).
+# Rysowanie działa niezależnie - wolniejszy komputer rysuje rzadziej,
+# ale gra NIE zwalnia.
+SIMULATION_STEP = 1.0 / FPS   # Długość jednego kroku symulacji (sekundy)
+MAX_FRAME_TIME = 0.25         # Max czasu doliczanego na klatkę (po "zawieszce")
+MAX_RENDER_FPS = 240          # Limit klatek rysowania (0 = bez limitu)
+
+# =============================================================================
+# ODŚWIEŻANIE EKRANU (dirty rects)
+# =============================================================================
+# Zamiast pełnego flip odświeżamy tylko zmienione fragmenty ekranu
+USE_DIRTY_RECTS = False             # Włączane też parametrem --dirty-rects
+DIRTY_RECT_FULL_UPDATE_RATIO = 0.5  # Zmiany > 50% ekranu = pełny flip
+DIRTY_RECT_MAX_RECTS = 64           # Więcej prostokątów = pełny flip
+
+# =============================================================================
+# PROFILER KLATKI
+# =============================================================================
+# Czasy faz klatki (parametr --profile, nakładka pod F3)
+PROFILER_HISTORY = 600              # Ile ostatnich próbek fazy (10 s przy 60 FPS)
+PROFILER_HISTOGRAM_BUCKETS = 24     # Przedziały histogramu: do 2^23 us (~8 s)
+PROFILER_OVERLAY_REFRESH = 30       # Co ile klatek odświeżać nakładkę
+
 # =============================================================================
 # KOLORY
 # =============================================================================
@@ -44,15 +70,22 @@ PLAYER_ANIMATION_SPEED = 8    # Co ile klatek zmienia się obrazek
 
 PLAYER_JUMP_FRAMES = 4        # Ile klatek ma animacja skoku
 PLAYER_JUMP_FRAME_WIDTH = 100
+PLAYER_JUMP_DURATION = 20     # Ile klatek gry trwa animacja skoku
 
 # Hitbox - obszar kolizji gracza (mniejszy niż obrazek)
 PLAYER_HITBOX_SCALE = 0.7     # 70% rozmiaru obrazka
 
+# Skok na inną linę
+PLAYER_JUMP_COOLDOWN = 30        # Ile klatek czekać przed następnym skokiem
+PLAYER_JUMP_SPEED = 7            # Max pikseli na klatkę w trakcie skoku
+PLAYER_JUMP_SNAP_DISTANCE = 2    # Z tej odległości gracz "dociąga" do liny
+
 # =============================================================================
 # LINY
 # =============================================================================
 NUM_ROPES = 3         # Ile lin jest w grze (lewa, środkowa, prawa)
 ROPE_WIDTH = 30       # Szerokość liny
+ROPE_TILE_HEIGHT = 100  # Wysokość jednego kafelka tekstury liny
 
 # =============================================================================
 # SCROLLING (przesuwanie świata)
@@ -74,6 +107,13 @@ DIFFICULTY_SPEED_INCREASE = 0.25
 # Maksymalna prędkość (żeby nie było za szybko)
 MAX_SCROLL_SPEED = 5
 
+# =============================================================================
+# GENERATOR POZIOMU (level.py)
+# =============================================================================
+# Świat układany z wyprzedzeniem (kawałkami)
+LEVEL_CHUNK_DISTANCE = 1000         # Ile dystansu obejmuje jeden kawałek (zmiana = inne poziomy)
+LEVEL_LOOKAHEAD = 3000              # Na ile dystansu do przodu świat ma być gotowy (3 ekrany)
+
 # =============================================================================
 # PRZESZKODY (NIETOPERZE)
 # =============================================================================
@@ -83,6 +123,7 @@ OBSTACLE_HITBOX_SCALE = 0.7   # Hitbox = 70% obrazka
 # Animacja nietoperzy
 BAT_ANIMATION_FRAMES = 3      # 3 klatki animacji
 BAT_FRAME_SIZE = 140
+BAT_ANIMATION_SPEED = 10      # Co ile klatek zmienia się obrazek
 
 # Jak często pojawiają się przeszkody
 MIN_OBSTACLE_DISTANCE = 400   # Minimalny odstęp między przeszkodami
@@ -104,6 +145,11 @@ OBSTACLE_PATTERNS = [
     ([1, 2], [0], "prawe"),
 ]
 
+# Losowanie wzorców (patterns.py) - zmiana = inne poziomy
+OBSTACLE_PATTERN_WEIGHTS = {}     # Nazwa -> waga (brak = 1.0), np. {"boki": 0.5}
+OBSTACLE_PATTERN_TIERS = {}       # Nazwa -> od którego poziomu trudności (brak = 0)
+OBSTACLE_PATTERN_MEMORY = 1       # Ilu ostatnich wzorców nie powtarzać
+
 # =============================================================================
 # PRZECIWNICY (strzelający)
 # =============================================================================
@@ -114,6 +160,11 @@ ENEMY_SHOOT_CHANCE = 0.03     # Szansa na strzał co klatkę (3%)
 ENEMY_MAX_ON_SCREEN = 2       # Max przeciwników na raz
 ENEMY_SPAWN_DISTANCE = 500    # Co ile dystansu może się pojawić
 ENEMY_FROM_BOTTOM_CHANCE = 0.3  # 30% szans że pojawi się od dołu
+ENEMY_ENTER_SPEED = 5         # Prędkość wjazdu na ekran (piksele na klatkę)
+
+# Pociski
+PROJECTILE_SPEED = 7          # Piksele na klatkę
+PROJECTILE_RADIUS = 10
 
 # Animacja
 ENEMY_ANIMATION_FRAMES = 2
@@ -125,12 +176,17 @@ ENEMY_ANIMATION_SPEED = 30
 COIN_SIZE = 50        # Rozmiar monety
 POWERUP_SIZE = 50     # Rozmiar powerupa
 
+COIN_ROTATION_STEP = 3        # O ile stopni obraca się moneta co klatkę
+
 COIN_SPAWN_DISTANCE = 150     # Co ile dystansu pojawia się moneta
 MAX_COINS_ON_SCREEN = 5       # Max monet na ekranie
 
 POWERUP_SPAWN_DISTANCE = 600  # Co ile dystansu może pojawić się powerup
 POWERUP_SPAWN_CHANCE = 0.4    # 40% szansy na pojawienie się
 
+INVINCIBILITY_FRAMES = 180    # Nieśmiertelność: 3 sekundy * 60 FPS
+DOUBLE_POINTS_FRAMES = 300    # Podwójne punkty: 5 sekund
+
 # =============================================================================
 # PUNKTACJA
 # =============================================================================
@@ -145,6 +201,23 @@ PIXELS_PER_METER = 100
 # GRAFIKI
 # =============================================================================
 SPRITES_DIR = "sprites/"
+ASSET_BUNDLE_PATH = "sprites.bundle"  # Paczka gotowych grafik (python main.py --build-assets)
+
+# Ładowanie w tle: grafiki potrzebne menu ładujemy od razu, resztę w wątku
+MENU_SPRITES = ('background',)
+ASSET_FINALIZE_BUDGET = 0.004  # Ile sekund na klatkę kończyć grafiki z wątku
+
+# Klipy animacji (animation.py): nazwa grafiki -> (ile klatek gry trwa
+# jedna klatka animacji, czy animacja się powtarza)
+ANIMATION_CLIPS = {
+    'player_climb': (PLAYER_ANIMATION_SPEED, True),
+    'player_jump_left': (PLAYER_JUMP_DURATION // PLAYER_JUMP_FRAMES, False),
+    'player_jump_right': (PLAYER_JUMP_DURATION // PLAYER_JUMP_FRAMES, False),
+    'bat_1': (BAT_ANIMATION_SPEED, True),
+    'bat_2': (BAT_ANIMATION_SPEED, True),
+    'enemy_left': (ENEMY_ANIMATION_SPEED, True),
+    'enemy_right': (ENEMY_ANIMATION_SPEED, True),
+}
 BACKGROUND_HEIGHT = 1000
 
 SPRITE_FILES = {
@@ -160,3 +233,43 @@ SPRITE_FILES = {
     'powerup_star': 'powerup_star.png',
     'enemy': 'enemy.png',
 }
+
+# =============================================================================
+# ŚRODOWISKO DO UCZENIA AGENTÓW (env.py)
+# =============================================================================
+ENV_MAX_FRAMES = 36000              # Po ilu klatkach przerwać epizod (10 minut)
+ENV_DEATH_PENALTY = 100.0           # Kara (ujemna nagroda) za przegraną
+ENV_OBSTACLES_PER_LANE = 2          # Ile najbliższych nietoperzy na linę w obserwacji
+ENV_PROJECTILES = 3                 # Ile najbliższych pocisków w obserwacji
+
+# =============================================================================
+# JĄDRO NUMPY (kernel.py)
+# =============================================================================
+# Ile słów 32-bitowych losowości trzymać na grę
+KERNEL_RANDOM_BUFFER = 512
+
+# =============================================================================
+# COFANIE ROZGRYWKI (snapshot.py)
+# =============================================================================
+# Parametr --rewind, klawisz Backspace
+REWIND_BUFFER_FRAMES = 600          # Ile ostatnich klatek pamiętać (10 s)
+REWIND_KEYFRAME_INTERVAL = 60       # Co ile klatek pełny zapis (reszta - różnice)
+REWIND_STEP_FRAMES = 60             # O ile klatek cofa jedno naciśnięcie
+
+# =============================================================================
+# AUTOPILOT (autopilot.py)
+# =============================================================================
+# Bot grający sam (parametr --autopilot)
+AUTOPILOT_BUDGET = 0.001            # Ile sekund na klatkę może trwać szukanie (1 ms)
+AUTOPILOT_BUDGET_MARGIN = 0.0002    # Zapas przed końcem limitu na ostatni ruch (0.2 ms)
+AUTOPILOT_STEP_FRAMES = 4           # Ile klatek trwa jeden krok szukania
+AUTOPILOT_HORIZON = 16              # Ile kroków do przodu szukać (64 klatki)
+AUTOPILOT_BEAM_WIDTH = 6            # Ile najlepszych stanów zostaje po każdym kroku
+AUTOPILOT_BAND = 16                 # Wysokość pasa przy łączeniu podobnych stanów (piksele)
+AUTOPILOT_MARGIN = 4                # Zapas wokół hitboxa gracza (piksele)
+AUTOPILOT_COIN_VALUE = 50.0         # Ile warta jest zebrana moneta w ocenie stanu
+AUTOPILOT_ROW_PENALTY = 5.0         # Kara za krok w rzędzie strzału przeciwnika
+AUTOPILOT_CENTER_WEIGHT = 0.01      # Kara za krok (na piksel) z dala od PLAYER_START_Y
+AUTOPILOT_JUMP_COST = 1.0           # Kara za skok (bot nie skacze bez potrzeby)
+AUTOPILOT_CLEARANCE = 400           # Do ilu pikseli liczy się wolna lina nad graczem
+AUTOPILOT_CLEARANCE_WEIGHT = 0.05   # Nagroda za krok (na piksel) wolnej liny nad graczem
@@ -0,0 +1,194 @@
+"""
+HUGO - Źródła sterowania
+========================
+Gra nie czyta klawiatury bezpośrednio - pyta "źródło sterowania" o stan
+klawiszy w danej klatce. Dzięki temu ta sama logika działa z:
+- prawdziwą klawiaturą (KeyboardInput)
+- zaprogramowanym wejściem, np. w trybie bez okna (ScriptedInput)
+- losowym graczem, np. do testów balansu (RandomInput)
+- akcjami agenta podawanymi z zewnątrz, np. w środowisku RL (ActionInput)
+
+Stan klawiszy zapisujemy jako maskę bitową (UP/DOWN/LEFT/RIGHT).
+"""
+import random
+import pygame
+
+
+# =============================================================================
+# MASKA BITOWA KLAWISZY
+# =============================================================================
+KEY_UP = 1
+KEY_DOWN = 2
+KEY_LEFT = 4
+KEY_RIGHT = 8
+
+# Litery używane w plikach ze scenariuszem sterowania
+KEY_LETTERS = {
+    'U': KEY_UP,
+    'D': KEY_DOWN,
+    'L': KEY_LEFT,
+    'R': KEY_RIGHT,
+}
+
+
+def mask_from_letters(text):
+    """
+    Zamienia napis typu "UL" na maskę bitową.
+    Znak '-' (albo pusty napis) oznacza brak wciśniętych klawiszy.
+    """
+    mask = 0
+    for letter in text.upper():
+        if letter == '-':
+            continue
+        if letter not in KEY_LETTERS:
+            raise ValueError(f"Nieznany klawisz w scenariuszu: {letter!r}")
+        mask |= KEY_LETTERS[letter]
+    return mask
+
+
+def mask_from_keys(keys):
+    """Zamienia stan klawiatury pygame (get_pressed) na maskę bitową."""
+    mask = 0
+    if keys[pygame.K_UP] or keys[pygame.K_w]:
+        mask |= KEY_UP
+    if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+        mask |= KEY_DOWN
+    if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        mask |= KEY_LEFT
+    if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        mask |= KEY_RIGHT
+    return mask
+
+
+class KeyState:
+    """
+    Udaje wynik pygame.key.get_pressed() na podstawie maski bitowej.
+    Player.handle_input może więc używać go tak samo jak prawdziwej klawiatury.
+    """
+
+    # Które klawisze pygame odpowiadają którym bitom
+    _KEY_BITS = {
+        pygame.K_UP: KEY_UP,
+        pygame.K_w: KEY_UP,
+        pygame.K_DOWN: KEY_DOWN,
+        pygame.K_s: KEY_DOWN,
+        pygame.K_LEFT: KEY_LEFT,
+        pygame.K_a: KEY_LEFT,
+        pygame.K_RIGHT: KEY_RIGHT,
+        pygame.K_d: KEY_RIGHT,
+    }
+
+    def __init__(self, mask=0):
+        self.mask = mask
+
+    def __getitem__(self, key):
+        return bool(self.mask & self._KEY_BITS.get(key, 0))
+
+
+class KeyboardInput:
+    """Sterowanie z prawdziwej klawiatury (wymaga okna)."""
+
+    def get_keys(self):
+        """Zwraca stan klawiszy w tej klatce."""
+        return pygame.key.get_pressed()
+
+
+class ScriptedInput:
+    """
+    Zaprogramowane sterowanie - maska klawiszy dla kolejnych klatek.
+
+    Scenariusz to lista zdarzeń (klatka, maska): od podanej klatki
+    trzymamy wciśnięte klawisze z maski, aż do następnego zdarzenia.
+    """
+
+    def __init__(self, events=None):
+        """
+        Parametry:
+            events - lista par (numer_klatki, maska), może być pusta
+        """
+        self.events = sorted(events or [])
+        self.frame = 0
+        self._next_event = 0
+        self._keys = KeyState()
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Wczytuje scenariusz z pliku tekstowego.
+
+        Każda linia: "<klatka> <klawisze>", np. "120 L" albo "300 UR".
+        Linie puste i zaczynające się od '#' są pomijane.
+        """
+        events = []
+        with open(path, encoding='utf-8') as file:
+            for line in file:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                parts = line.split()
+                frame = int(parts[0])
+                mask = mask_from_letters(parts[1] if len(parts) > 1 else '')
+                events.append((frame, mask))
+        return cls(events)
+
+    def get_keys(self):
+        """Zwraca stan klawiszy w tej klatce i przechodzi do następnej."""
+        while (self._next_event < len(self.events)
+               and self.events[self._next_event][0] <= self.frame):
+            self._keys.mask = self.events[self._next_event][1]
+            self._next_event += 1
+
+        self.frame += 1
+        return self._keys
+
+
+class RandomInput:
+    """
+    Losowy gracz (do testów balansu): losuje maskę klawiszy i trzyma ją
+    przez losową liczbę klatek, potem losuje następną.
+
+    Ma WŁASNY generator - nie zmienia losowości samej gry, więc to samo
+    ziarno gry daje ten sam świat niezależnie od gracza.
+    """
+
+    # Ruchy, które ma sens trzymać (nic, pojedyncze kierunki, skok w górę na bok)
+    MASKS = (0, KEY_UP, KEY_DOWN, KEY_LEFT, KEY_RIGHT,
+             KEY_UP | KEY_LEFT, KEY_UP | KEY_RIGHT)
+
+    def __init__(self, seed=None, min_hold=5, max_hold=40):
+        """
+        Parametry:
+            seed - ziarno gracza (None = losowe)
+            min_hold, max_hold - ile klatek trzymać jedną maskę
+        """
+        self.rng = random.Random(seed)
+        self.min_hold = min_hold
+        self.max_hold = max_hold
+        self._hold = 0
+        self._keys = KeyState()
+
+    def get_keys(self):
+        """Zwraca stan klawiszy w tej klatce."""
+        if self._hold == 0:
+            self._keys.mask = self.rng.choice(self.MASKS)
+            self._hold = self.rng.randint(self.min_hold, self.max_hold)
+        self._hold -= 1
+        return self._keys
+
+
+class ActionInput:
+    """
+    Sterowanie ustawiane z zewnątrz (np. akcja agenta w środowisku RL):
+    maska klawiszy obowiązuje, dopóki ktoś nie ustawi nowej.
+    """
+
+    def __init__(self):
+        self._keys = KeyState()
+
+    def set_mask(self, mask):
+        """Ustawia maskę klawiszy dla kolejnych klatek."""
+        self._keys.mask = mask
+
+    def get_keys(self):
+        """Zwraca stan klawiszy w tej klatce."""
+        return self._keys
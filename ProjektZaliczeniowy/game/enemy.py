@@ -2,10 +2,13 @@
 HUGO - Przeciwnicy
 ==================
 Przeciwnicy pojawiają się z boku lub od dołu i strzelają pociskami.
+
+Pociski są używane wielokrotnie (ObjectPool) - strzał bierze pocisk
+z puli zamiast tworzyć nowy obiekt i nowy pygame.Rect.
 """
 import pygame
-import random
 from .config import *
+from .pool import ObjectPool
 
 
 class Enemy:
@@ -14,17 +17,19 @@ class Enemy:
     Może pojawić się z lewej, prawej lub od dołu ekranu.
     """
 
-    def __init__(self, y, side, sprite_manager, from_bottom=False):
+    def __init__(self, y, side, sprite_manager, rng, from_bottom=False):
         """
         Tworzy przeciwnika.
         
         Parametry:
             y - pozycja Y (dla bocznych)
-            side - 'left' lub 'right' (skąd wjeżdża)
+            side - 'left' lub 'right' (skąd wjeżdża; od dołu - po której stronie)
             sprite_manager - do pobierania grafiki
+            rng - generator losowości rozgrywki (strzały)
             from_bottom - czy pojawia się od dołu
         """
         self.sprite_manager = sprite_manager
+        self.rng = rng
         self.from_bottom = from_bottom
         
         self.has_entered = False  # Czy już wjechał na ekran
@@ -40,8 +45,8 @@ class Enemy:
             self.y = SCREEN_HEIGHT + ENEMY_HEIGHT
             self.target_y = SCREEN_HEIGHT - ENEMY_HEIGHT - 100
             
-            # Losowo po lewej lub prawej stronie
-            if random.random() < 0.5:
+            # Po lewej lub prawej stronie (wylosowane w generatorze poziomu)
+            if side == 'left':
                 self.x = 50
                 self.direction = 'left'  # Patrzy w prawo (strzela w prawo)
             else:
@@ -62,28 +67,40 @@ class Enemy:
         
         # Prostokąt do rysowania
         self.rect = pygame.Rect(self.x, self.y, ENEMY_WIDTH, ENEMY_HEIGHT)
+        
+        # Klip animacji w stronę, w którą patrzy (bez grafik - brak klipu)
+        self.clip = None
+        if sprite_manager:
+            self.clip = sprite_manager.get_clip('enemy_' + self.direction)
+        
+        # Pozycja z poprzedniego kroku (do interpolacji rysowania)
+        self.prev_x = self.x
+        self.prev_y = self.y
 
     def update(self, scroll_speed):
         """Aktualizuje przeciwnika."""
+        self.prev_x = self.x
+        self.prev_y = self.y
+        
         # -----------------------------------------
         # FAZA WJAZDU
         # -----------------------------------------
         if not self.has_entered:
             if self.from_bottom:
                 # Jedź do góry
-                self.y -= 5
+                self.y -= ENEMY_ENTER_SPEED
                 if self.y <= self.target_y:
                     self.y = self.target_y
                     self.has_entered = True
             else:
                 # Jedź w bok
                 if self.direction == 'left':
-                    self.x += 5
+                    self.x += ENEMY_ENTER_SPEED
                     if self.x >= self.target_x:
                         self.x = self.target_x
                         self.has_entered = True
                 else:
-                    self.x -= 5
+                    self.x -= ENEMY_ENTER_SPEED
                     if self.x <= self.target_x:
                         self.x = self.target_x
                         self.has_entered = True
@@ -117,7 +134,7 @@ class Enemy:
         # Losowa szansa na strzał (większa im dłużej jest na ekranie)
         chance = ENEMY_SHOOT_CHANCE + min(self.time_on_screen / 500, 0.02)
         
-        if random.random() < chance:
+        if self.rng.random() < chance:
             self.shoot_cooldown = ENEMY_SHOOT_COOLDOWN
             return True
         
@@ -138,10 +155,17 @@ class Enemy:
         
         return x, y, direction
 
-    def draw(self, screen):
-        """Rysuje przeciwnika."""
-        sprite = self.sprite_manager.get_enemy_frame(self.animation_counter, self.direction)
-        screen.blit(sprite, self.rect)
+    def draw(self, screen, alpha=1.0):
+        """
+        Rysuje przeciwnika. Zwraca zamalowany prostokąt.
+        
+        Parametry:
+            alpha - postęp między krokami symulacji (1.0 = ostatni krok)
+        """
+        sprite = self.clip.frame(self.animation_counter)
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        return screen.blit(sprite, (x, y))
 
     def is_off_screen(self):
         """Sprawdza czy wyleciał poza ekran."""
@@ -154,46 +178,58 @@ class Projectile:
     Leci poziomo (w lewo lub prawo).
     """
 
-    def __init__(self, x, y, direction):
+    def __init__(self):
+        """Tworzy pusty pocisk (do puli) - w grze pojawia się przez spawn()."""
+        self.speed = PROJECTILE_SPEED
+        self.radius = PROJECTILE_RADIUS
+        self.index = -1  # Miejsce na liście aktywnych pocisków
+        
+        # Prostokąt do kolizji (ten sam przez całe życie obiektu)
+        self.rect = pygame.Rect(0, 0, self.radius * 2, self.radius * 2)
+        self.spawn(0, 0, 1)
+
+    def spawn(self, x, y, direction):
         """
-        Tworzy pocisk.
+        Wystrzeliwuje pocisk.
         
         Parametry:
             x, y - pozycja startowa
             direction - 1 (w prawo) lub -1 (w lewo)
         """
         self.x = x
+        self.prev_x = x  # Pozycja z poprzedniego kroku (do interpolacji)
         self.y = y
         self.direction = direction
-        self.speed = 7
-        self.radius = 10
-        
-        # Prostokąt do kolizji
-        self.rect = pygame.Rect(
-            x - self.radius,
-            y - self.radius,
-            self.radius * 2,
-            self.radius * 2
-        )
+        self.rect.x = x - self.radius
+        self.rect.y = y - self.radius
 
     def update(self):
         """Przesuwa pocisk."""
+        self.prev_x = self.x
         self.x += self.speed * self.direction
         self.rect.x = self.x - self.radius
         self.rect.y = self.y - self.radius
 
-    def draw(self, screen):
-        """Rysuje pocisk (pomarańczowa kula)."""
-        center = (int(self.x), int(self.y))
+    def draw(self, screen, alpha=1.0):
+        """
+        Rysuje pocisk (pomarańczowa kula). Zwraca zamalowany prostokąt.
+        
+        Parametry:
+            alpha - postęp między krokami symulacji (do interpolacji)
+        """
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        center = (int(x), int(self.y))
         
         # Główna kula
-        pygame.draw.circle(screen, ORANGE, center, self.radius)
+        rect = pygame.draw.circle(screen, ORANGE, center, self.radius)
         
         # Jaśniejszy środek
         pygame.draw.circle(screen, (255, 200, 100), center, self.radius - 3)
         
         # Obramowanie
         pygame.draw.circle(screen, RED, center, self.radius, 2)
+        
+        return rect
 
     def is_off_screen(self):
         """Sprawdza czy wyleciał poza ekran."""
@@ -209,33 +245,28 @@ class EnemyManager:
     Zarządza wszystkimi przeciwnikami i pociskami.
     """
 
-    def __init__(self):
+    def __init__(self, rng):
+        """
+        Parametry:
+            rng - generator losowości rozgrywki (random.Random)
+        """
+        self.rng = rng
         self.enemies = []
         self.projectiles = []
-        self.last_spawn_distance = 0
+        self.projectile_pool = ObjectPool(Projectile, prefill=8)
 
-    def try_spawn(self, current_distance, sprite_manager):
-        """Próbuje utworzyć nowego przeciwnika."""
-        # Sprawdź czy czas na nowego
-        if current_distance - self.last_spawn_distance < ENEMY_SPAWN_DISTANCE:
-            return
-        
-        # Sprawdź limit na ekranie
+    def spawn(self, y, side, from_bottom, sprite_manager):
+        """
+        Wstawia przeciwnika (zdarzenie z generatora poziomu).
+        Zwraca False, gdy na ekranie jest już ENEMY_MAX_ON_SCREEN
+        przeciwników (nikt nie został dodany).
+        """
         if len(self.enemies) >= ENEMY_MAX_ON_SCREEN:
-            return
-        
-        # Losuj typ (od dołu lub z boku)
-        from_bottom = random.random() < ENEMY_FROM_BOTTOM_CHANCE
-        
-        if from_bottom:
-            enemy = Enemy(0, None, sprite_manager, from_bottom=True)
-        else:
-            side = random.choice(['left', 'right'])
-            y = random.randint(100, 400)
-            enemy = Enemy(y, side, sprite_manager, from_bottom=False)
+            return False
         
+        enemy = Enemy(y, side, sprite_manager, self.rng, from_bottom=from_bottom)
         self.enemies.append(enemy)
-        self.last_spawn_distance = current_distance
+        return True
 
     def update(self, scroll_speed):
         """Aktualizuje przeciwników i pociski."""
@@ -246,23 +277,50 @@ class EnemyManager:
             # Sprawdź czy strzelił
             if enemy.can_shoot():
                 x, y, direction = enemy.get_projectile_spawn_point()
-                self.projectiles.append(Projectile(x, y, direction))
+                projectile = self.projectile_pool.acquire()
+                projectile.spawn(x, y, direction)
+                projectile.index = len(self.projectiles)
+                self.projectiles.append(projectile)
         
-        # Aktualizuj pociski
-        for projectile in self.projectiles:
+        # Aktualizuj pociski i od razu usuń te poza ekranem
+        # (od końca - przy usuwaniu na miejsce pocisku trafia ostatni,
+        # który już jest zaktualizowany)
+        for i in range(len(self.projectiles) - 1, -1, -1):
+            projectile = self.projectiles[i]
             projectile.update()
+            if projectile.is_off_screen():
+                self._release_projectile(projectile)
         
-        # Usuń obiekty poza ekranem
-        self.enemies = [e for e in self.enemies if not e.is_off_screen()]
-        self.projectiles = [p for p in self.projectiles if not p.is_off_screen()]
+        # Usuń przeciwników poza ekranem (bez tworzenia nowej listy)
+        for i in range(len(self.enemies) - 1, -1, -1):
+            if self.enemies[i].is_off_screen():
+                del self.enemies[i]
 
-    def draw(self, screen):
-        """Rysuje przeciwników i pociski."""
-        for enemy in self.enemies:
-            enemy.draw(screen)
+    def _release_projectile(self, projectile):
+        """
+        Usuwa pocisk z listy aktywnych ("swap-remove": na jego miejsce
+        trafia ostatni pocisk) i oddaje go do puli.
+        """
+        last = self.projectiles.pop()
+        if last is not projectile:
+            self.projectiles[projectile.index] = last
+            last.index = projectile.index
+        self.projectile_pool.release(projectile)
+
+    def draw(self, screen, alpha=1.0):
+        """
+        Rysuje przeciwników i pociski.
+        Zwraca listę zamalowanych prostokątów.
+        
+        Parametry:
+            alpha - postęp między krokami symulacji (do interpolacji)
+        """
+        rects = [enemy.draw(screen, alpha) for enemy in self.enemies]
         
         for projectile in self.projectiles:
-            projectile.draw(screen)
+            rects.append(projectile.draw(screen, alpha))
+        
+        return rects
 
     def check_projectile_collisions(self, player_hitbox):
         """Sprawdza czy jakiś pocisk trafił gracza."""
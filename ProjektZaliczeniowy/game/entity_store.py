@@ -0,0 +1,169 @@
+"""
+HUGO - Magazyn obiektów w kolumnach NumPy
+=========================================
+Monety, powerupy i nietoperze robią co klatkę to samo: zjeżdżają w dół
+razem ze światem, animują się i znikają za dolną krawędzią ekranu.
+
+Zamiast wołać update() na każdym obiekcie osobno, trzymamy ich dane
+w kolumnach (tablicach NumPy) - "structure of arrays":
+
+    y      - pozycja Y
+    lane   - numer liny
+    kind   - rodzaj obiektu (KIND_*)
+    anim   - licznik animacji
+    alive  - czy obiekt jest aktywny (np. moneta jeszcze niezebrana)
+
+Przesunięcie, animacja i usuwanie obiektów za ekranem to wtedy po JEDNEJ
+operacji na całej tablicy, niezależnie od liczby obiektów.
+
+Obiekty (Coin, PowerUp, Obstacle) nadal istnieją - trzymają numer swojego
+wiersza (slot) i czytają z magazynu swoje dane. Lista owners ma obiekty
+w tej samej kolejności co wiersze tablic.
+
+Magazyn prowadzi też indeks obiektów na linach posortowany po Y
+(LaneIndex) - kolizje sprawdzamy tylko z obiektami blisko gracza.
+"""
+import numpy as np
+from .config import *
+from .lane_index import LaneIndex
+
+# Rodzaje obiektów (kolumna kind)
+KIND_COIN = 0
+KIND_POWERUP_INVINCIBLE = 1
+KIND_POWERUP_DOUBLE_POINTS = 2
+KIND_BAT_1 = 3
+KIND_BAT_2 = 4
+
+
+class EntityStore:
+    """
+    Tablice z danymi obiektów jadących w dół po linach.
+
+    Wiersze 0..count-1 są zajęte, bez dziur - usunięcie obiektu przenosi
+    ostatni wiersz na jego miejsce ("swap-remove").
+    """
+
+    def __init__(self, capacity=32):
+        """
+        Parametry:
+            capacity - początkowa liczba wierszy (rośnie w razie potrzeby)
+        """
+        self.count = 0
+        self.owners = []  # Obiekt dla każdego wiersza
+
+        # O ile w sumie przesunął się świat (Y w świecie = Y - scrolled)
+        self.scrolled = 0.0
+        self.index = LaneIndex(NUM_ROPES)
+
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.lane = np.zeros(capacity, dtype=np.int8)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.anim = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=np.bool_)
+
+    def _grow(self):
+        """Podwaja pojemność tablic."""
+        capacity = len(self.y) * 2
+        for name in ('y', 'lane', 'kind', 'anim', 'alive'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, owner, lane, y, kind, anim=0):
+        """
+        Dodaje obiekt. Ustawia owner.store, owner.slot i owner.lane_key
+        (klucz w indeksie lin), zwraca slot.
+
+        Parametry:
+            owner - obiekt, do którego należy wiersz
+            lane, y, kind, anim - początkowe wartości kolumn
+        """
+        if self.count == len(self.y):
+            self._grow()
+
+        slot = self.count
+        self.y[slot] = y
+        self.lane[slot] = lane
+        self.kind[slot] = kind
+        self.anim[slot] = anim
+        self.alive[slot] = True
+
+        owner.store = self
+        owner.slot = slot
+        owner.lane_key = y - self.scrolled
+        self.owners.append(owner)
+        self.index.insert(lane, owner.lane_key, owner)
+        self.count += 1
+        return slot
+
+    def remove(self, slot):
+        """Usuwa wiersz - na jego miejsce trafia ostatni wiersz."""
+        removed = self.owners[slot]
+        self.index.remove(int(self.lane[slot]), removed.lane_key, removed)
+
+        last = self.count - 1
+        if slot != last:
+            self.y[slot] = self.y[last]
+            self.lane[slot] = self.lane[last]
+            self.kind[slot] = self.kind[last]
+            self.anim[slot] = self.anim[last]
+            self.alive[slot] = self.alive[last]
+
+            moved = self.owners[last]
+            moved.slot = slot
+            self.owners[slot] = moved
+
+        self.owners.pop()
+        self.count = last
+
+    def clear(self, release):
+        """Usuwa wszystkie obiekty - każdy przekazuje do release()."""
+        for owner in self.owners:
+            release(owner)
+        self.owners.clear()  # Ta sama lista (Game trzyma do niej referencję)
+        self.count = 0
+        self.index = LaneIndex(NUM_ROPES)
+
+    # =========================================================================
+    # OPERACJE NA WSZYSTKICH OBIEKTACH NARAZ
+    # =========================================================================
+
+    def scroll(self, scroll_speed):
+        """Przesuwa wszystkie obiekty w dół."""
+        self.y[:self.count] += scroll_speed
+        self.scrolled += scroll_speed
+
+    def advance_animation(self):
+        """Zwiększa liczniki animacji wszystkich obiektów."""
+        self.anim[:self.count] += 1
+
+    def query(self, lanes, top, bottom):
+        """
+        Zwraca obiekty z podanych lin, których Y jest w przedziale [top, bottom].
+        
+        Klucze w indeksie są liczone z przybliżeniem zmiennoprzecinkowym,
+        więc przedział jest poszerzony o piksel - dokładny test robi
+        potem sam obiekt (check_collision).
+        """
+        return self.index.query(lanes, top - self.scrolled - 1, bottom - self.scrolled + 1)
+
+    def cull(self, release, limit=None):
+        """
+        Usuwa obiekty, które zjechały poniżej limit (None = SCREEN_HEIGHT).
+        Każdy usunięty obiekt przekazuje do release() (np. zwrot do puli).
+        """
+        if self.count == 0:
+            return
+        if limit is None:
+            limit = SCREEN_HEIGHT
+
+        off_screen = (self.y[:self.count] > limit).nonzero()[0]
+
+        # Od końca - przenoszony ostatni wiersz nigdy nie jest wtedy
+        # jednym z tych, które jeszcze mamy usunąć
+        for slot in off_screen[::-1]:
+            slot = int(slot)
+            owner = self.owners[slot]
+            self.remove(slot)
+            release(owner)
@@ -0,0 +1,387 @@
+"""
+HUGO - Środowisko do uczenia agentów (RL)
+=========================================
+VecEnv prowadzi naraz N gier bez okna, rozłożonych na procesy robocze:
+
+    env = VecEnv(64)
+    obs = env.reset(seeds=range(64))
+    while ...:
+        obs, rewards, dones = env.step(actions)   # actions - maski klawiszy
+    env.close()
+
+Akcja to maska klawiszy (KEY_UP | KEY_LEFT itd. z controls.py) - dokładnie
+to, co Player.handle_input dostaje od klawiatury. Agent "trzyma" klawisze
+przez jeden krok (frame_skip klatek gry).
+
+Obserwacje, nagrody, flagi końca i akcje leżą we WSPÓLNEJ PAMIĘCI
+(multiprocessing.shared_memory) jako tablice NumPy. Procesy robocze piszą
+w nie bezpośrednio, a rurą (Pipe) idzie tylko krótkie polecenie "krok" -
+nic nie jest pakowane (pickle) przy każdym kroku.
+
+Zwracane tablice to widoki na wspólną pamięć - następny krok je nadpisze
+(jeśli trzeba je zachować, zrób .copy()).
+
+Epizod kończy się przegraną albo po max_frames klatkach. Gra, która się
+skończyła, od razu zaczyna nową rozgrywkę (ziarno z jej źródła ziaren),
+a wynik i dystans skończonej gry zostają w episode_scores / episode_distances.
+
+Obserwacja (float32, wartości mniej więcej w [-1, 1], "brak" = 1.0):
+    gracz:     lina, wysokość, czy w skoku, nieśmiertelność, podwójne
+               punkty, prędkość świata
+    każda lina: odległość do ENV_OBSTACLES_PER_LANE najbliższych nietoperzy
+               oraz do najbliższej monety i powerupa (nad graczem)
+    pociski:   ENV_PROJECTILES najbliższych - (dx, dy, kierunek)
+"""
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+import numpy as np
+from .config import *
+from .game import Game
+from .controls import ActionInput
+
+# Układ obserwacji
+OBS_PLAYER = 6
+OBS_LANE = ENV_OBSTACLES_PER_LANE + 2  # Nietoperze + moneta + powerup
+OBS_LANES_START = OBS_PLAYER
+OBS_PROJECTILES_START = OBS_LANES_START + NUM_ROPES * OBS_LANE
+OBS_SIZE = OBS_PROJECTILES_START + 3 * ENV_PROJECTILES
+
+
+def write_observation(game, out):
+    """
+    Wpisuje obserwację gry do out (wiersz tablicy float32 o długości OBS_SIZE).
+    """
+    player = game.player
+    hitbox = player.hitbox
+    out.fill(1.0)
+
+    # -----------------------------------------
+    # GRACZ
+    # -----------------------------------------
+    out[0] = player.current_rope / (NUM_ROPES - 1)
+    out[1] = hitbox.centery / SCREEN_HEIGHT
+    out[2] = player.is_moving
+    out[3] = player.invincible_timer / INVINCIBILITY_FRAMES if player.invincible else 0.0
+    out[4] = game.double_points_timer / DOUBLE_POINTS_FRAMES if game.double_points_active else 0.0
+    out[5] = game.scroll_speed / MAX_SCROLL_SPEED
+
+    # -----------------------------------------
+    # LINY: najbliższe obiekty nad graczem
+    # -----------------------------------------
+    top, bottom = hitbox.top, hitbox.bottom
+    _write_nearest(game.obstacle_manager.store, OBSTACLE_SIZE, top, bottom,
+                   out, 0, ENV_OBSTACLES_PER_LANE)
+    _write_nearest(game.coin_store, COIN_SIZE, top, bottom,
+                   out, ENV_OBSTACLES_PER_LANE, 1)
+    _write_nearest(game.powerup_store, POWERUP_SIZE, top, bottom,
+                   out, ENV_OBSTACLES_PER_LANE + 1, 1)
+
+    # -----------------------------------------
+    # POCISKI: najbliższe w pionie
+    # -----------------------------------------
+    projectiles = game.enemy_manager.projectiles
+    if projectiles:
+        x, y = hitbox.centerx, hitbox.centery
+        nearest = sorted(projectiles, key=lambda p: abs(p.y - y))[:ENV_PROJECTILES]
+        i = OBS_PROJECTILES_START
+        for projectile in nearest:
+            out[i] = (projectile.x - x) / SCREEN_WIDTH
+            out[i + 1] = (projectile.y - y) / SCREEN_HEIGHT
+            out[i + 2] = projectile.direction
+            i += 3
+        out[i:OBS_SIZE:3] = 1.0
+        out[i + 1:OBS_SIZE:3] = 1.0
+        out[i + 2:OBS_SIZE:3] = 0.0
+    else:
+        out[OBS_PROJECTILES_START + 2:OBS_SIZE:3] = 0.0
+
+
+def _write_nearest(store, size, top, bottom, out, column, per_lane):
+    """
+    Dla każdej liny wpisuje odległości (w wysokościach ekranu) od gracza
+    do per_lane najbliższych obiektów z magazynu, które go jeszcze nie minęły.
+
+    Parametry:
+        store - EntityStore z obiektami
+        size - wysokość obiektu
+        top, bottom - góra i dół hitboxa gracza
+        column - pierwsza kolumna w bloku liny
+        per_lane - ile obiektów na linę
+    """
+    count = store.count
+    if count == 0:
+        return
+
+    # Obiektów jest kilka - zwykła pętla jest szybsza niż operacje NumPy
+    lanes = [[] for _ in range(NUM_ROPES)]
+    for y, lane in zip(store.y[:count].tolist(), store.lane[:count].tolist()):
+        if y <= bottom:
+            lanes[lane].append((top - y - size) / SCREEN_HEIGHT)
+
+    for lane, distances in enumerate(lanes):
+        if distances:
+            distances.sort()
+            start = OBS_LANES_START + lane * OBS_LANE + column
+            out[start:start + min(len(distances), per_lane)] = distances[:per_lane]
+
+
+# =============================================================================
+# GRUPA GIER (jeden proces roboczy)
+# =============================================================================
+
+class GameBatch:
+    """
+    Gry jednego procesu roboczego. Czyta akcje i pisze wyniki do swojego
+    wycinka wspólnych tablic.
+    """
+
+    def __init__(self, arrays, max_frames, frame_skip):
+        """
+        Parametry:
+            arrays - słownik tablic (wycinki dla tych gier), patrz _buffer_layout
+            max_frames - po ilu klatkach przerwać epizod
+            frame_skip - ile klatek gry trwa jeden krok
+        """
+        self.arrays = arrays
+        self.max_frames = max_frames
+        self.frame_skip = frame_skip
+        self.games = []
+        self.inputs = []
+
+    def reset(self, seeds):
+        """Zaczyna nowe gry z podanymi ziarnami."""
+        arrays = self.arrays
+        self.games = []
+        self.inputs = []
+        for i, seed in enumerate(seeds):
+            input_source = ActionInput()
+            game = Game(headless=True, seed=seed, input_source=input_source)
+            game.game_state = 'playing'
+            game.reset_game()
+            self.games.append(game)
+            self.inputs.append(input_source)
+            write_observation(game, arrays['obs'][i])
+
+        arrays['rewards'].fill(0.0)
+        arrays['dones'].fill(False)
+
+    def step(self):
+        """Wykonuje jeden krok wszystkich gier (akcje są już w tablicy)."""
+        arrays = self.arrays
+        obs = arrays['obs']
+        rewards = arrays['rewards']
+        dones = arrays['dones']
+        actions = arrays['actions'].tolist()
+        max_frames = self.max_frames
+        frame_skip = self.frame_skip
+
+        for i, game in enumerate(self.games):
+            self.inputs[i].set_mask(actions[i])
+            score_before = game.get_total_score()
+
+            for _ in range(frame_skip):
+                game.update()
+                if game.game_state != 'playing':
+                    break
+
+            score = game.get_total_score()
+            reward = score - score_before
+            game_over = game.game_state != 'playing'
+            done = game_over or game.frame_count >= max_frames
+            if game_over:
+                reward -= ENV_DEATH_PENALTY
+
+            if done:
+                arrays['episode_scores'][i] = score
+                arrays['episode_distances'][i] = game.get_distance_meters()
+                game.game_state = 'playing'
+                game.reset_game()
+
+            rewards[i] = reward
+            dones[i] = done
+            write_observation(game, obs[i])
+
+
+def _buffer_layout(num_envs):
+    """
+    Układ tablic we wspólnej pamięci: (nazwa, typ, kształt).
+    Najpierw typy 4-bajtowe, potem 1-bajtowe - wszystkie są wyrównane.
+    """
+    return (
+        ('obs', np.float32, (num_envs, OBS_SIZE)),
+        ('rewards', np.float32, (num_envs,)),
+        ('episode_scores', np.int32, (num_envs,)),
+        ('episode_distances', np.int32, (num_envs,)),
+        ('actions', np.uint8, (num_envs,)),
+        ('dones', np.bool_, (num_envs,)),
+    )
+
+
+def _map_arrays(buffer, num_envs):
+    """Tworzy tablice NumPy na buforze wspólnej pamięci."""
+    arrays = {}
+    offset = 0
+    for name, dtype, shape in _buffer_layout(num_envs):
+        array = np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)
+        arrays[name] = array
+        offset += array.nbytes
+    return arrays
+
+
+def _buffer_size(num_envs):
+    """Ile bajtów wspólnej pamięci potrzeba na num_envs gier."""
+    return sum(int(np.prod(shape)) * np.dtype(dtype).itemsize
+               for _, dtype, shape in _buffer_layout(num_envs))
+
+
+def _slice_arrays(arrays, start, stop):
+    """Wycinek tablic dla gier start..stop-1."""
+    return {name: array[start:stop] for name, array in arrays.items()}
+
+
+def _worker(conn, memory, num_envs, start, stop, max_frames, frame_skip):
+    """Pętla procesu roboczego: czeka na polecenia i liczy swoje gry."""
+    arrays = _map_arrays(memory.buf, num_envs)
+    batch = GameBatch(_slice_arrays(arrays, start, stop), max_frames, frame_skip)
+    try:
+        while True:
+            command, argument = conn.recv()
+            if command == 'step':
+                batch.step()
+            elif command == 'reset':
+                batch.reset(argument)
+            elif command == 'close':
+                break
+            conn.send(None)
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        # Widoki na bufor muszą zniknąć przed zamknięciem pamięci
+        del batch, arrays
+        memory.close()
+
+
+# =============================================================================
+# ŚRODOWISKO
+# =============================================================================
+
+class VecEnv:
+    """
+    N gier bez okna naraz, liczonych w procesach roboczych.
+    """
+
+    def __init__(self, num_envs, num_workers=None, max_frames=None, frame_skip=1):
+        """
+        Parametry:
+            num_envs - ile gier naraz
+            num_workers - ile procesów (None = tyle, ile rdzeni;
+                          0 = wszystko w tym procesie, np. do debugowania)
+            max_frames - po ilu klatkach przerwać epizod (None = ENV_MAX_FRAMES)
+            frame_skip - ile klatek gry trwa jeden krok (ta sama akcja)
+        """
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        if max_frames is None:
+            max_frames = ENV_MAX_FRAMES
+        num_workers = min(num_workers, num_envs)
+
+        self.num_envs = num_envs
+        self._memory = shared_memory.SharedMemory(create=True, size=_buffer_size(num_envs))
+        arrays = _map_arrays(self._memory.buf, num_envs)
+        self.arrays = arrays
+        self.observations = arrays['obs']
+        self.rewards = arrays['rewards']
+        self.dones = arrays['dones']
+        self.actions = arrays['actions']
+        self.episode_scores = arrays['episode_scores']
+        self.episode_distances = arrays['episode_distances']
+
+        # Podział gier na procesy - po równo (pierwsze dostają o jedną więcej)
+        bounds = [num_envs * i // max(num_workers, 1) for i in range(max(num_workers, 1) + 1)]
+        self._slices = list(zip(bounds[:-1], bounds[1:]))
+
+        self._local = None
+        self._connections = []
+        self._processes = []
+        if num_workers == 0:
+            self._local = GameBatch(arrays, max_frames, frame_skip)
+        else:
+            for start, stop in self._slices:
+                parent_conn, child_conn = multiprocessing.Pipe()
+                process = multiprocessing.Process(
+                    target=_worker,
+                    args=(child_conn, self._memory, num_envs, start, stop,
+                          max_frames, frame_skip),
+                    daemon=True)
+                process.start()
+                child_conn.close()
+                self._connections.append(parent_conn)
+                self._processes.append(process)
+
+    def _command(self, command, arguments):
+        """Wysyła polecenie do wszystkich procesów i czeka, aż skończą."""
+        for conn, argument in zip(self._connections, arguments):
+            conn.send((command, argument))
+        for conn in self._connections:
+            conn.recv()
+
+    def reset(self, seeds=None):
+        """
+        Zaczyna nowe gry. Zwraca obserwacje [num_envs, OBS_SIZE].
+
+        Parametry:
+            seeds - ziarna gier (num_envs liczb); None = 0, 1, 2, ...
+        """
+        seeds = list(range(self.num_envs)) if seeds is None else [int(s) for s in seeds]
+        if len(seeds) != self.num_envs:
+            raise ValueError(f"Potrzeba {self.num_envs} ziaren, a jest {len(seeds)}")
+
+        if self._local:
+            self._local.reset(seeds)
+        else:
+            self._command('reset', [seeds[start:stop] for start, stop in self._slices])
+        return self.observations
+
+    def step(self, actions):
+        """
+        Wykonuje krok wszystkich gier.
+        Zwraca (obserwacje, nagrody, flagi końca epizodu).
+
+        Parametry:
+            actions - maski klawiszy dla każdej gry (num_envs liczb 0-15)
+        """
+        self.actions[:] = actions
+        if self._local:
+            self._local.step()
+        else:
+            self._command('step', [None] * len(self._connections))
+        return self.observations, self.rewards, self.dones
+
+    def close(self):
+        """Zamyka procesy robocze i zwalnia wspólną pamięć."""
+        if self._memory is None:
+            return
+        for conn in self._connections:
+            try:
+                conn.send(('close', None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join()
+        for conn in self._connections:
+            conn.close()
+
+        # Widoki na bufor muszą zniknąć przed zamknięciem pamięci
+        self._local = None
+        self.arrays = self.observations = self.rewards = self.dones = None
+        self.actions = self.episode_scores = self.episode_distances = None
+        self._memory.close()
+        self._memory.unlink()
+        self._memory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
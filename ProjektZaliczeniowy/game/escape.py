@@ -0,0 +1,358 @@
+"""
+HUGO - Sprawdzanie, czy da się uciec
+====================================
+config.py obiecuje przy OBSTACLE_PATTERNS, że zawsze jest wolna lina.
+Ale wzorce to nie wszystko: pociski, losowe przesunięcie nietoperzy
+(OBSTACLE_Y_VARIATION), cooldown skoku i rosnąca prędkość mogą razem
+zamknąć wszystkie drogi. Ten moduł to SPRAWDZA dla konkretnych gier.
+
+Nietoperze i przeciwnicy nie zależą od gracza (układa je generator
+poziomu, a strzały losuje Game.rng, z którego gracz nic nie bierze).
+Dlatego najpierw nagrywamy grę bez gracza: w każdej klatce prostokąty
+nietoperzy i pocisków (record_world). Potem przeszukujemy WSZYSTKIE
+możliwe ruchy gracza naraz (BFS po klatkach):
+
+- stan gracza = (stan poziomy, y), gdzie stan poziomy to lina, pozycja X
+  w trakcie skoku i cooldown skoku (HorizontalStates - wyliczone z tych
+  samych reguł co Player.handle_input),
+- stan to jedna liczba: wiersz * liczba_wysokości + (y - PLAYER_MIN_Y),
+- zbiór stanów w klatce to bitset (jeden int Pythona, bit = stan);
+  ruch w górę / w dół to przesunięcie bitów o PLAYER_SPEED, skok to
+  przesunięcie całych wierszy - kilkanaście operacji na klatkę dla
+  ponad 100 tys. stanów naraz,
+- stany zagrożone w danej klatce (też bitset) liczymy w NumPy
+  i wycinamy jednym AND-em,
+- dominacja: ten sam X i Y z mniejszym cooldownem daje co najmniej te
+  same możliwości - stany z większym cooldownem usuwamy.
+
+Pusty zbiór stanów w klatce T = z tej gry nie da się wyjść żywym.
+find_window szuka wtedy najkrótszego okna [S, T], w którym nawet gracz
+stojący gdziekolwiek w klatce S już nie ma ucieczki - to minimalny
+kontrprzykład (konkretne nietoperze i pociski, które zamykają drogę).
+
+Powerupy pomijamy - sprawdzamy, czy da się przeżyć bez nich.
+"""
+import numpy as np
+from .config import *
+from .game import Game
+from .controls import ScriptedInput
+from .player import player_hitbox
+
+# Rodzaje zagrożeń w nagraniu świata
+THREAT_BAT = 0
+THREAT_PROJECTILE = 1
+
+
+# =============================================================================
+# NAGRANIE ŚWIATA
+# =============================================================================
+
+class World:
+    """
+    Zagrożenia w każdej klatce jednej gry.
+
+    Klatka t (1..frames) ma wiersze rects[starts[t-1]:starts[t]]:
+    (rodzaj, lewo, góra, prawo, dół) hitboxa - tak jak w kolizjach gry.
+    """
+
+    def __init__(self, seed, lane_x, starts, rects):
+        self.seed = seed
+        self.lane_x = lane_x  # X prostokąta gracza na każdej linie
+        self.starts = starts
+        self.rects = rects
+
+    @property
+    def frames(self):
+        return len(self.starts) - 1
+
+    def threats(self, tick):
+        """Zagrożenia w klatce tick (tablica [n, 5])."""
+        return self.rects[self.starts[tick - 1]:self.starts[tick]]
+
+
+def record_world(seed, frames):
+    """
+    Gra max frames klatek bez gracza i zapisuje prostokąty zagrożeń
+    po każdej klatce (World).
+    """
+    game = Game(headless=True, seed=seed, input_source=ScriptedInput())
+    game.game_state = 'playing'
+    game.reset_game()
+    lane_x = [rope.x + ROPE_WIDTH // 2 - PLAYER_WIDTH // 2 for rope in game.ropes]
+
+    # Gracz stoi poza ekranem - nic go nie trafi i nic nie zbierze
+    # (bez wciśniętych klawiszy X się nie zmienia)
+    game.player.rect.x = -SCREEN_WIDTH
+
+    starts = [0]
+    rects = []
+    for _ in range(frames):
+        game.update()
+
+        for obstacle in game.obstacle_manager.obstacles:
+            hitbox = obstacle.get_hitbox()
+            rects.append((THREAT_BAT, hitbox.left, hitbox.top, hitbox.right, hitbox.bottom))
+        for projectile in game.enemy_manager.projectiles:
+            rect = projectile.rect
+            rects.append((THREAT_PROJECTILE, rect.left, rect.top, rect.right, rect.bottom))
+        starts.append(len(rects))
+
+    rects = np.array(rects, dtype=np.int32).reshape(-1, 5)
+    return World(seed, lane_x, np.array(starts, dtype=np.int64), rects)
+
+
+# =============================================================================
+# STANY POZIOME (lina, skok, cooldown)
+# =============================================================================
+
+class HorizontalStates:
+    """
+    Wszystkie osiągalne stany poziome gracza: (x, lina, skok w toku,
+    cel X, cooldown) - liczone tymi samymi regułami co Player.handle_input.
+
+    Każdy stan to jeden wiersz bitsetu. Przejścia (wiersz -> wiersz dla
+    "bez skoku", "skok w lewo", "skok w prawo") grupujemy po przesunięciu
+    (o ile wierszy) - jedna grupa to jedno przesunięcie bitsetu.
+    """
+
+    def __init__(self, lane_x, start_rope=1):
+        """
+        Parametry:
+            lane_x - X prostokąta gracza na każdej linie
+            start_rope - lina startowa gracza
+        """
+        self.lane_x = lane_x
+        start = (lane_x[start_rope], start_rope, False, lane_x[start_rope], 0)
+
+        # Wiersze w kolejności łańcuchów skoku (następna klatka skoku
+        # to następny wiersz) - większość przejść ma wtedy przesunięcie +1
+        self.rows = []
+        self.index = {}
+        edges = set()
+        pending = [start]
+        while pending:
+            state = pending.pop()
+            while state not in self.index:
+                self.index[state] = len(self.rows)
+                self.rows.append(state)
+                for jump in (-1, 1):
+                    pending.append(self._step(state, jump))
+                state = self._step(state, 0)
+
+        for state in self.rows:
+            for jump in (0, -1, 1):
+                edges.add((self.index[state], self.index[self._step(state, jump)]))
+
+        # Przejścia pogrupowane po przesunięciu: {przesunięcie: wiersze źródłowe}
+        self.shifts = {}
+        for source, target in edges:
+            self.shifts.setdefault(target - source, []).append(source)
+
+        # Dominacja: ten sam X i cel, bez skoku w toku, mniejszy cooldown
+        self.dominated = []  # (wiersz dominujący, wiersz zdominowany)
+        for row, (x, rope, moving, target_x, cooldown) in enumerate(self.rows):
+            if moving:
+                continue
+            for other, (x2, rope2, moving2, target2, cooldown2) in enumerate(self.rows):
+                if (not moving2 and (x2, rope2, target2) == (x, rope, target_x)
+                        and cooldown2 > cooldown):
+                    self.dominated.append((row, other))
+
+        self.x = np.array([state[0] for state in self.rows], dtype=np.int32)
+        self.start_row = self.index[start]
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _step(self, state, jump):
+        """Jedna klatka ruchu w poziomie (jak Player.handle_input)."""
+        x, rope, moving, target_x, cooldown = state
+
+        if cooldown > 0:
+            cooldown -= 1
+
+        if jump and not moving and cooldown == 0 and 0 <= rope + jump < NUM_ROPES:
+            rope += jump
+            cooldown = PLAYER_JUMP_COOLDOWN
+            moving = True
+            target_x = self.lane_x[rope]
+
+        if moving:
+            distance = abs(x - target_x)
+            if distance > PLAYER_JUMP_SNAP_DISTANCE:
+                speed = min(PLAYER_JUMP_SPEED, distance)
+                x += speed if x < target_x else -speed
+            else:
+                x = target_x
+                moving = False
+        return (x, rope, moving, target_x, cooldown)
+
+
+# =============================================================================
+# PRZESZUKIWANIE (BFS NA BITSETACH)
+# =============================================================================
+
+class EscapeChecker:
+    """
+    BFS po klatkach dla jednej gry: zbiór osiągalnych stanów gracza
+    w każdej klatce jako bitset (int Pythona).
+
+    Stan = wiersz * heights + (y - PLAYER_MIN_Y).
+    """
+
+    def __init__(self, world):
+        """
+        Parametry:
+            world - nagranie zagrożeń (record_world)
+        """
+        self.world = world
+        self.horizontal = HorizontalStates(world.lane_x)
+        self.heights = PLAYER_MAX_Y - PLAYER_MIN_Y + 1
+        rows = len(self.horizontal)
+        heights = self.heights
+
+        def row_mask(bits):
+            """Bitset z tymi samymi bitami (wysokościami) w każdym wierszu."""
+            row = 0
+            for bit in bits:
+                row |= 1 << bit
+            mask = 0
+            for r in range(rows):
+                mask |= row << (r * heights)
+            return mask
+
+        def rows_mask(selected):
+            """Bitset z całymi wybranymi wierszami."""
+            full = (1 << heights) - 1
+            mask = 0
+            for r in selected:
+                mask |= full << (r * heights)
+            return mask
+
+        self.all_states = rows_mask(range(rows))
+
+        # Ruch w pionie: przesunięcie o PLAYER_SPEED bitów, a przy krawędziach
+        # "dociśnięcie" do PLAYER_MIN_Y / PLAYER_MAX_Y (jak w Player)
+        speed = PLAYER_SPEED
+        self._speed = speed
+        self._up_free = row_mask(range(speed, heights))
+        self._down_free = row_mask(range(heights - speed))
+        self._up_edge = [(row_mask([k]), k) for k in range(min(speed, heights))]
+        self._down_edge = [(row_mask([heights - 1 - k]), k) for k in range(min(speed, heights))]
+
+        # Skoki i ich klatki: przesunięcie wierszy o offset
+        self._shifts = [(offset * heights, rows_mask(sources))
+                        for offset, sources in sorted(self.horizontal.shifts.items())]
+        self._dominance = [((dominated - dominant) * heights, rows_mask([dominant]))
+                           for dominant, dominated in self.horizontal.dominated]
+
+        # Do liczenia stref zagrożenia: X hitboxa gracza w każdym wierszu
+        offset_x, self._hitbox_offset_y, width, self._hitbox_height = player_hitbox()
+        self._hitbox_left = self.horizontal.x + offset_x
+        self._hitbox_right = self._hitbox_left + width
+        self._heights_range = np.arange(heights)
+
+        self.states_visited = 0  # Suma stanów we wszystkich klatkach (statystyka)
+
+    def start_states(self):
+        """Bitset ze stanem startowym gracza (środkowa lina, PLAYER_START_Y)."""
+        return 1 << (self.horizontal.start_row * self.heights + PLAYER_START_Y - PLAYER_MIN_Y)
+
+    def encode(self, row, y):
+        """Numer stanu (wiersz poziomy, y)."""
+        return row * self.heights + (y - PLAYER_MIN_Y)
+
+    def decode(self, state):
+        """(x, lina, skok w toku, cooldown, y) dla numeru stanu."""
+        row, y = divmod(state, self.heights)
+        x, rope, moving, _, cooldown = self.horizontal.rows[row]
+        return x, rope, moving, cooldown, y + PLAYER_MIN_Y
+
+    def danger(self, tick):
+        """Bitset stanów, w których gracz zderza się z czymś w klatce tick."""
+        threats = self.world.threats(tick)
+        if len(threats) == 0:
+            return 0
+
+        # Gracz w (x, y) trafia prostokąt, gdy hitboxy nachodzą na siebie
+        # (jak colliderect) - dla y to przedział [low, high]
+        overlap_x = ((self._hitbox_left[:, None] < threats[:, 3])
+                     & (threats[:, 1] < self._hitbox_right[:, None]))
+        low = threats[:, 2] - self._hitbox_offset_y - self._hitbox_height + 1 - PLAYER_MIN_Y
+        high = threats[:, 4] - self._hitbox_offset_y - 1 - PLAYER_MIN_Y
+
+        # Wiersz trafia, gdy jakieś zagrożenie nachodzi w X i w Y - to
+        # iloczyn macierzy [wiersz, zagrożenie] x [zagrożenie, y]
+        overlap_y = (self._heights_range >= low[:, None]) & (self._heights_range <= high[:, None])
+        hit = (overlap_x.astype(np.float32) @ overlap_y.astype(np.float32)) > 0
+
+        return int.from_bytes(np.packbits(hit, bitorder='little').tobytes(), 'little')
+
+    def step(self, states):
+        """Stany po jednej klatce ruchu (wszystkie kombinacje klawiszy)."""
+        speed = self._speed
+
+        # Góra / dół / stój - w każdym wierszu osobno, z dociśnięciem
+        moved = states | ((states & self._up_free) >> speed) | ((states & self._down_free) << speed)
+        for mask, k in self._up_edge:
+            moved |= (states & mask) >> k
+        for mask, k in self._down_edge:
+            moved |= (states & mask) << k
+
+        # Bez skoku / skok w lewo / w prawo - przesunięcia całych wierszy
+        result = 0
+        for shift, mask in self._shifts:
+            part = moved & mask
+            result |= part << shift if shift >= 0 else part >> -shift
+
+        # Dominacja: usuń stany z większym cooldownem, gdy jest ten z mniejszym
+        for shift, mask in self._dominance:
+            part = result & mask
+            result &= ~(part << shift if shift >= 0 else part >> -shift)
+        return result
+
+    def run(self, states, first_tick, last_tick):
+        """
+        Przeszukuje klatki first_tick..last_tick, zaczynając od stanów
+        states (przed klatką first_tick). Zwraca (pierwsza klatka bez
+        żadnego stanu albo None, stany po ostatniej przeżytej klatce).
+        """
+        for tick in range(first_tick, last_tick + 1):
+            next_states = self.step(states) & ~self.danger(tick)
+            if not next_states:
+                return tick, states
+            states = next_states
+            self.states_visited += states.bit_count()
+        return None, states
+
+    def check(self):
+        """
+        Sprawdza całą nagraną grę od stanu startowego.
+        Zwraca numer klatki, w której nie ma już ucieczki (albo None).
+        """
+        dead_tick, _ = self.run(self.start_states(), 1, self.world.frames)
+        return dead_tick
+
+    def find_window(self, dead_tick):
+        """
+        Minimalny kontrprzykład: największe S, dla którego nawet gracz
+        w DOWOLNYM bezpiecznym stanie w klatce S nie przeżyje do dead_tick.
+        Zwraca S (0 = ucieczki brakuje tylko z pozycji startowej).
+        """
+        def dead_from(start):
+            states = self.all_states & ~self.danger(start)
+            if not states:
+                return True
+            return self.run(states, start + 1, dead_tick)[0] is not None
+
+        # Im później start, tym łatwiej przeżyć - wyszukiwanie binarne
+        low, high = 1, dead_tick
+        if not dead_from(low):
+            return 0
+        while low < high:
+            middle = (low + high + 1) // 2
+            if dead_from(middle):
+                low = middle
+            else:
+                high = middle - 1
+        return low
@@ -7,6 +7,28 @@ Stany gry:
 - 'menu' - ekran startowy
 - 'playing' - gramy
 - 'game_over' - koniec gry
+
+Losowość:
+Cała losowość rozgrywki zależy od "ziarna rozgrywki" (run_seed), nowego
+przy każdym starcie gry. Układ świata (monety, powerupy, nietoperze,
+wjazdy przeciwników) losuje z wyprzedzeniem generator poziomu self.level
+(level.py), a to, co dzieje się w trakcie gry (strzały), generator self.rng.
+To samo ziarno + to samo sterowanie = dokładnie ta sama rozgrywka.
+
+Tryb bez okna (headless):
+Game(headless=True) nie otwiera okna, nie ładuje grafik i nie rysuje.
+Sterowanie pochodzi ze źródła sterowania (np. ScriptedInput), a symulacja
+działa tak szybko, jak pozwala procesor - przydatne do testów i balansu.
+
+Profiler (profile=True):
+Każda faza klatki (eventy, sterowanie, managery, spawn, kolizje, grupy
+rysowania, wysłanie obrazu) jest mierzona przez self.profiler. F3 pokazuje
+nakładkę z czasami. Bez profilera self.profiler to NullProfiler.
+
+Zapis stanu (snapshot.py):
+snapshot() zwraca cały stan rozgrywki jako bajty, a restore() go przywraca
+(np. do przeszukiwania "co by było, gdyby"). Z rewind=True gra zapisuje
+stan co klatkę w RewindBuffer, a Backspace cofa ją o REWIND_STEP_FRAMES klatek.
 """
 import pygame
 import random
@@ -15,9 +37,19 @@ from .sprites import SpriteManager
 from .player import Player
 from .rope import Rope
 from .collectibles import Coin, PowerUp
+from .entity_store import EntityStore
+from .pool import ObjectPool
+from .lane_geometry import LaneGeometry
+from .level import (LevelGenerator, SPAWN_COIN, SPAWN_POWERUP, SPAWN_BAT,
+                    POWERUP_TYPES, BAT_TYPES, ENEMY_SIDES)
 from .obstacles import ObstacleManager
 from .enemy import EnemyManager
 from .menu import Menu
+from .renderer import DirtyRectRenderer
+from .hud import HUD
+from .controls import KeyboardInput, ScriptedInput
+from .profiler import FrameProfiler, NullProfiler
+from .snapshot import snapshot, restore, RewindBuffer
 
 
 class Game:
@@ -25,41 +57,135 @@ class Game:
     Główna klasa gry - zarządza wszystkim.
     """
 
-    def __init__(self):
-        """Inicjalizacja gry."""
-        # -----------------------------------------
-        # OKNO I ZEGAR
-        # -----------------------------------------
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Hugo - Wspinaczka po Linach")
-        self.clock = pygame.time.Clock()
-        
-        # -----------------------------------------
-        # CZCIONKI DO UI W GRZE
-        # -----------------------------------------
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 26)
-        
-        # -----------------------------------------
-        # ZAŁADUJ GRAFIKI
-        # -----------------------------------------
-        self.sprite_manager = SpriteManager()
+    def __init__(self, headless=False, seed=None, input_source=None, recorder=None,
+                 dirty_rects=None, profile=False, rewind=False):
+        """
+        Inicjalizacja gry.
+        
+        Parametry:
+            headless - True = bez okna, grafik i rysowania (sama symulacja)
+            seed - ziarno pierwszej rozgrywki (None = losowe); kolejne
+                   rozgrywki dostają ziarna wylosowane z tego samego źródła
+            input_source - skąd brać stan klawiszy (domyślnie klawiatura,
+                           a w trybie headless - brak wciśniętych klawiszy)
+            recorder - opcjonalny ReplayRecorder nagrywający sterowanie
+            dirty_rects - True = odświeżaj tylko zmienione fragmenty ekranu
+                          (None = USE_DIRTY_RECTS)
+            profile - True = mierz czasy faz klatki (nakładka F3, export())
+            rewind - True = pamiętaj ostatnie klatki (cofanie Backspace)
+        """
+        self.headless = headless
+        self.profiler = FrameProfiler() if profile else NullProfiler()
+        self.rewind_buffer = RewindBuffer() if rewind else None
+        
+        # -----------------------------------------
+        # ZIARNA LOSOWOŚCI
+        # -----------------------------------------
+        self.seed = seed
+        self._seed_source = random.Random(seed)
+        self._seed_source_draws = 0     # Ile ziaren wylosowano ze źródła
+        self._packed_seed_source = None # (liczba losowań, stan w bajtach) - snapshot.py
+        self.run_seed = None
+        self.recorder = recorder
+        
+        # -----------------------------------------
+        # STEROWANIE
+        # -----------------------------------------
+        if input_source is None:
+            input_source = ScriptedInput() if headless else KeyboardInput()
+        self.input_source = input_source
+        
+        if headless:
+            # Bez okna, czcionek, grafik i menu - tylko logika gry
+            self.screen = None
+            self.clock = None
+            self.sprite_manager = None
+            self.menu = None
+            self.renderer = None
+        else:
+            # -----------------------------------------
+            # OKNO I ZEGAR
+            # -----------------------------------------
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("Hugo - Wspinaczka po Linach")
+            self.clock = pygame.time.Clock()
+            
+            # -----------------------------------------
+            # CZCIONKI DO UI W GRZE
+            # -----------------------------------------
+            self.font = pygame.font.Font(None, 36)
+            self.small_font = pygame.font.Font(None, 26)
+            self.hud = HUD(self.font, self.small_font)
+            
+            # -----------------------------------------
+            # ZAŁADUJ GRAFIKI
+            # -----------------------------------------
+            # Od razu tylko grafiki menu - resztę SpriteManager ładuje w tle
+            # (dokańczane między klatkami w run(), patrz finish_loading)
+            self.sprite_manager = SpriteManager(background_loading=True)
+            
+            # -----------------------------------------
+            # MENU
+            # -----------------------------------------
+            self.menu = Menu(self.screen, self.sprite_manager)
+            
+            # -----------------------------------------
+            # ODŚWIEŻANIE EKRANU
+            # -----------------------------------------
+            # None = zwykły pygame.display.flip() co klatkę
+            if dirty_rects is None:
+                dirty_rects = USE_DIRTY_RECTS
+            self.renderer = DirtyRectRenderer(self.screen) if dirty_rects else None
         
-        # -----------------------------------------
-        # MENU
-        # -----------------------------------------
-        self.menu = Menu(self.screen, self.sprite_manager)
+        # Co było ostatnio narysowane na statycznym ekranie (menu / game over)
+        self._static_screen_key = None
         
         # -----------------------------------------
         # STAN GRY
         # -----------------------------------------
         self.game_state = 'menu'  # 'menu', 'playing', 'game_over'
+        self.frame_count = 0      # Ile klatek symulacji minęło od startu gry
+        
+        # SPACJA w menu, zanim grafiki się załadowały - gra ruszy, gdy będą gotowe
+        self.start_requested = False
         
         # Zainicjuj grę
         self.reset_game()
 
+    def _next_run_seed(self):
+        """Zwraca ziarno dla nowej rozgrywki."""
+        # Pierwsza rozgrywka używa dokładnie podanego ziarna
+        # (tak odtwarzamy nagrania), kolejne - losowanych z jego źródła
+        if self.run_seed is None:
+            if self.seed is not None:
+                return self.seed
+        elif self.frame_count == 0:
+            # Poprzednia "rozgrywka" nie trwała ani klatki (np. reset
+            # w __init__ przed wyjściem z menu) - użyj jej ziarna ponownie
+            return self.run_seed
+        self._seed_source_draws += 1
+        return self._seed_source.getrandbits(32)
+
     def reset_game(self):
         """Resetuje grę do stanu początkowego."""
+        # -----------------------------------------
+        # LOSOWOŚĆ (jeden generator na rozgrywkę)
+        # -----------------------------------------
+        self.run_seed = self._next_run_seed()
+        self.rng = random.Random(self.run_seed)
+        self.level = LevelGenerator(self.run_seed)
+        
+        if self.recorder:
+            self.recorder.start(self.run_seed)
+        
+        # Cofać można tylko w obrębie jednej rozgrywki
+        if self.rewind_buffer is not None:
+            self.rewind_buffer.clear()
+        
+        # Nowa rozgrywka = nowy ekran Game Over
+        if self.menu:
+            self.menu.invalidate_game_over()
+        
         # -----------------------------------------
         # LINY
         # -----------------------------------------
@@ -72,6 +198,9 @@ class Game:
             rope = Rope(x, self.sprite_manager)
             self.ropes.append(rope)
         
+        # Położenie obiektów na linach - liny nie ruszają się w poziomie
+        self.lane_geometry = LaneGeometry(self.ropes)
+        
         # -----------------------------------------
         # GRACZ
         # -----------------------------------------
@@ -83,20 +212,32 @@ class Game:
         # -----------------------------------------
         # PRZEDMIOTY
         # -----------------------------------------
-        self.coins = []
-        self.powerups = []
+        # Dane w kolumnach (EntityStore), a listy obiektów to store.owners
+        self.coin_store = EntityStore()
+        self.powerup_store = EntityStore()
+        self.coins = self.coin_store.owners
+        self.powerups = self.powerup_store.owners
+        
+        # Pule - zebrane i niewidoczne obiekty wracają do ponownego użycia
+        self.coin_pool = ObjectPool(Coin, prefill=MAX_COINS_ON_SCREEN)
+        self.powerup_pool = ObjectPool(PowerUp, prefill=2)
         
         # -----------------------------------------
         # PRZESZKODY I PRZECIWNICY
         # -----------------------------------------
-        self.obstacle_manager = ObstacleManager()
-        self.enemy_manager = EnemyManager()
+        self.obstacle_manager = ObstacleManager(self.lane_geometry)
+        self.enemy_manager = EnemyManager(self.rng)
         
         # -----------------------------------------
         # PUNKTACJA I STATYSTYKI
         # -----------------------------------------
         self.score = 0
         self.distance_pixels = 0  # Dystans w pikselach
+        self.frame_count = 0
+        self.death_cause = None   # Co zakończyło grę: 'obstacle' / 'projectile'
+        
+        # O ile przesunął się świat w ostatnim kroku (do interpolacji rysowania)
+        self.last_scroll_step = 0
         
         # -----------------------------------------
         # POWERUP PODWÓJNYCH PUNKTÓW
@@ -109,59 +250,54 @@ class Game:
         # -----------------------------------------
         self.scroll_speed = SCROLL_SPEED
         
-        # -----------------------------------------
-        # SPAWNING (kiedy ostatnio co się pojawiło)
-        # -----------------------------------------
-        self.last_coin_distance = 0
-        self.last_powerup_distance = 0
-        
         # -----------------------------------------
         # TŁO (animacja scrollingu)
         # -----------------------------------------
         self.background_y = 0
 
     def spawn_objects(self):
-        """Tworzy nowe obiekty (monety, przeszkody, etc.)."""
-        # -----------------------------------------
-        # MONETY
-        # -----------------------------------------
-        if self.distance_pixels - self.last_coin_distance > COIN_SPAWN_DISTANCE:
-            # Nie za dużo monet na raz
-            if len(self.coins) < MAX_COINS_ON_SCREEN:
-                # Losowa lina
-                rope_index = random.randint(0, NUM_ROPES - 1)
-                
-                # Utwórz monetę nad ekranem
-                coin = Coin(rope_index, -COIN_SIZE, self.sprite_manager)
-                self.coins.append(coin)
+        """Tworzy obiekty, na które przyszedł czas (zdarzenia z self.level)."""
+        level = self.level
+        distance = self.distance_pixels
+        
+        # Zwykle świat jest już gotowy (run() generuje go między klatkami),
+        # a jeśli nie zdążył (np. headless) - brakujący kawałek powstaje teraz
+        level.fill(distance + LEVEL_LOOKAHEAD)
+        
+        enemy_waiting = False
+        for event in level.timeline.pop_due(distance):
+            event_distance, kind, lane, variant, y, extra = event
+            # Obiekt pojawia się tam, gdzie byłby dokładnie na swoim dystansie
+            # (świat przesunął się o "late" od tego momentu)
+            late = distance - event_distance
             
-            self.last_coin_distance = self.distance_pixels
-        
-        # -----------------------------------------
-        # POWERUPY
-        # -----------------------------------------
-        if self.distance_pixels - self.last_powerup_distance > POWERUP_SPAWN_DISTANCE:
-            # Losowa szansa
-            if random.random() < POWERUP_SPAWN_CHANCE:
-                rope_index = random.randint(0, NUM_ROPES - 1)
-                
-                # Losowy typ
-                powerup_type = random.choice(['invincible', 'double_points'])
-                
-                powerup = PowerUp(rope_index, -POWERUP_SIZE, powerup_type, self.sprite_manager)
-                self.powerups.append(powerup)
+            if kind == SPAWN_COIN:
+                # Nie za dużo monet na raz (nadmiarowa moneta przepada)
+                if len(self.coins) < MAX_COINS_ON_SCREEN:
+                    coin = self.coin_pool.acquire()
+                    coin.spawn(lane, y + late, self.sprite_manager,
+                               self.coin_store, self.lane_geometry)
             
-            self.last_powerup_distance = self.distance_pixels
-        
-        # -----------------------------------------
-        # PRZESZKODY
-        # -----------------------------------------
-        self.obstacle_manager.try_spawn(self.distance_pixels, self.sprite_manager)
-        
-        # -----------------------------------------
-        # PRZECIWNICY
-        # -----------------------------------------
-        self.enemy_manager.try_spawn(self.distance_pixels, self.sprite_manager)
+            elif kind == SPAWN_POWERUP:
+                powerup = self.powerup_pool.acquire()
+                powerup.spawn(lane, y + late, POWERUP_TYPES[variant],
+                              self.sprite_manager, self.powerup_store,
+                              self.lane_geometry)
+            
+            elif kind == SPAWN_BAT:
+                self.obstacle_manager.spawn(lane, y + late, BAT_TYPES[variant],
+                                            extra, self.sprite_manager)
+            
+            else:
+                # Przeciwnicy wjeżdżają w ekran - bez przesunięcia o "late".
+                # Przy komplecie na ekranie przeciwnik czeka na wolne miejsce
+                # (wraca na oś czasu i pojawi się w pierwszej wolnej klatce) -
+                # czeka najwyżej jeden, kolejne w tym czasie przepadają
+                spawned = self.enemy_manager.spawn(y, ENEMY_SIDES[lane], bool(variant),
+                                                   self.sprite_manager)
+                if not spawned and not enemy_waiting:
+                    level.timeline.push(event)
+                    enemy_waiting = True
 
     def update(self):
         """Główna pętla logiki - wywoływana co klatkę."""
@@ -172,9 +308,22 @@ class Game:
         # -----------------------------------------
         # STEROWANIE GRACZA
         # -----------------------------------------
-        keys = pygame.key.get_pressed()
+        profiler = self.profiler
+        t = profiler.now()
+        
+        # Stan sprzed klatki - do cofania
+        if self.rewind_buffer is not None:
+            self.rewind_buffer.push(self.snapshot())
+            t = profiler.record('rewind', t)
+        
+        keys = self.input_source.get_keys()
+        if self.recorder:
+            self.recorder.record(keys)
         self.player.handle_input(keys, self.ropes)
         self.player.update()
+        t = profiler.record('input', t)
+        
+        self.frame_count += 1
         
         # -----------------------------------------
         # AKTUALIZUJ LINY
@@ -193,66 +342,86 @@ class Game:
         # ZWIĘKSZ DYSTANS
         # -----------------------------------------
         self.distance_pixels += self.scroll_speed
+        self.last_scroll_step = self.scroll_speed
         
         # -----------------------------------------
         # AKTUALIZUJ OBIEKTY
         # -----------------------------------------
-        for coin in self.coins:
-            coin.update(self.scroll_speed)
-        
-        for powerup in self.powerups:
-            powerup.update(self.scroll_speed)
+        # Wszystkie monety / powerupy naraz (operacje na tablicach)
+        self.coin_store.scroll(self.scroll_speed)
+        self.coin_store.advance_animation()
+        self.powerup_store.scroll(self.scroll_speed)
+        t = profiler.record('world', t)
         
         self.obstacle_manager.update(self.scroll_speed)
+        t = profiler.record('obstacles', t)
         self.enemy_manager.update(self.scroll_speed)
+        t = profiler.record('enemies', t)
         
         # -----------------------------------------
         # SPAWNUJ NOWE OBIEKTY
         # -----------------------------------------
         self.spawn_objects()
+        t = profiler.record('spawn', t)
         
         # -----------------------------------------
         # USUŃ OBIEKTY POZA EKRANEM
         # -----------------------------------------
-        self.coins = [c for c in self.coins if not c.is_off_screen()]
-        self.powerups = [p for p in self.powerups if not p.is_off_screen()]
+        self.coin_store.cull(self.coin_pool.release)
+        self.powerup_store.cull(self.powerup_pool.release)
         
         # -----------------------------------------
         # KOLIZJE Z MONETAMI
         # -----------------------------------------
-        for coin in self.coins:
-            if coin.check_collision(self.player.hitbox, self.ropes):
+        # Sprawdzamy tylko obiekty z lin gracza, na wysokości jego hitboxa
+        hitbox = self.player.hitbox
+        lanes = self.player.get_lanes()
+        
+        nearby_coins = self.coin_store.query(lanes, hitbox.top - COIN_SIZE, hitbox.bottom)
+        for coin in nearby_coins:
+            if coin.check_collision(hitbox):
                 # Dodaj punkty
                 points = POINTS_PER_COIN
                 if self.double_points_active:
                     points *= 2
                 self.score += points
+                # Zebrana moneta od razu wraca do puli
+                self.coin_store.remove(coin.slot)
+                self.coin_pool.release(coin)
         
         # -----------------------------------------
         # KOLIZJE Z POWERUPAMI
         # -----------------------------------------
-        for powerup in self.powerups:
-            if powerup.check_collision(self.player.hitbox, self.ropes):
+        nearby_powerups = self.powerup_store.query(lanes, hitbox.top - POWERUP_SIZE, hitbox.bottom)
+        for powerup in nearby_powerups:
+            if powerup.check_collision(hitbox):
                 if powerup.type == 'invincible':
                     self.player.activate_invincibility()
                 elif powerup.type == 'double_points':
                     self.double_points_active = True
-                    self.double_points_timer = 300  # 5 sekund
+                    self.double_points_timer = DOUBLE_POINTS_FRAMES
+                self.powerup_store.remove(powerup.slot)
+                self.powerup_pool.release(powerup)
         
         # -----------------------------------------
         # KOLIZJE Z PRZESZKODAMI
         # -----------------------------------------
         if not self.player.invincible:
             # Sprawdź nietoperze
-            if self.obstacle_manager.check_collisions(self.player.hitbox, self.ropes):
+            if self.obstacle_manager.check_collisions(hitbox, lanes):
                 self.game_state = 'game_over'
+                self.death_cause = 'obstacle'
                 return
             
             # Sprawdź pociski
-            if self.enemy_manager.check_projectile_collisions(self.player.hitbox):
+            if self.enemy_manager.check_projectile_collisions(hitbox):
                 self.game_state = 'game_over'
+                self.death_cause = 'projectile'
                 return
         
+        # (krok kończący grę nie trafia do pomiaru kolizji - wychodzi wcześniej)
+        profiler.record('collisions', t)
+        
         # -----------------------------------------
         # TIMER PODWÓJNYCH PUNKTÓW
         # -----------------------------------------
@@ -284,127 +453,172 @@ class Game:
             # Nie przekraczaj maksimum
             self.scroll_speed = min(new_speed, MAX_SCROLL_SPEED)
 
-    def draw(self):
-        """Rysuje odpowiedni ekran."""
+    def snapshot(self):
+        """Zwraca cały stan rozgrywki jako bajty (patrz snapshot.py)."""
+        return snapshot(self)
+
+    def restore(self, data):
+        """Przywraca stan zapisany przez snapshot()."""
+        restore(self, data)
+
+    def rewind(self, frames=None):
+        """Cofa rozgrywkę o frames klatek (None = REWIND_STEP_FRAMES), o ile są w buforze."""
+        if frames is None:
+            frames = REWIND_STEP_FRAMES
+        if self.rewind_buffer:  # Włączony i niepusty
+            self.restore(self.rewind_buffer.rewind(frames))
+
+    def get_distance_meters(self):
+        """Zwraca przebyty dystans w metrach."""
+        return int(self.distance_pixels / PIXELS_PER_METER)
+
+    def get_total_score(self):
+        """Zwraca wynik: punkty za monety + punkty za dystans."""
+        return self.score + (self.get_distance_meters() * POINTS_PER_METER)
+
+    def draw(self, alpha=1.0):
+        """
+        Rysuje odpowiedni ekran.
+        
+        Parametry:
+            alpha - jak daleko jesteśmy między poprzednim a ostatnim krokiem
+                    symulacji (0.0-1.0); pozycje obiektów są interpolowane
+        """
+        # -----------------------------------------
+        # EKRANY STATYCZNE - rysuj tylko gdy coś się zmieniło
+        # -----------------------------------------
+        if self.game_state == 'menu':
+            screen_key = ('menu', self.sprite_manager.ready)
+        elif self.game_state == 'game_over':
+            screen_key = ('game_over', self.get_total_score(), self.get_distance_meters())
+        else:
+            screen_key = None
+        
+        if self.renderer and screen_key is not None and screen_key == self._static_screen_key:
+            self.renderer.present([])  # Nic się nie zmieniło
+            return
+        self._static_screen_key = screen_key
+        
+        profiler = self.profiler
+        
+        # -----------------------------------------
+        # RYSOWANIE
+        # -----------------------------------------
         if self.game_state == 'menu':
-            self.menu.draw_main_menu()
+            rects = [self.menu.draw_main_menu(loading=not self.sprite_manager.ready)]
         
         elif self.game_state == 'playing':
-            self.draw_game()
+            rects = self.draw_game(alpha)
+            if profiler.overlay_visible:
+                rects.append(profiler.draw_overlay(self.screen))
         
         elif self.game_state == 'game_over':
-            self.draw_game()  # Rysuj grę w tle
-            
             # Oblicz dystans i wynik końcowy
-            distance_meters = int(self.distance_pixels / PIXELS_PER_METER)
-            final_score = self.score + (distance_meters * POINTS_PER_METER)
+            distance_meters = self.get_distance_meters()
+            final_score = self.get_total_score()
             
-            self.menu.draw_game_over(final_score, distance_meters)
+            # Pod spodem zostaje zamrożona ostatnia klatka gry (zdjęcie
+            # robi menu) - nie rysujemy całej gry od nowa
+            rects = [self.menu.draw_game_over(final_score, distance_meters)]
         
         # Pokaż na ekranie
-        pygame.display.flip()
+        t = profiler.now()
+        if self.renderer:
+            self.renderer.present(rects)
+        else:
+            pygame.display.flip()
+        profiler.record('present', t)
 
-    def draw_game(self):
-        """Rysuje ekran gry."""
+    def draw_game(self, alpha=1.0):
+        """
+        Rysuje ekran gry. Zwraca listę zamalowanych prostokątów.
+        
+        Parametry:
+            alpha - postęp między krokami symulacji (1.0 = ostatni krok)
+        """
+        # Świat w poprzednim kroku był wyżej o last_scroll_step,
+        # więc cofamy go o brakującą część kroku
+        offset_y = (alpha - 1.0) * self.last_scroll_step
+        profiler = self.profiler
+        t = profiler.now()
+        
         # -----------------------------------------
         # TŁO
         # -----------------------------------------
         background = self.sprite_manager.get_sprite('background')
-        self.screen.blit(background, (0, self.background_y))
-        self.screen.blit(background, (0, self.background_y - BACKGROUND_HEIGHT))
+        background_y = self.background_y + offset_y * 0.5
+        if background_y < 0:
+            background_y += BACKGROUND_HEIGHT
+        rects = [
+            self.screen.blit(background, (0, background_y)),
+            self.screen.blit(background, (0, background_y - BACKGROUND_HEIGHT)),
+        ]
+        t = profiler.record('draw.background', t)
         
         # -----------------------------------------
         # LINY
         # -----------------------------------------
         for rope in self.ropes:
-            rope.draw(self.screen)
+            rects.append(rope.draw(self.screen, offset_y))
+        t = profiler.record('draw.ropes', t)
         
         # -----------------------------------------
         # MONETY
         # -----------------------------------------
         for coin in self.coins:
-            coin.draw(self.screen, self.ropes)
+            rects.append(coin.draw(self.screen, offset_y))
         
         # -----------------------------------------
         # POWERUPY
         # -----------------------------------------
         for powerup in self.powerups:
-            powerup.draw(self.screen, self.ropes)
+            rects.append(powerup.draw(self.screen, offset_y))
+        t = profiler.record('draw.items', t)
         
         # -----------------------------------------
         # PRZESZKODY
         # -----------------------------------------
-        self.obstacle_manager.draw(self.screen, self.ropes)
+        rects.extend(self.obstacle_manager.draw(self.screen, offset_y))
+        t = profiler.record('draw.obstacles', t)
         
         # -----------------------------------------
         # PRZECIWNICY I POCISKI
         # -----------------------------------------
-        self.enemy_manager.draw(self.screen)
+        rects.extend(self.enemy_manager.draw(self.screen, alpha))
+        t = profiler.record('draw.enemies', t)
         
         # -----------------------------------------
         # GRACZ
         # -----------------------------------------
-        self.player.draw(self.screen)
+        rects.append(self.player.draw(self.screen, alpha))
+        t = profiler.record('draw.player', t)
         
         # -----------------------------------------
         # INTERFEJS (UI)
         # -----------------------------------------
-        self.draw_ui()
+        rects.extend(self.draw_ui())
+        profiler.record('draw.hud', t)
+        
+        return rects
 
     def draw_ui(self):
-        """Rysuje interfejs użytkownika (punkty, dystans, powerupy)."""
-        # Oblicz aktualne wartości
-        distance_meters = int(self.distance_pixels / PIXELS_PER_METER)
-        total_score = self.score + (distance_meters * POINTS_PER_METER)
-        
-        # -----------------------------------------
-        # PUNKTY
-        # -----------------------------------------
-        score_text = self.font.render(f"Punkty: {total_score}", True, WHITE)
-        
-        # Tło dla tekstu (żeby było czytelne)
-        bg_rect = pygame.Rect(5, 5, score_text.get_width() + 10, score_text.get_height() + 5)
-        pygame.draw.rect(self.screen, BLACK, bg_rect)
-        pygame.draw.rect(self.screen, WHITE, bg_rect, 2)
-        
-        self.screen.blit(score_text, (10, 10))
-        
-        # -----------------------------------------
-        # DYSTANS
-        # -----------------------------------------
-        dist_text = self.small_font.render(f"Dystans: {distance_meters} m", True, WHITE)
-        
-        bg_rect = pygame.Rect(5, 45, dist_text.get_width() + 10, dist_text.get_height() + 5)
-        pygame.draw.rect(self.screen, BLACK, bg_rect)
-        pygame.draw.rect(self.screen, WHITE, bg_rect, 2)
-        
-        self.screen.blit(dist_text, (10, 48))
-        
-        # -----------------------------------------
-        # AKTYWNE POWERUPY
-        # -----------------------------------------
-        y = 85
-        
-        # Nieśmiertelność
-        if self.player.invincible:
-            text = self.small_font.render("NIESMIERTELNOSC!", True, WHITE)
-            
-            bg_rect = pygame.Rect(5, y - 2, text.get_width() + 10, text.get_height() + 5)
-            pygame.draw.rect(self.screen, PURPLE, bg_rect)
-            pygame.draw.rect(self.screen, WHITE, bg_rect, 2)
-            
-            self.screen.blit(text, (10, y))
-            y += 30
-        
-        # Podwójne punkty
-        if self.double_points_active:
-            text = self.small_font.render("PODWOJNE PUNKTY!", True, WHITE)
-            
-            bg_rect = pygame.Rect(5, y - 2, text.get_width() + 10, text.get_height() + 5)
-            pygame.draw.rect(self.screen, GREEN, bg_rect)
-            pygame.draw.rect(self.screen, WHITE, bg_rect, 2)
-            
-            self.screen.blit(text, (10, y))
+        """
+        Rysuje interfejs użytkownika (punkty, dystans, powerupy).
+        Zwraca listę zamalowanych prostokątów.
+        """
+        return self.hud.draw(
+            self.screen,
+            self.get_total_score(),
+            self.get_distance_meters(),
+            self.player.invincible,
+            self.double_points_active
+        )
+
+    def start_game(self):
+        """Zaczyna nową rozgrywkę (grafiki muszą być już załadowane)."""
+        self.start_requested = False
+        self.game_state = 'playing'
+        self.reset_game()
 
     def handle_events(self):
         """
@@ -418,12 +632,17 @@ class Game:
             
             # Naciśnięcie klawisza
             if event.type == pygame.KEYDOWN:
+                # F3 - nakładka profilera (w każdym stanie gry)
+                if event.key == pygame.K_F3:
+                    self.profiler.toggle_overlay()
                 
                 # W MENU
                 if self.game_state == 'menu':
                     if event.key == pygame.K_SPACE:
-                        self.game_state = 'playing'
-                        self.reset_game()
+                        if self.sprite_manager.ready:
+                            self.start_game()
+                        else:
+                            self.start_requested = True
                     elif event.key == pygame.K_ESCAPE:
                         return False  # Wyjście z gry
                 
@@ -431,30 +650,86 @@ class Game:
                 elif self.game_state == 'playing':
                     if event.key == pygame.K_ESCAPE:
                         self.game_state = 'menu'
+                    elif event.key == pygame.K_BACKSPACE:
+                        self.rewind()
                 
                 # GAME OVER
                 elif self.game_state == 'game_over':
-                    if event.key == pygame.K_SPACE:
-                        self.game_state = 'playing'
-                        self.reset_game()
+                    if event.key == pygame.K_BACKSPACE:
+                        self.rewind()  # Wraca do gry sprzed przegranej
+                    elif event.key == pygame.K_SPACE:
+                        self.start_game()
                     elif event.key == pygame.K_ESCAPE:
                         self.game_state = 'menu'
         
         return True
 
     def run(self):
-        """Główna pętla gry - uruchamia wszystko."""
+        """
+        Główna pętla gry - uruchamia wszystko.
+        
+        Stały krok symulacji: zbieramy czas, który upłynął ("akumulator")
+        i wykonujemy tyle kroków update() po SIMULATION_STEP, ile się mieści.
+        Rysujemy raz na obieg pętli, interpolując pozycje między krokami.
+        Wolna klatka = mniej płynny obraz, ale gra nie zwalnia.
+        """
         running = True
+        accumulator = 0.0
+        
+        # Wyzeruj zegar, żeby czas ładowania nie trafił do akumulatora
+        self.clock.tick()
         
         while running:
+            # Ile czasu minęło od poprzedniej klatki
+            frame_time = self.clock.tick(MAX_RENDER_FPS) / 1000.0
+            
+            # Po długiej przerwie (np. przeciąganie okna) nie nadrabiamy
+            # setek kroków naraz - gra by się "zawiesiła" na liczeniu
+            accumulator += min(frame_time, MAX_FRAME_TIME)
+            
             # Obsłuż eventy
+            t = self.profiler.now()
             running = self.handle_events()
+            self.profiler.record('events', t)
             
-            # Aktualizuj logikę
-            self.update()
+            # Dokończ grafiki ładowane w tle (kawałek na klatkę)
+            if not self.sprite_manager.ready:
+                if self.sprite_manager.finish_loading() and self.start_requested:
+                    self.start_game()
             
-            # Narysuj wszystko
-            self.draw()
+            # Aktualizuj logikę stałymi krokami
+            while accumulator >= SIMULATION_STEP:
+                self.update()
+                accumulator -= SIMULATION_STEP
             
-            # Ogranicz do 60 FPS
-            self.clock.tick(FPS)
+            # Narysuj wszystko (z interpolacją między krokami)
+            self.draw(accumulator / SIMULATION_STEP)
+            
+            # Wolny czas do następnej klatki: kawałek świata na zapas
+            # (wtedy spawn_objects() nie musi go generować w trakcie kroku)
+            if self.game_state == 'playing':
+                if self.level.horizon < self.distance_pixels + LEVEL_LOOKAHEAD + LEVEL_CHUNK_DISTANCE:
+                    self.level.generate_chunk()
+
+    def run_headless(self, max_frames):
+        """
+        Symulacja bez okna - liczy klatki tak szybko jak się da.
+        
+        Gra startuje od razu (bez menu) i kończy się po max_frames klatkach
+        albo wcześniej, gdy gracz przegra.
+        
+        Zwraca słownik ze statystykami rozgrywki.
+        """
+        self.game_state = 'playing'
+        self.reset_game()
+        
+        while self.frame_count < max_frames and self.game_state == 'playing':
+            self.update()
+        
+        return {
+            'frames': self.frame_count,
+            'game_over': self.game_state == 'game_over',
+            'distance_m': self.get_distance_meters(),
+            'score': self.get_total_score(),
+            'death_cause': self.death_cause,
+        }
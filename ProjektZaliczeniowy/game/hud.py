@@ -0,0 +1,166 @@
+"""
+HUGO - Interfejs w grze (HUD)
+=============================
+Punkty, dystans i paski aktywnych powerupów.
+
+Renderowanie tekstu czcionką (font.render) jest drogie, a wartości
+zmieniają się tylko kilka razy na sekundę. Dlatego:
+- każdy panel składamy w gotowy obrazek i rysujemy JEDNYM blitem,
+- panel składamy od nowa tylko gdy zmieni się jego wartość,
+- cyfry bierzemy z gotowego paska "0123456789" (bez renderowania czcionką),
+- tła paneli (prostokąt z ramką) są zapamiętywane dla każdego rozmiaru.
+"""
+import pygame
+from .config import *
+
+
+class GlyphStrip:
+    """
+    Pasek z gotowymi cyframi 0-9 jednej czcionki i koloru.
+    Liczbę rysujemy kopiując kolejne cyfry z paska.
+    """
+
+    DIGITS = "0123456789"
+
+    def __init__(self, font, color):
+        self.strip = font.render(self.DIGITS, True, color)
+        self.height = self.strip.get_height()
+
+        # Gdzie w pasku zaczyna się każda cyfra
+        self.areas = []
+        for i in range(len(self.DIGITS)):
+            start = font.size(self.DIGITS[:i])[0]
+            end = font.size(self.DIGITS[:i + 1])[0]
+            self.areas.append(pygame.Rect(start, 0, end - start, self.height))
+
+    def width(self, text):
+        """Szerokość liczby (podanej jako napis z cyfr) w pikselach."""
+        return sum(self.areas[ord(char) - 48].width for char in text)
+
+    def draw(self, surface, text, x, y):
+        """Rysuje liczbę (napis z cyfr) i zwraca x za ostatnią cyfrą."""
+        for char in text:
+            area = self.areas[ord(char) - 48]
+            surface.blit(self.strip, (x, y), area)
+            x += area.width
+        return x
+
+
+class HudPanel:
+    """
+    Pojedynczy panel HUD: tło z ramką + tekst "przedrostek liczba przyrostek".
+    Panel bez cyfr (digits=None) to stały napis, np. pasek powerupa.
+    """
+
+    def __init__(self, hud, font, prefix, suffix='', digits=None,
+                 bg_color=None, text_offset=(5, 5)):
+        """
+        Parametry:
+            hud - HUD (wspólna pamięć teł)
+            font - czcionka napisów
+            prefix, suffix - stały tekst przed i za liczbą
+            digits - GlyphStrip z cyframi (None = panel bez liczby)
+            bg_color - kolor tła panelu (None = BLACK)
+            text_offset - gdzie w panelu zaczyna się tekst
+        """
+        self.hud = hud
+        self.digits = digits
+        self.bg_color = BLACK if bg_color is None else bg_color
+        self.text_offset = text_offset
+
+        # Stałe fragmenty tekstu renderujemy raz
+        self.prefix = font.render(prefix, True, WHITE)
+        self.suffix = font.render(suffix, True, WHITE) if suffix else None
+        self.text_height = font.get_height()
+
+        self._value = None
+        self._surface = None if digits else self._compose('')
+
+    def _compose(self, number):
+        """Składa obrazek panelu dla podanej liczby (napisu z cyfr)."""
+        text_width = self.prefix.get_width()
+        if self.digits:
+            text_width += self.digits.width(number)
+        if self.suffix:
+            text_width += self.suffix.get_width()
+
+        size = (text_width + 10, self.prefix.get_height() + 5)
+        surface = self.hud.get_background(size, self.bg_color).copy()
+
+        x, y = self.text_offset
+        surface.blit(self.prefix, (x, y))
+        x += self.prefix.get_width()
+        if self.digits:
+            x = self.digits.draw(surface, number, x, y)
+        if self.suffix:
+            surface.blit(self.suffix, (x, y))
+        return surface
+
+    def draw(self, screen, position, value=None):
+        """Rysuje panel (składa go od nowa tylko gdy zmieniła się wartość)."""
+        if self.digits and value != self._value:
+            self._value = value
+            self._surface = self._compose(str(value))
+        return screen.blit(self._surface, position)
+
+
+class HUD:
+    """
+    Warstwa interfejsu w grze.
+    """
+
+    def __init__(self, font, small_font):
+        """
+        Parametry:
+            font - czcionka punktów
+            small_font - czcionka dystansu i pasków powerupów
+        """
+        # Tła paneli: (rozmiar, kolor) -> obrazek z ramką
+        self._backgrounds = {}
+
+        self.score_panel = HudPanel(self, font, "Punkty: ",
+                                    digits=GlyphStrip(font, WHITE),
+                                    text_offset=(5, 5))
+        self.distance_panel = HudPanel(self, small_font, "Dystans: ", " m",
+                                       digits=GlyphStrip(small_font, WHITE),
+                                       text_offset=(5, 3))
+        self.invincible_panel = HudPanel(self, small_font, "NIESMIERTELNOSC!",
+                                         bg_color=PURPLE, text_offset=(5, 2))
+        self.double_points_panel = HudPanel(self, small_font, "PODWOJNE PUNKTY!",
+                                            bg_color=GREEN, text_offset=(5, 2))
+
+    def get_background(self, size, color):
+        """Zwraca tło panelu (wypełnienie + biała ramka), tworzy je raz."""
+        key = (size, color)
+        background = self._backgrounds.get(key)
+        if background is None:
+            background = pygame.Surface(size).convert()
+            background.fill(color)
+            pygame.draw.rect(background, WHITE, background.get_rect(), 2)
+            self._backgrounds[key] = background
+        return background
+
+    def draw(self, screen, total_score, distance_meters, invincible, double_points):
+        """
+        Rysuje HUD. Zwraca listę zamalowanych prostokątów.
+
+        Parametry:
+            total_score - wynik do pokazania
+            distance_meters - przebyty dystans
+            invincible - czy aktywna nieśmiertelność
+            double_points - czy aktywne podwójne punkty
+        """
+        rects = [
+            self.score_panel.draw(screen, (5, 5), total_score),
+            self.distance_panel.draw(screen, (5, 45), distance_meters),
+        ]
+
+        # Aktywne powerupy - jeden pod drugim
+        y = 85
+        if invincible:
+            rects.append(self.invincible_panel.draw(screen, (5, y - 2)))
+            y += 30
+        if double_points:
+            rects.append(self.double_points_panel.draw(screen, (5, y - 2)))
+
+        return rects
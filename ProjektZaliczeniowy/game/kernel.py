@@ -0,0 +1,555 @@
+"""
+HUGO - Jądro symulacji wielu gier naraz (NumPy)
+===============================================
+GameKernel trzyma stan K gier w tablicach NumPy (jeden wiersz = jedna gra)
+i przesuwa wszystkie gry o jedną klatkę naraz: sterowanie, przesuwanie
+świata, przeciwnicy, spawn, kolizje i trudność to operacje na całych
+tablicach - bez obiektów i pętli po grach w Pythonie.
+
+Wynik jest DOKŁADNIE taki sam jak w Game (tryb headless) przy tym samym
+ziarnie i tym samym sterowaniu - ta sama kolejność kroków, te same
+zaokrąglenia prostokątów pygame (int() przy Y obiektów, zaokrąglanie
+przy Y pocisków) i te same losowania.
+
+Losowość:
+Układ świata każdej gry daje ten sam LevelGenerator co w Game (level.py) -
+generatory pracują w Pythonie, ale tylko dla gier, w których przyszedł czas
+na nowy obiekt (zwykle kilka na klatkę). Strzały przeciwników losuje
+strumień random.Random(ziarno) - dokładnie ten, którego używa Game.rng.
+Generator Pythona to MT19937, więc jego stan przenosimy do
+numpy.random.MT19937 i z góry generujemy bufor 32-bitowych słów dla każdej
+gry. random() liczymy z dwóch takich słów tak jak Python, więc losowanie
+dla wielu gier naraz to odczyt z tablicy.
+
+Użycie:
+    kernel = GameKernel(seeds=range(1000))
+    while kernel.playing.any():
+        kernel.step(actions)          # maski klawiszy, po jednej na grę
+    kernel.total_scores(), kernel.distance_meters()
+
+Gra, która się skończyła, stoi w miejscu (playing = False) - jej wynik,
+dystans i przyczyna końca (death_cause) się nie zmieniają.
+"""
+import random
+import numpy as np
+from .config import *
+from .controls import KEY_UP, KEY_DOWN, KEY_LEFT, KEY_RIGHT
+from .player import player_hitbox
+from .level import LevelGenerator, SPAWN_COIN, SPAWN_POWERUP, SPAWN_BAT, SPAWN_ENEMY
+
+# Przyczyny końca gry (kolumna death_cause)
+CAUSE_NONE = 0
+CAUSE_OBSTACLE = 1
+CAUSE_PROJECTILE = 2
+
+
+def _round_half_away(values):
+    """Zaokrąglenie jak przy ustawianiu pola pygame.Rect (x.5 - od zera)."""
+    return np.where(values >= 0, np.floor(values + 0.5), np.ceil(values - 0.5))
+
+
+class RandomStreams:
+    """
+    K strumieni losowości identycznych z random.Random(ziarno).
+
+    Wszystkie metody dostają tablicę numerów gier (bez powtórzeń) i zwracają
+    po jednej wylosowanej wartości dla każdej z nich.
+    """
+
+    def __init__(self, seeds, buffer_words=None):
+        """
+        Parametry:
+            seeds - ziarna gier (jak dla random.Random)
+            buffer_words - ile słów 32-bitowych trzymać naraz dla każdej gry
+                           (None = KERNEL_RANDOM_BUFFER)
+        """
+        if buffer_words is None:
+            buffer_words = KERNEL_RANDOM_BUFFER
+        self.buffer_words = buffer_words
+        self.generators = []
+        self.words = np.empty((len(seeds), buffer_words), dtype=np.uint32)
+        self.cursor = np.zeros(len(seeds), dtype=np.int64)
+
+        for i, seed in enumerate(seeds):
+            # Stan MT19937 Pythona: 624 słowa + pozycja
+            state = random.Random(seed).getstate()[1]
+            generator = np.random.MT19937()
+            generator.state = {
+                'bit_generator': 'MT19937',
+                'state': {'key': np.array(state[:624], dtype=np.uint32), 'pos': state[624]},
+            }
+            self.generators.append(generator)
+            self.words[i] = generator.random_raw(buffer_words)
+
+    def _refill(self, games):
+        """Dokłada nowe słowa graczom, którym kończy się bufor."""
+        size = self.buffer_words
+        for game in games.tolist():
+            used = int(self.cursor[game])
+            self.words[game, :size - used] = self.words[game, used:]
+            self.words[game, size - used:] = self.generators[game].random_raw(used)
+            self.cursor[game] = 0
+
+    def _take(self, games):
+        """Zwraca następne słowo 32-bitowe każdej gry."""
+        cursor = self.cursor[games]
+        empty = cursor >= self.buffer_words
+        if empty.any():
+            self._refill(games[empty])
+            cursor = self.cursor[games]
+        self.cursor[games] = cursor + 1
+        return self.words[games, cursor]
+
+    def random(self, games):
+        """random.random() - liczba z [0, 1)."""
+        a = (self._take(games) >> 5).astype(np.float64)
+        b = (self._take(games) >> 6).astype(np.float64)
+        return (a * 67108864.0 + b) * (1.0 / 9007199254740992.0)
+
+
+class SlotTable:
+    """
+    Obiekty jednego rodzaju we wszystkich grach: tablice [gra, slot]
+    + kolumna alive (czy slot jest zajęty). Pojemność rośnie w razie potrzeby.
+    """
+
+    def __init__(self, num_games, capacity, **columns):
+        """
+        Parametry:
+            num_games - liczba gier
+            capacity - początkowa liczba slotów na grę
+            columns - nazwa kolumny -> typ NumPy
+        """
+        self.columns = dict(columns, alive=np.bool_)
+        for name, dtype in self.columns.items():
+            setattr(self, name, np.zeros((num_games, capacity), dtype=dtype))
+
+    def _grow(self):
+        """Podwaja liczbę slotów."""
+        for name in self.columns:
+            old = getattr(self, name)
+            new = np.zeros((old.shape[0], old.shape[1] * 2), dtype=old.dtype)
+            new[:, :old.shape[1]] = old
+            setattr(self, name, new)
+
+    def allocate(self, games):
+        """Zajmuje pierwszy wolny slot w każdej z gier. Zwraca numery slotów."""
+        alive = self.alive[games]
+        if alive.all(axis=1).any():
+            self._grow()
+            alive = self.alive[games]
+        slots = alive.argmin(axis=1)
+        self.alive[games, slots] = True
+        return slots
+
+    def count(self):
+        """Liczba zajętych slotów w każdej grze."""
+        return self.alive.sum(axis=1)
+
+    def compact(self):
+        """Przesuwa zajęte sloty na początek, bez zmiany ich kolejności."""
+        order = np.argsort(~self.alive, axis=1, kind='stable')
+        for name in self.columns:
+            setattr(self, name, np.take_along_axis(getattr(self, name), order, axis=1))
+
+
+class GameKernel:
+    """
+    K gier HUGO liczonych krok w krok w tablicach NumPy.
+    """
+
+    def __init__(self, seeds):
+        """
+        Parametry:
+            seeds - ziarna gier (jak Game(seed=...)); liczba ziaren = liczba gier
+        """
+        seeds = [int(seed) for seed in seeds]
+        count = len(seeds)
+        self.num_games = count
+        self.seeds = np.array(seeds, dtype=np.int64)
+        self.random = RandomStreams(seeds)
+        self.levels = [LevelGenerator(seed) for seed in seeds]
+
+        # -----------------------------------------
+        # GEOMETRIA (jak Game.reset_game i LaneGeometry)
+        # -----------------------------------------
+        rope_spacing = SCREEN_WIDTH // (NUM_ROPES + 1)
+        rope_x = np.array([rope_spacing * (i + 1) - ROPE_WIDTH // 2 for i in range(NUM_ROPES)])
+        centers = rope_x + ROPE_WIDTH // 2
+
+        self.player_target_x = centers - PLAYER_WIDTH // 2
+        (self.player_hitbox_dx, self.player_hitbox_dy,
+         self.player_hitbox_w, self.player_hitbox_h) = player_hitbox()
+
+        self.coin_x = centers - COIN_SIZE // 2
+        self.powerup_x = centers - POWERUP_SIZE // 2
+        self.bat_hitbox_size = int(OBSTACLE_SIZE * OBSTACLE_HITBOX_SCALE)
+        self.bat_hitbox_offset = (OBSTACLE_SIZE - self.bat_hitbox_size) // 2
+        self.bat_hitbox_x = centers - OBSTACLE_SIZE // 2 + self.bat_hitbox_offset
+
+        # -----------------------------------------
+        # STAN GIER
+        # -----------------------------------------
+        self.playing = np.ones(count, dtype=np.bool_)
+        self.death_cause = np.zeros(count, dtype=np.int8)
+        self.frame_count = np.zeros(count, dtype=np.int64)
+        self.score = np.zeros(count, dtype=np.int64)
+        self.distance = np.zeros(count, dtype=np.float64)
+        self.scroll_speed = np.full(count, SCROLL_SPEED, dtype=np.float64)
+
+        self.double_points = np.zeros(count, dtype=np.bool_)
+        self.double_points_timer = np.zeros(count, dtype=np.int64)
+
+        # Od jakiego dystansu gra ma coś do zrobienia w swoim generatorze
+        # poziomu (najbliższe zdarzenie albo koniec gotowego świata)
+        self.next_spawn = np.zeros(count, dtype=np.float64)
+
+        # -----------------------------------------
+        # GRACZ
+        # -----------------------------------------
+        self.player_x = np.full(count, self.player_target_x[1], dtype=np.int64)
+        self.player_y = np.full(count, PLAYER_START_Y, dtype=np.int64)
+        self.rope = np.ones(count, dtype=np.int64)
+        self.previous_rope = np.ones(count, dtype=np.int64)
+        self.moving = np.zeros(count, dtype=np.bool_)
+        self.target_x = self.player_x.copy()
+        self.move_cooldown = np.zeros(count, dtype=np.int64)
+        self.invincible = np.zeros(count, dtype=np.bool_)
+        self.invincible_timer = np.zeros(count, dtype=np.int64)
+
+        # -----------------------------------------
+        # OBIEKTY
+        # -----------------------------------------
+        self.coins = SlotTable(count, MAX_COINS_ON_SCREEN, y=np.float64, lane=np.int64)
+        self.powerups = SlotTable(count, 2, y=np.float64, lane=np.int64, kind=np.int8)
+        self.bats = SlotTable(count, 4, y=np.float64, lane=np.int64)
+        # Przeciwnicy w kolejności pojawienia się (ta sama kolejność losowań)
+        self.enemies = SlotTable(count, ENEMY_MAX_ON_SCREEN,
+                                 x=np.int64, y=np.float64, target_x=np.int64,
+                                 target_y=np.float64, from_bottom=np.bool_,
+                                 direction=np.int64, entered=np.bool_,
+                                 cooldown=np.int64, time=np.int64)
+        self.projectiles = SlotTable(count, 8, x=np.int64, y=np.float64, direction=np.int64)
+
+    # =========================================================================
+    # WYNIKI
+    # =========================================================================
+
+    def distance_meters(self):
+        """Przebyty dystans w metrach (jak Game.get_distance_meters)."""
+        return np.trunc(self.distance / PIXELS_PER_METER).astype(np.int64)
+
+    def total_scores(self):
+        """Wynik: monety + dystans (jak Game.get_total_score)."""
+        return self.score + self.distance_meters() * POINTS_PER_METER
+
+    # =========================================================================
+    # KROK SYMULACJI
+    # =========================================================================
+
+    def step(self, actions):
+        """
+        Przesuwa wszystkie trwające gry o jedną klatkę (jak Game.update).
+
+        Parametry:
+            actions - maski klawiszy (KEY_UP | KEY_LEFT ...), po jednej na grę
+        """
+        active = self.playing.copy()
+        if not active.any():
+            return
+        keys = np.asarray(actions, dtype=np.int64)
+
+        self._player_input(keys, active)
+        self.frame_count += active
+
+        # Świat przesuwa się tylko w trwających grach
+        speed = np.where(active, self.scroll_speed, 0.0)
+        self.distance += speed
+        self.coins.y += speed[:, None]
+        self.powerups.y += speed[:, None]
+        self.bats.y += speed[:, None]
+        self.bats.alive &= ~(self.bats.y > SCREEN_HEIGHT)
+
+        self._update_enemies(active, speed)
+        self._spawn(active)
+
+        self.coins.alive &= ~(self.coins.y > SCREEN_HEIGHT)
+        self.powerups.alive &= ~(self.powerups.y > SCREEN_HEIGHT)
+
+        survivors = self._collisions(active)
+
+        # Timer podwójnych punktów
+        timed = survivors & self.double_points
+        self.double_points_timer -= timed
+        self.double_points &= ~(timed & (self.double_points_timer <= 0))
+
+        # Trudność
+        faster = survivors & (self.distance > DIFFICULTY_START_DISTANCE)
+        level = (self.distance - DIFFICULTY_START_DISTANCE) // DIFFICULTY_INCREASE_INTERVAL
+        new_speed = np.minimum(SCROLL_SPEED + level * DIFFICULTY_SPEED_INCREASE, MAX_SCROLL_SPEED)
+        self.scroll_speed = np.where(faster, new_speed, self.scroll_speed)
+
+    def _player_input(self, keys, active):
+        """Sterowanie i ruch gracza (Player.handle_input + Player.update)."""
+        up = active & ((keys & KEY_UP) != 0)
+        down = active & ((keys & KEY_DOWN) != 0)
+        self.player_y += PLAYER_SPEED * (down.astype(np.int64) - up)
+        np.clip(self.player_y, PLAYER_MIN_Y, PLAYER_MAX_Y, out=self.player_y)
+
+        self.move_cooldown -= active & (self.move_cooldown > 0)
+        can_jump = active & ~self.moving & (self.move_cooldown == 0)
+
+        # Najpierw lewo, potem prawo - oba mogą zadziałać w jednej klatce
+        left = can_jump & ((keys & KEY_LEFT) != 0) & (self.rope > 0)
+        self._start_jump(left, -1)
+        right = can_jump & ((keys & KEY_RIGHT) != 0) & (self.rope < NUM_ROPES - 1)
+        self._start_jump(right, 1)
+
+        # Płynny ruch do środka nowej liny
+        moving = active & self.moving
+        distance = np.abs(self.player_x - self.target_x)
+        far = moving & (distance > PLAYER_JUMP_SNAP_DISTANCE)
+        step = np.minimum(PLAYER_JUMP_SPEED, distance) * np.sign(self.target_x - self.player_x)
+        self.player_x += np.where(far, step, 0)
+        arrived = moving & ~far
+        self.player_x[arrived] = self.target_x[arrived]
+        self.moving &= ~arrived
+
+        # Nieśmiertelność
+        protected = active & self.invincible
+        self.invincible_timer -= protected
+        self.invincible &= ~(protected & (self.invincible_timer <= 0))
+
+    def _start_jump(self, games, direction):
+        """Skok na sąsiednią linę w grach z maski games."""
+        self.previous_rope[games] = self.rope[games]
+        self.rope[games] += direction
+        self.move_cooldown[games] = PLAYER_JUMP_COOLDOWN
+        self.moving |= games
+        self.target_x[games] = self.player_target_x[self.rope[games]]
+
+    def _update_enemies(self, active, speed):
+        """Przeciwnicy: wjazd, przesuwanie, strzały i pociski (EnemyManager.update)."""
+        enemies = self.enemies
+        present = enemies.alive & active[:, None]
+        was_entered = enemies.entered & present
+
+        # Wjazd od dołu
+        rising = present & ~enemies.entered & enemies.from_bottom
+        enemies.y -= np.where(rising, ENEMY_ENTER_SPEED, 0)
+        arrived = rising & (enemies.y <= enemies.target_y)
+
+        # Wjazd z boku
+        sliding = present & ~enemies.entered & ~enemies.from_bottom
+        enemies.x += np.where(sliding, ENEMY_ENTER_SPEED * enemies.direction, 0)
+        arrived |= sliding & (((enemies.direction == 1) & (enemies.x >= enemies.target_x))
+                              | ((enemies.direction == -1) & (enemies.x <= enemies.target_x)))
+
+        enemies.y = np.where(arrived & enemies.from_bottom, enemies.target_y, enemies.y)
+        enemies.x = np.where(arrived & ~enemies.from_bottom, enemies.target_x, enemies.x)
+        enemies.entered |= arrived
+
+        # Już na ekranie: boczni jadą ze światem, wszyscy liczą czas
+        enemies.y += np.where(was_entered & ~enemies.from_bottom, speed[:, None], 0.0)
+        enemies.time += was_entered
+        enemies.cooldown -= present & (enemies.cooldown > 0)
+
+        # Strzały - po kolei, w kolejności przeciwników (kolejność losowań)
+        for slot in range(enemies.alive.shape[1]):
+            games = (present[:, slot] & enemies.entered[:, slot]
+                     & (enemies.cooldown[:, slot] == 0)).nonzero()[0]
+            if games.size == 0:
+                continue
+            chance = ENEMY_SHOOT_CHANCE + np.minimum(enemies.time[games, slot] / 500, 0.02)
+            shooters = games[self.random.random(games) < chance]
+            if shooters.size == 0:
+                continue
+            enemies.cooldown[shooters, slot] = ENEMY_SHOOT_COOLDOWN
+
+            direction = enemies.direction[shooters, slot]
+            projectiles = self.projectiles
+            slots = projectiles.allocate(shooters)
+            projectiles.x[shooters, slots] = (enemies.x[shooters, slot]
+                                              + np.where(direction == 1, ENEMY_WIDTH, 0))
+            projectiles.y[shooters, slots] = enemies.y[shooters, slot] + ENEMY_HEIGHT // 2
+            projectiles.direction[shooters, slots] = direction
+
+        # Pociski lecą (także te wystrzelone w tej klatce)
+        projectiles = self.projectiles
+        flying = projectiles.alive & active[:, None]
+        projectiles.x += np.where(flying, PROJECTILE_SPEED * projectiles.direction, 0)
+        projectiles.alive &= ~(flying & ((projectiles.x < -50)
+                                         | (projectiles.x > SCREEN_WIDTH + 50)))
+
+        # Przeciwnicy poza ekranem znikają (reszta zachowuje kolejność)
+        gone = present & (enemies.y > SCREEN_HEIGHT + 100)
+        if gone.any():
+            enemies.alive &= ~gone
+            enemies.compact()
+
+    def _spawn(self, active):
+        """Nowe obiekty ze zdarzeń generatorów poziomu (Game.spawn_objects)."""
+        games = (active & (self.distance >= self.next_spawn)).nonzero()[0]
+        if games.size == 0:
+            return
+
+        # Zdarzenia, na które przyszedł czas: rodzaj -> [(gra, lina, wariant, y)]
+        # (y obiektów na linach już z przesunięciem "late" jak w Game)
+        events = {SPAWN_COIN: [], SPAWN_POWERUP: [], SPAWN_BAT: [], SPAWN_ENEMY: []}
+        for game in games.tolist():
+            level = self.levels[game]
+            distance = self.distance[game]
+            level.fill(distance + LEVEL_LOOKAHEAD)
+            enemy_room = None
+            enemy_waiting = False
+            for event in level.timeline.pop_due(distance):
+                event_distance, kind, lane, variant, y, _ = event
+                if kind == SPAWN_ENEMY:
+                    # Komplet przeciwników: jeden czeka na wolne miejsce, reszta przepada
+                    if enemy_room is None:
+                        enemy_room = ENEMY_MAX_ON_SCREEN - int(self.enemies.alive[game].sum())
+                    if enemy_room <= 0:
+                        if not enemy_waiting:
+                            level.timeline.push(event)
+                            enemy_waiting = True
+                        continue
+                    enemy_room -= 1
+                else:
+                    y += distance - event_distance
+                events[kind].append((game, lane, variant, y))
+            self.next_spawn[game] = min(level.timeline.next_distance(),
+                                        level.horizon - LEVEL_LOOKAHEAD)
+
+        for games, slots, lanes, _, y in self._place(self.coins, events[SPAWN_COIN],
+                                                     MAX_COINS_ON_SCREEN):
+            self.coins.y[games, slots] = y
+            self.coins.lane[games, slots] = lanes
+
+        for games, slots, lanes, kinds, y in self._place(self.powerups, events[SPAWN_POWERUP]):
+            self.powerups.y[games, slots] = y
+            self.powerups.lane[games, slots] = lanes
+            self.powerups.kind[games, slots] = kinds  # 0 - 'invincible', 1 - 'double_points'
+
+        for games, slots, lanes, _, y in self._place(self.bats, events[SPAWN_BAT]):
+            self.bats.y[games, slots] = y
+            self.bats.lane[games, slots] = lanes
+
+        for games, slots, sides, from_bottom, y in self._place(self.enemies, events[SPAWN_ENEMY]):
+            self._spawn_enemies(games, slots, sides == 0, from_bottom == 1, y)
+
+    def _place(self, table, events, limit=None):
+        """
+        Zajmuje sloty dla zdarzeń (gra, lina, wariant, y) w kolejności zdarzeń.
+        Zwraca porcje (gry, sloty, liny, warianty, y) - w jednej porcji każda
+        gra jest najwyżej raz. Z limitem: zdarzenie gry, która ma już limit
+        obiektów, przepada (jak monety w Game).
+        """
+        # k-te zdarzenie danej gry trafia do k-tej porcji
+        batches = []
+        seen = {}
+        for event in events:
+            k = seen.get(event[0], 0)
+            seen[event[0]] = k + 1
+            if k == len(batches):
+                batches.append([])
+            batches[k].append(event)
+
+        placed = []
+        for batch in batches:
+            games, lanes, variants, y = (np.array(column) for column in zip(*batch))
+            if limit is not None:
+                keep = table.alive[games].sum(axis=1) < limit
+                games, lanes, variants, y = games[keep], lanes[keep], variants[keep], y[keep]
+                if games.size == 0:
+                    continue
+            placed.append((games, table.allocate(games), lanes, variants, y))
+        return placed
+
+    def _spawn_enemies(self, games, slots, left, from_bottom, y):
+        """Przeciwnicy wjeżdżający od dołu albo z boku (Enemy.__init__)."""
+        enemies = self.enemies
+        enemies.x[games, slots] = np.where(
+            from_bottom, np.where(left, 50, SCREEN_WIDTH - ENEMY_WIDTH - 50),
+            np.where(left, -ENEMY_WIDTH, SCREEN_WIDTH))
+        enemies.y[games, slots] = np.where(from_bottom, SCREEN_HEIGHT + ENEMY_HEIGHT, y)
+        enemies.target_x[games, slots] = np.where(left, 50, SCREEN_WIDTH - ENEMY_WIDTH - 50)
+        enemies.target_y[games, slots] = SCREEN_HEIGHT - ENEMY_HEIGHT - 100
+        enemies.direction[games, slots] = np.where(left, 1, -1)
+        enemies.from_bottom[games, slots] = from_bottom
+        self._reset_enemies(games, slots)
+
+    def _reset_enemies(self, games, slots):
+        """Zeruje liczniki nowych przeciwników."""
+        enemies = self.enemies
+        enemies.entered[games, slots] = False
+        enemies.cooldown[games, slots] = 0
+        enemies.time[games, slots] = 0
+
+    def _collisions(self, active):
+        """
+        Zbieranie monet i powerupów, trafienia nietoperzy i pocisków.
+        Zwraca maskę gier, które trwają dalej.
+        """
+        hitbox_x = (self.player_x + self.player_hitbox_dx)[:, None]
+        hitbox_y = (self.player_y + self.player_hitbox_dy)[:, None]
+        hitbox_right = hitbox_x + self.player_hitbox_w
+        hitbox_bottom = hitbox_y + self.player_hitbox_h
+
+        def in_player_lanes(lanes):
+            # Player.get_lanes(): w trakcie skoku - obie liny
+            return ((lanes == self.rope[:, None])
+                    | (self.moving[:, None] & (lanes == self.previous_rope[:, None])))
+
+        def overlaps(x, y, width, height):
+            # pygame.Rect.colliderect
+            return ((x < hitbox_right) & (x + width > hitbox_x)
+                    & (y < hitbox_bottom) & (y + height > hitbox_y))
+
+        # -----------------------------------------
+        # MONETY
+        # -----------------------------------------
+        coins = self.coins
+        collected = (coins.alive & active[:, None] & in_player_lanes(coins.lane)
+                     & overlaps(self.coin_x[coins.lane], np.trunc(coins.y), COIN_SIZE, COIN_SIZE))
+        points = np.where(self.double_points, POINTS_PER_COIN * 2, POINTS_PER_COIN)
+        self.score += collected.sum(axis=1) * points
+        coins.alive &= ~collected
+
+        # -----------------------------------------
+        # POWERUPY
+        # -----------------------------------------
+        powerups = self.powerups
+        collected = (powerups.alive & active[:, None] & in_player_lanes(powerups.lane)
+                     & overlaps(self.powerup_x[powerups.lane], np.trunc(powerups.y),
+                                POWERUP_SIZE, POWERUP_SIZE))
+        shield = (collected & (powerups.kind == 0)).any(axis=1)
+        self.invincible |= shield
+        self.invincible_timer[shield] = INVINCIBILITY_FRAMES
+        double = (collected & (powerups.kind == 1)).any(axis=1)
+        self.double_points |= double
+        self.double_points_timer[double] = DOUBLE_POINTS_FRAMES
+        powerups.alive &= ~collected
+
+        # -----------------------------------------
+        # NIETOPERZE I POCISKI
+        # -----------------------------------------
+        vulnerable = active & ~self.invincible
+        bats = self.bats
+        size = self.bat_hitbox_size
+        hit_bat = vulnerable & (bats.alive & in_player_lanes(bats.lane)
+                                & overlaps(self.bat_hitbox_x[bats.lane],
+                                           np.trunc(bats.y) + self.bat_hitbox_offset,
+                                           size, size)).any(axis=1)
+
+        projectiles = self.projectiles
+        size = PROJECTILE_RADIUS * 2
+        hit_projectile = vulnerable & ~hit_bat & (projectiles.alive
+                                                  & overlaps(projectiles.x - PROJECTILE_RADIUS,
+                                                             _round_half_away(projectiles.y - PROJECTILE_RADIUS),
+                                                             size, size)).any(axis=1)
+
+        self.death_cause[hit_bat] = CAUSE_OBSTACLE
+        self.death_cause[hit_projectile] = CAUSE_PROJECTILE
+        dead = hit_bat | hit_projectile
+        self.playing &= ~dead
+        return active & ~dead
@@ -0,0 +1,53 @@
+"""
+HUGO - Geometria lin
+====================
+Monety, powerupy i nietoperze wiszą na środku liny, więc ich pozycja X
+i rozmiar zależą tylko od liny i rodzaju obiektu. Liny nie ruszają się
+w poziomie - po ustawieniu lin (reset_game) liczymy to raz:
+
+- wzór prostokąta do RYSOWANIA (x, rozmiar) dla każdej liny,
+- wzór HITBOXA (x, przesunięcie w dół, rozmiar) dla każdej liny.
+
+Obiekt przy spawn() kopiuje wzór do SWOICH prostokątów (tworzonych raz,
+razem z obiektem z puli), a potem co klatkę zmienia w nich tylko Y.
+"""
+import pygame
+from .config import *
+
+
+class LaneGeometry:
+    """
+    Wzory prostokątów obiektów dla każdej liny.
+
+    Każda lista (coin, powerup, obstacle) ma jeden wpis na linę:
+    (prostokąt do rysowania, hitbox). W obu prostokątach Y to przesunięcie
+    względem Y obiektu (dla prostokąta do rysowania zawsze 0).
+    """
+
+    def __init__(self, ropes):
+        """
+        Parametry:
+            ropes - lista lin (Rope) po ustawieniu w reset_game
+        """
+        centers = [rope.x + ROPE_WIDTH // 2 for rope in ropes]
+
+        self.coin = self._build(centers, COIN_SIZE)
+        self.powerup = self._build(centers, POWERUP_SIZE)
+        self.obstacle = self._build(centers, OBSTACLE_SIZE, OBSTACLE_HITBOX_SCALE)
+
+    @staticmethod
+    def _build(centers, size, hitbox_scale=1.0):
+        """Wzory dla obiektu o rozmiarze size (hitbox = size * hitbox_scale)."""
+        # Hitbox jest wyśrodkowany w obrazku
+        hitbox_size = int(size * hitbox_scale)
+        offset = (size - hitbox_size) // 2
+
+        templates = []
+        for center in centers:
+            # Środek liny minus połowa rozmiaru obiektu
+            x = center - size // 2
+            templates.append((
+                pygame.Rect(x, 0, size, size),
+                pygame.Rect(x + offset, offset, hitbox_size, hitbox_size),
+            ))
+        return templates
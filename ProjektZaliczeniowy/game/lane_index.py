@@ -0,0 +1,55 @@
+"""
+HUGO - Indeks obiektów na linach
+================================
+Do kolizji z graczem wystarczy sprawdzić obiekty:
+- na linie gracza (i linie, z której właśnie skacze),
+- w pasie wysokości, w którym jest hitbox gracza.
+
+Dla każdej liny trzymamy listę obiektów posortowaną po pozycji Y.
+Wszystkie obiekty w magazynie jadą w dół z tą samą prędkością, więc
+zamiast Y na ekranie zapisujemy "Y w świecie" (Y minus dotychczasowe
+przesunięcie świata) - ta wartość się nie zmienia i lista nie wymaga
+ponownego sortowania. Zapytanie to dwa wyszukiwania binarne (bisect).
+"""
+from bisect import bisect_left, bisect_right
+
+
+class LaneIndex:
+    """
+    Posortowane po Y listy obiektów - osobna lista dla każdej liny.
+    """
+
+    def __init__(self, num_lanes):
+        # Dla każdej liny: posortowane klucze (Y w świecie) i obiekty
+        self.keys = [[] for _ in range(num_lanes)]
+        self.items = [[] for _ in range(num_lanes)]
+
+    def insert(self, lane, key, item):
+        """Dodaje obiekt na linę, z kluczem key (Y w świecie)."""
+        keys = self.keys[lane]
+        i = bisect_right(keys, key)
+        keys.insert(i, key)
+        self.items[lane].insert(i, item)
+
+    def remove(self, lane, key, item):
+        """Usuwa obiekt dodany wcześniej z tym samym kluczem."""
+        keys = self.keys[lane]
+        items = self.items[lane]
+        i = bisect_left(keys, key)
+        while items[i] is not item:
+            i += 1
+        del keys[i]
+        del items[i]
+
+    def query(self, lanes, key_min, key_max):
+        """
+        Zwraca obiekty z podanych lin, których klucz jest w [key_min, key_max].
+        """
+        found = []
+        for lane in lanes:
+            keys = self.keys[lane]
+            start = bisect_left(keys, key_min)
+            end = bisect_right(keys, key_max)
+            if start < end:
+                found.extend(self.items[lane][start:end])
+        return found
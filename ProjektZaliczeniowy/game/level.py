@@ -0,0 +1,159 @@
+"""
+HUGO - Generator poziomu (świat z wyprzedzeniem)
+================================================
+Zamiast co klatkę sprawdzać "czy już czas na monetę / nietoperze /
+przeciwnika?", generator układa świat z wyprzedzeniem - w kawałkach po
+LEVEL_CHUNK_DISTANCE pikseli dystansu. Kawałek to zdarzenia z DOKŁADNYM
+dystansem pojawienia się: monety, powerupy, nietoperze (całe wzorce)
+i wjazdy przeciwników. Zdarzenia trafiają do kopca (SpawnTimeline),
+a Game.update zdejmuje z niego tylko te, na które przyszedł czas -
+klatka bez nowych obiektów to jedno porównanie.
+
+Zdarzenie to krotka (dystans, rodzaj, lina, wariant, y, dodatek):
+
+    SPAWN_COIN     - lina, y startowe
+    SPAWN_POWERUP  - lina, wariant: indeks w POWERUP_TYPES, y startowe
+    SPAWN_BAT      - lina, wariant: indeks w BAT_TYPES, y startowe,
+                     dodatek: start animacji
+    SPAWN_ENEMY    - lina: strona (0 - lewa, 1 - prawa), wariant: 1 = od
+                     dołu, y: wysokość wjazdu z boku
+
+Losowość:
+Kawałek k ma własny generator random.Random("ziarno/k"), niezależny od
+Game.rng. Układ poziomu zależy więc tylko od ziarna rozgrywki - nie od
+tego, KIEDY kawałek powstał (w wolnym czasie między klatkami w Game.run
+albo od razu, gdy zabrakło), ani od gracza (zebrana moneta niczego nie
+przesuwa). Z kawałka na kawałek przechodzi tylko dystans następnej grupy
+nietoperzy i stan historii wzorców (patterns.py). Game.rng losuje
+już tylko to, co dzieje się w trakcie gry (strzały przeciwników).
+"""
+import heapq
+import math
+import random
+from .config import *
+from .patterns import difficulty_level, pattern_table
+
+# Rodzaje zdarzeń
+SPAWN_COIN = 0
+SPAWN_POWERUP = 1
+SPAWN_BAT = 2
+SPAWN_ENEMY = 3
+
+POWERUP_TYPES = ('invincible', 'double_points')
+BAT_TYPES = ('bat_1', 'bat_2')
+ENEMY_SIDES = ('left', 'right')
+
+
+def _cadence(start, end, step):
+    """Dystanse step, 2*step, ... leżące w przedziale [start, end)."""
+    distance = max(1, math.ceil(start / step)) * step
+    while distance < end:
+        yield distance
+        distance += step
+
+
+class SpawnTimeline:
+    """
+    Zdarzenia czekające na swój dystans - kopiec (heapq) posortowany
+    po dystansie.
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def __len__(self):
+        return len(self.events)
+
+    def push(self, event):
+        """Dodaje zdarzenie (krotka zaczynająca się od dystansu)."""
+        heapq.heappush(self.events, event)
+
+    def next_distance(self):
+        """Dystans najbliższego zdarzenia (inf, gdy nic nie czeka)."""
+        return self.events[0][0] if self.events else math.inf
+
+    def pop_due(self, distance):
+        """Zdejmuje i zwraca (po kolei) zdarzenia z dystansem <= distance."""
+        events = self.events
+        if not events or events[0][0] > distance:
+            return ()
+        due = []
+        while events and events[0][0] <= distance:
+            due.append(heapq.heappop(events))
+        return due
+
+
+class LevelGenerator:
+    """
+    Generuje kolejne kawałki świata do SpawnTimeline.
+    """
+
+    def __init__(self, seed):
+        """
+        Parametry:
+            seed - ziarno rozgrywki (Game.run_seed)
+        """
+        self.seed = seed
+        self.timeline = SpawnTimeline()
+        self.next_chunk = 0                          # Numer następnego kawałka
+        self.next_obstacle = MIN_OBSTACLE_DISTANCE   # Dystans następnej grupy nietoperzy
+        self.pattern_state = 0                       # Stan historii wzorców (0 = brak)
+        self.patterns = pattern_table()
+
+    @property
+    def horizon(self):
+        """Do jakiego dystansu świat jest już wygenerowany."""
+        return self.next_chunk * LEVEL_CHUNK_DISTANCE
+
+    def fill(self, distance):
+        """Generuje kawałki, aż świat będzie gotowy do dystansu distance."""
+        while self.horizon < distance:
+            self.generate_chunk()
+
+    def generate_chunk(self):
+        """Generuje następny kawałek i dodaje jego zdarzenia do osi czasu."""
+        rng = random.Random(f"{self.seed}/{self.next_chunk}")
+        start = self.horizon
+        end = start + LEVEL_CHUNK_DISTANCE
+        push = self.timeline.push
+        self.next_chunk += 1
+
+        # -----------------------------------------
+        # MONETY I POWERUPY (stały odstęp)
+        # -----------------------------------------
+        for distance in _cadence(start, end, COIN_SPAWN_DISTANCE):
+            push((distance, SPAWN_COIN, rng.randint(0, NUM_ROPES - 1), 0, -COIN_SIZE, 0))
+
+        for distance in _cadence(start, end, POWERUP_SPAWN_DISTANCE):
+            if rng.random() < POWERUP_SPAWN_CHANCE:
+                lane = rng.randint(0, NUM_ROPES - 1)
+                kind = rng.randrange(len(POWERUP_TYPES))
+                push((distance, SPAWN_POWERUP, lane, kind, -POWERUP_SIZE, 0))
+
+        # -----------------------------------------
+        # NIETOPERZE (wzorce z tablicy przejść)
+        # -----------------------------------------
+        patterns = self.patterns
+        while self.next_obstacle < end:
+            pattern = patterns.sample(rng, self.pattern_state,
+                                      difficulty_level(self.next_obstacle))
+            self.pattern_state = patterns.next_state[self.pattern_state][pattern]
+
+            for lane in OBSTACLE_PATTERNS[pattern][0]:
+                bat_type = rng.randrange(len(BAT_TYPES))
+                # Losowe przesunięcie Y (żeby nie były idealnie w linii)
+                y = -OBSTACLE_SIZE - 50 + rng.randint(-OBSTACLE_Y_VARIATION, OBSTACLE_Y_VARIATION)
+                # Losowy start animacji (żeby nie machały synchronicznie)
+                animation_start = rng.randint(0, 30)
+                push((self.next_obstacle, SPAWN_BAT, lane, bat_type, y, animation_start))
+
+            self.next_obstacle += rng.randint(MIN_OBSTACLE_DISTANCE, MAX_OBSTACLE_DISTANCE)
+
+        # -----------------------------------------
+        # PRZECIWNICY (od dołu albo z boku)
+        # -----------------------------------------
+        for distance in _cadence(start, end, ENEMY_SPAWN_DISTANCE):
+            from_bottom = rng.random() < ENEMY_FROM_BOTTOM_CHANCE
+            side = rng.randrange(len(ENEMY_SIDES))
+            y = 0 if from_bottom else rng.randint(100, 400)
+            push((distance, SPAWN_ENEMY, side, int(from_bottom), y, 0))
@@ -3,6 +3,11 @@ HUGO - Menu Gry
 ===============
 Ekran startowy i ekran Game Over.
 Proste i czytelne menu.
+
+Oba ekrany są statyczne - składamy je RAZ w gotowy obrazek i potem
+w każdej klatce tylko go kopiujemy (jeden blit zamiast renderowania
+wszystkich napisów). Ekran Game Over zamraża ostatnią klatkę rozgrywki
+zamiast rysować całą grę pod spodem od nowa.
 """
 import pygame
 from .config import *
@@ -28,34 +33,60 @@ class Menu:
         self.title_font = pygame.font.Font(None, 80)
         self.header_font = pygame.font.Font(None, 36)
         self.text_font = pygame.font.Font(None, 28)
+        
+        # Gotowe ekrany (None = trzeba złożyć od nowa)
+        self._main_menu_surface = None
+        self._main_menu_loading = None  # Czy gotowe menu pokazuje "ładowanie"
+        self._game_over_surface = None
+        self._game_over_key = None  # (wynik, dystans) na gotowym ekranie
+
+    def invalidate_game_over(self):
+        """Zapomina gotowy ekran Game Over (np. po nowej rozgrywce)."""
+        self._game_over_surface = None
+        self._game_over_key = None
+
+    def draw_main_menu(self, loading=False):
+        """
+        Rysuje główne menu. Zwraca zamalowany prostokąt (cały ekran).
+        
+        Parametry:
+            loading - czy grafiki gry jeszcze się ładują (zamiast przycisku
+                      start pokazujemy napis o ładowaniu)
+        """
+        if self._main_menu_surface is None or self._main_menu_loading != loading:
+            self._main_menu_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            self._main_menu_loading = loading
+            self._compose_main_menu(self._main_menu_surface, loading)
+        
+        return self.screen.blit(self._main_menu_surface, (0, 0))
 
-    def draw_main_menu(self):
-        """Rysuje główne menu."""
+    def _compose_main_menu(self, surface, loading=False):
+        """Składa ekran głównego menu na podanym obrazku."""
         # -----------------------------------------
         # TŁO
         # -----------------------------------------
         background = self.sprite_manager.get_sprite('background')
-        self.screen.blit(background, (0, 0))
+        surface.blit(background, (0, 0))
         
         # Przyciemnienie żeby tekst był czytelny
         dark_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         dark_overlay.fill(BLACK)
         dark_overlay.set_alpha(180)  # Przezroczystość
-        self.screen.blit(dark_overlay, (0, 0))
+        surface.blit(dark_overlay, (0, 0))
         
         # -----------------------------------------
         # TYTUŁ
         # -----------------------------------------
         title = self.title_font.render("HUGO", True, YELLOW)
         title_x = SCREEN_WIDTH // 2 - title.get_width() // 2
-        self.screen.blit(title, (title_x, 80))
+        surface.blit(title, (title_x, 80))
         
         subtitle = self.header_font.render("Wspinaczka po Linach", True, WHITE)
         subtitle_x = SCREEN_WIDTH // 2 - subtitle.get_width() // 2
-        self.screen.blit(subtitle, (subtitle_x, 160))
+        surface.blit(subtitle, (subtitle_x, 160))
         
         # Linia dekoracyjna
-        pygame.draw.line(self.screen, YELLOW, (200, 210), (800, 210), 2)
+        pygame.draw.line(surface, YELLOW, (200, 210), (800, 210), 2)
         
         # -----------------------------------------
         # STEROWANIE
@@ -63,7 +94,7 @@ class Menu:
         y = 260
         
         header = self.header_font.render("STEROWANIE", True, YELLOW)
-        self.screen.blit(header, (150, y))
+        surface.blit(header, (150, y))
         y += 45
         
         controls = [
@@ -73,7 +104,7 @@ class Menu:
         ]
         for text in controls:
             rendered = self.text_font.render(text, True, WHITE)
-            self.screen.blit(rendered, (170, y))
+            surface.blit(rendered, (170, y))
             y += 35
         
         # -----------------------------------------
@@ -82,7 +113,7 @@ class Menu:
         y += 30
         
         header = self.header_font.render("CEL GRY", True, YELLOW)
-        self.screen.blit(header, (150, y))
+        surface.blit(header, (150, y))
         y += 45
         
         goals = [
@@ -92,7 +123,7 @@ class Menu:
         ]
         for text in goals:
             rendered = self.text_font.render(text, True, WHITE)
-            self.screen.blit(rendered, (170, y))
+            surface.blit(rendered, (170, y))
             y += 35
         
         # -----------------------------------------
@@ -101,75 +132,92 @@ class Menu:
         y += 30
         
         header = self.header_font.render("POWERUPY", True, YELLOW)
-        self.screen.blit(header, (150, y))
+        surface.blit(header, (150, y))
         y += 50
         
         # Fioletowy - nieśmiertelność
-        pygame.draw.rect(self.screen, PURPLE, (170, y, 35, 35))
-        pygame.draw.rect(self.screen, WHITE, (170, y, 35, 35), 2)
+        pygame.draw.rect(surface, PURPLE, (170, y, 35, 35))
+        pygame.draw.rect(surface, WHITE, (170, y, 35, 35), 2)
         text = self.text_font.render("Niesmiertelnosc (3 sek)", True, WHITE)
-        self.screen.blit(text, (220, y + 5))
+        surface.blit(text, (220, y + 5))
         y += 50
         
         # Zielony - podwójne punkty
-        pygame.draw.rect(self.screen, GREEN, (170, y, 35, 35))
-        pygame.draw.rect(self.screen, WHITE, (170, y, 35, 35), 2)
+        pygame.draw.rect(surface, GREEN, (170, y, 35, 35))
+        pygame.draw.rect(surface, WHITE, (170, y, 35, 35), 2)
         text = self.text_font.render("Podwojne punkty (5 sek)", True, WHITE)
-        self.screen.blit(text, (220, y + 5))
+        surface.blit(text, (220, y + 5))
         
         # -----------------------------------------
         # PRZYCISK START
         # -----------------------------------------
-        button_text = self.header_font.render("Nacisnij SPACJE aby grac", True, BLACK)
+        if loading:
+            button_text = self.header_font.render("Ladowanie grafik...", True, BLACK)
+        else:
+            button_text = self.header_font.render("Nacisnij SPACJE aby grac", True, BLACK)
         button_width = button_text.get_width() + 60
         button_height = 50
         button_x = SCREEN_WIDTH // 2 - button_width // 2
         button_y = 800
         
-        pygame.draw.rect(self.screen, YELLOW, (button_x, button_y, button_width, button_height))
-        pygame.draw.rect(self.screen, WHITE, (button_x, button_y, button_width, button_height), 3)
+        pygame.draw.rect(surface, YELLOW, (button_x, button_y, button_width, button_height))
+        pygame.draw.rect(surface, WHITE, (button_x, button_y, button_width, button_height), 3)
         
-        self.screen.blit(button_text, (button_x + 30, button_y + 12))
+        surface.blit(button_text, (button_x + 30, button_y + 12))
         
         # Info o ESC
         esc_text = self.text_font.render("ESC - Wyjscie", True, (150, 150, 150))
         esc_x = SCREEN_WIDTH // 2 - esc_text.get_width() // 2
-        self.screen.blit(esc_text, (esc_x, 870))
+        surface.blit(esc_text, (esc_x, 870))
 
     def draw_game_over(self, score, distance_meters):
         """
-        Rysuje ekran Game Over.
+        Rysuje ekran Game Over. Zwraca zamalowany prostokąt (cały ekran).
+        
+        Za pierwszym razem (albo po zmianie wyniku) robi zdjęcie tego,
+        co jest teraz na ekranie - czyli ostatniej klatki rozgrywki -
+        i składa na nim ekran Game Over.
         
         Parametry:
             score - wynik gracza
             distance_meters - przebyty dystans w metrach
         """
+        key = (score, distance_meters)
+        if self._game_over_surface is None or self._game_over_key != key:
+            self._game_over_surface = self.screen.copy()
+            self._game_over_key = key
+            self._compose_game_over(self._game_over_surface, score, distance_meters)
+        
+        return self.screen.blit(self._game_over_surface, (0, 0))
+
+    def _compose_game_over(self, surface, score, distance_meters):
+        """Składa ekran Game Over na podanym obrazku (zdjęciu gry)."""
         # Przyciemnienie
         dark_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         dark_overlay.fill(BLACK)
         dark_overlay.set_alpha(200)
-        self.screen.blit(dark_overlay, (0, 0))
+        surface.blit(dark_overlay, (0, 0))
         
         # GAME OVER
         title = self.title_font.render("GAME OVER", True, RED)
         title_x = SCREEN_WIDTH // 2 - title.get_width() // 2
-        self.screen.blit(title, (title_x, SCREEN_HEIGHT // 2 - 120))
+        surface.blit(title, (title_x, SCREEN_HEIGHT // 2 - 120))
         
         # Wynik
         score_text = self.header_font.render(f"Wynik: {score} pkt", True, WHITE)
         score_x = SCREEN_WIDTH // 2 - score_text.get_width() // 2
-        self.screen.blit(score_text, (score_x, SCREEN_HEIGHT // 2 - 30))
+        surface.blit(score_text, (score_x, SCREEN_HEIGHT // 2 - 30))
         
         # Dystans
         dist_text = self.text_font.render(f"Dystans: {distance_meters} m", True, WHITE)
         dist_x = SCREEN_WIDTH // 2 - dist_text.get_width() // 2
-        self.screen.blit(dist_text, (dist_x, SCREEN_HEIGHT // 2 + 20))
+        surface.blit(dist_text, (dist_x, SCREEN_HEIGHT // 2 + 20))
         
         # Opcje
         restart_text = self.header_font.render("SPACJA - Zagraj ponownie", True, YELLOW)
         restart_x = SCREEN_WIDTH // 2 - restart_text.get_width() // 2
-        self.screen.blit(restart_text, (restart_x, SCREEN_HEIGHT // 2 + 90))
+        surface.blit(restart_text, (restart_x, SCREEN_HEIGHT // 2 + 90))
         
         menu_text = self.text_font.render("ESC - Menu glowne", True, YELLOW)
         menu_x = SCREEN_WIDTH // 2 - menu_text.get_width() // 2
-        self.screen.blit(menu_text, (menu_x, SCREEN_HEIGHT // 2 + 140))
+        surface.blit(menu_text, (menu_x, SCREEN_HEIGHT // 2 + 140))
@@ -3,10 +3,18 @@ HUGO - System Przeszkód (Nietoperze)
 ====================================
 Nietoperze pojawiają się według WZORCÓW (patterns).
 Dzięki temu zawsze jest przynajmniej jedna wolna lina do ucieczki!
+Wzorce losuje generator poziomu (level.py) - manager tylko je wstawia.
+
+Pozycje i liczniki animacji nietoperzy są w magazynie EntityStore -
+ruch i animacja wszystkich nietoperzy to jedna operacja na tablicy.
+Nietoperze, które wyleciały z ekranu, wracają do puli (ObjectPool).
+Prostokąty nietoperza (obrazek i hitbox) są tworzone raz razem z obiektem
+- przy spawn() kopiujemy wzory z LaneGeometry, co klatkę zmieniamy tylko Y.
 """
 import pygame
-import random
 from .config import *
+from .entity_store import EntityStore, KIND_BAT_1, KIND_BAT_2
+from .pool import ObjectPool
 
 
 class Obstacle:
@@ -14,62 +22,81 @@ class Obstacle:
     Pojedynczy nietoperz.
     """
 
-    def __init__(self, rope_index, y, bat_type, sprite_manager):
+    def __init__(self):
+        """Tworzy pustego nietoperza (do puli) - w grze pojawia się przez spawn()."""
+        self.rope_index = 0
+        self.bat_type = None
+        self.clip = None
+        self.sprite_manager = None
+        self.store = None
+        self.slot = -1
+        
+        # Prostokąt do rysowania i mniejszy hitbox (Y hitboxa liczony od Y obrazka)
+        self.rect = pygame.Rect(0, 0, OBSTACLE_SIZE, OBSTACLE_SIZE)
+        self.hitbox = pygame.Rect(0, 0, 0, 0)
+        self.hitbox_offset = 0
+
+    def spawn(self, rope_index, y, bat_type, sprite_manager, animation_start, store, lane_geometry):
         """
-        Tworzy nietoperza.
+        Umieszcza nietoperza w grze.
         
         Parametry:
             rope_index - na której linie (0, 1, 2)
             y - pozycja Y
             bat_type - 'bat_1' lub 'bat_2' (różne kolory)
             sprite_manager - do pobierania grafiki
+            animation_start - od której klatki zacząć licznik animacji
+            store - EntityStore z danymi nietoperzy
+            lane_geometry - LaneGeometry z położeniem obiektów na linach
         """
         self.rope_index = rope_index
-        self.y = y
         self.bat_type = bat_type
         self.sprite_manager = sprite_manager
+        self.clip = sprite_manager.get_clip(bat_type) if sprite_manager else None
         
-        # Losowy start animacji (żeby nietoperze nie machały synchronicznie)
-        self.animation_counter = random.randint(0, 30)
+        rect, hitbox = lane_geometry.obstacle[rope_index]
+        self.rect.update(rect)
+        self.hitbox.update(hitbox)
+        self.hitbox_offset = hitbox.y
+        
+        kind = KIND_BAT_1 if bat_type == 'bat_1' else KIND_BAT_2
+        store.add(self, rope_index, y, kind, animation_start)
 
-    def get_rect(self, ropes):
-        """Zwraca prostokąt do RYSOWANIA (pełny rozmiar)."""
-        x = ropes[self.rope_index].x + ROPE_WIDTH // 2 - OBSTACLE_SIZE // 2
-        return pygame.Rect(x, self.y, OBSTACLE_SIZE, OBSTACLE_SIZE)
+    @property
+    def y(self):
+        """Pozycja Y (z magazynu)."""
+        return self.store.y[self.slot]
 
-    def get_hitbox(self, ropes):
-        """Zwraca prostokąt do KOLIZJI (mniejszy - fair gameplay)."""
-        sprite_rect = self.get_rect(ropes)
-        
-        # Hitbox jest mniejszy niż sprite
-        hitbox_size = int(OBSTACLE_SIZE * OBSTACLE_HITBOX_SCALE)
-        offset = (OBSTACLE_SIZE - hitbox_size) // 2
-        
-        return pygame.Rect(
-            sprite_rect.x + offset,
-            sprite_rect.y + offset,
-            hitbox_size,
-            hitbox_size
-        )
+    @property
+    def animation_counter(self):
+        """Licznik animacji (z magazynu)."""
+        return int(self.store.anim[self.slot])
 
-    def update(self, scroll_speed):
-        """Aktualizuje nietoperza (ruch + animacja)."""
-        self.y += scroll_speed
-        self.animation_counter += 1
+    def get_rect(self):
+        """Zwraca prostokąt do RYSOWANIA (pełny rozmiar) z aktualnym Y."""
+        self.rect.y = int(self.y)
+        return self.rect
 
-    def draw(self, screen, ropes):
-        """Rysuje nietoperza."""
-        rect = self.get_rect(ropes)
-        sprite = self.sprite_manager.get_bat_frame(self.animation_counter, self.bat_type)
-        screen.blit(sprite, rect)
+    def get_hitbox(self):
+        """Zwraca prostokąt do KOLIZJI (mniejszy - fair gameplay) z aktualnym Y."""
+        self.hitbox.y = int(self.y) + self.hitbox_offset
+        return self.hitbox
 
-    def is_off_screen(self):
-        """Sprawdza czy wyleciał poza ekran."""
-        return self.y > SCREEN_HEIGHT
+    def draw(self, screen, offset_y=0):
+        """
+        Rysuje nietoperza. Zwraca zamalowany prostokąt.
+        
+        Parametry:
+            offset_y - przesunięcie interpolacji (między krokami symulacji)
+        """
+        rect = self.get_rect()
+        rect.y += offset_y
+        sprite = self.clip.frame(self.animation_counter)
+        return screen.blit(sprite, rect)
 
-    def check_collision(self, player_hitbox, ropes):
+    def check_collision(self, player_hitbox):
         """Sprawdza kolizję z graczem."""
-        my_hitbox = self.get_hitbox(ropes)
+        my_hitbox = self.get_hitbox()
         return my_hitbox.colliderect(player_hitbox)
 
 
@@ -81,100 +108,59 @@ class ObstacleManager:
     konfiguracjach, żeby zawsze była droga ucieczki.
     """
 
-    def __init__(self):
-        # Lista aktywnych przeszkód
-        self.obstacles = []
-        
-        # Kiedy ostatnio pojawiła się przeszkoda
-        self.last_spawn_distance = 0
-        
-        # Jaki będzie następny odstęp
-        self.next_spawn_distance = MIN_OBSTACLE_DISTANCE
+    def __init__(self, lane_geometry):
+        """
+        Parametry:
+            lane_geometry - LaneGeometry z położeniem obiektów na linach
+        """
+        self.lane_geometry = lane_geometry
         
-        # Historia wzorców (żeby nie powtarzać)
-        self.pattern_history = []
+        # Dane nietoperzy w kolumnach + lista aktywnych przeszkód
+        # (lista to store.owners - ta sama kolejność co wiersze magazynu)
+        self.store = EntityStore()
+        self.obstacles = self.store.owners
+        self.pool = ObjectPool(Obstacle, prefill=8)
 
-    def try_spawn(self, current_distance, sprite_manager):
+    def spawn(self, rope_index, y, bat_type, animation_start, sprite_manager):
         """
-        Próbuje utworzyć nową grupę przeszkód.
+        Wstawia jednego nietoperza z wzorca (zdarzenie z generatora poziomu).
         
         Parametry:
-            current_distance - aktualny przebyty dystans
+            rope_index - na której linie
+            y - pozycja startowa (nad ekranem)
+            bat_type - 'bat_1' lub 'bat_2'
+            animation_start - start licznika animacji
             sprite_manager - do tworzenia przeszkód
         """
-        # Sprawdź czy czas na nowe przeszkody
-        distance_since_last = current_distance - self.last_spawn_distance
-        
-        if distance_since_last < self.next_spawn_distance:
-            return  # Za wcześnie
-        
-        # -----------------------------------------
-        # WYBIERZ WZORZEC
-        # -----------------------------------------
-        # Unikamy powtórzenia ostatniego wzorca
-        available_patterns = OBSTACLE_PATTERNS.copy()
-        
-        if self.pattern_history:
-            last_pattern = self.pattern_history[-1]
-            # Usuń ostatni wzorzec z dostępnych
-            available_patterns = [p for p in available_patterns if p[2] != last_pattern]
-        
-        # Wybierz losowy wzorzec
-        if available_patterns:
-            pattern = random.choice(available_patterns)
-        else:
-            pattern = random.choice(OBSTACLE_PATTERNS)
-        
-        # Zapisz w historii
-        self.pattern_history.append(pattern[2])  # Zapisz nazwę
-        if len(self.pattern_history) > 3:
-            self.pattern_history.pop(0)  # Usuń najstarszy
-        
-        # -----------------------------------------
-        # UTWÓRZ NIETOPERZE
-        # -----------------------------------------
-        occupied_lanes = pattern[0]  # Które liny są zajęte
-        
-        for lane in occupied_lanes:
-            # Losowy typ nietoperza
-            bat_type = random.choice(['bat_1', 'bat_2'])
-            
-            # Losowe przesunięcie Y (żeby nie były idealnie w linii)
-            y_offset = random.randint(-OBSTACLE_Y_VARIATION, OBSTACLE_Y_VARIATION)
-            
-            # Pozycja startowa - nad ekranem
-            spawn_y = -OBSTACLE_SIZE - 50 + y_offset
-            
-            # Utwórz nietoperza
-            obstacle = Obstacle(lane, spawn_y, bat_type, sprite_manager)
-            self.obstacles.append(obstacle)
-        
-        # -----------------------------------------
-        # USTAW NASTĘPNY SPAWN
-        # -----------------------------------------
-        self.last_spawn_distance = current_distance
-        self.next_spawn_distance = random.randint(MIN_OBSTACLE_DISTANCE, MAX_OBSTACLE_DISTANCE)
+        obstacle = self.pool.acquire()
+        obstacle.spawn(rope_index, y, bat_type, sprite_manager, animation_start,
+                       self.store, self.lane_geometry)
 
     def update(self, scroll_speed):
-        """Aktualizuje wszystkie przeszkody."""
-        # Aktualizuj każdą przeszkodę
-        for obstacle in self.obstacles:
-            obstacle.update(scroll_speed)
+        """Aktualizuje wszystkie przeszkody (ruch + animacja)."""
+        # Jedna operacja na całej tablicy zamiast pętli po nietoperzach
+        self.store.scroll(scroll_speed)
+        self.store.advance_animation()
         
-        # Usuń te które wyleciały poza ekran
-        self.obstacles = [o for o in self.obstacles if not o.is_off_screen()]
+        # Usuń te które wyleciały poza ekran (wracają do puli)
+        self.store.cull(self.pool.release)
 
-    def draw(self, screen, ropes):
-        """Rysuje wszystkie przeszkody."""
-        for obstacle in self.obstacles:
-            obstacle.draw(screen, ropes)
+    def draw(self, screen, offset_y=0):
+        """Rysuje wszystkie przeszkody. Zwraca listę zamalowanych prostokątów."""
+        return [obstacle.draw(screen, offset_y) for obstacle in self.obstacles]
 
-    def check_collisions(self, player_hitbox, ropes):
+    def check_collisions(self, player_hitbox, lanes):
         """
         Sprawdza czy gracz zderzył się z jakąkolwiek przeszkodą.
         Zwraca True jeśli tak (game over!).
+        
+        Parametry:
+            player_hitbox - hitbox gracza
+            lanes - liny, na których może być gracz (Player.get_lanes())
         """
-        for obstacle in self.obstacles:
-            if obstacle.check_collision(player_hitbox, ropes):
+        # Tylko nietoperze na liniach gracza i na wysokości jego hitboxa
+        nearby = self.store.query(lanes, player_hitbox.top - OBSTACLE_SIZE, player_hitbox.bottom)
+        for obstacle in nearby:
+            if obstacle.check_collision(player_hitbox):
                 return True
         return False
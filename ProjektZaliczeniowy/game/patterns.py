@@ -0,0 +1,216 @@
+"""
+HUGO - Losowanie wzorców nietoperzy (tablica przejść)
+=====================================================
+Wzorce z OBSTACLE_PATTERNS są raz zamieniane na tablicę przejść łańcucha
+Markowa: wiersz = stan (ostatnie wylosowane wzorce), kolumna = następny
+wzorzec. Każdy wiersz ma gotową tablicę aliasów (metoda Vose'a), więc
+losowanie to jedna liczba losowa i dwa odczyty z list - tyle samo pracy
+przy 6 i przy 600 wzorcach, bez tworzenia list w trakcie gry.
+
+Co wpływa na wiersz tablicy:
+    OBSTACLE_PATTERN_WEIGHTS - waga wzorca (nazwa -> waga, brak = 1.0)
+    OBSTACLE_PATTERN_TIERS   - od którego poziomu trudności wzorzec się
+                               pojawia (nazwa -> poziom, brak = 0)
+    OBSTACLE_PATTERN_MEMORY  - ilu ostatnich wzorców nie powtarzamy
+
+Stan (historia) to liczba: ostatnie OBSTACLE_PATTERN_MEMORY wzorców
+zapisane w systemie o podstawie (liczba wzorców + 1), gdzie 0 = "jeszcze
+nic". Nowy stan po wylosowaniu wzorca też jest w tablicy (next_state).
+
+Poziom trudności to ten sam numer przyspieszenia, który liczy Game.update:
+0 aż do DIFFICULTY_START_DISTANCE + DIFFICULTY_INCREASE_INTERVAL, potem +1
+co DIFFICULTY_INCREASE_INTERVAL - wzorzec z poziomu N pojawia się razem
+z N-tym przyspieszeniem gry.
+
+Ta sama tablica w wersji NumPy (sample_many, generate) losuje naraz
+tysiące niezależnych ciągów wzorców - do symulacji i statystyk poza grą.
+"""
+import numpy as np
+from .config import *
+
+# Skompilowane tablice (klucz: ustawienia, z których powstały)
+_tables = {}
+
+
+def difficulty_level(distance):
+    """Poziom trudności na dystansie distance (0, 1, 2, ...) - jak w Game.update."""
+    if distance <= DIFFICULTY_START_DISTANCE:
+        return 0
+    return int((distance - DIFFICULTY_START_DISTANCE) // DIFFICULTY_INCREASE_INTERVAL)
+
+
+def _alias_table(weights):
+    """
+    Tablica aliasów (metoda Vose'a) dla wag weights.
+    Zwraca (prob, alias): wylosowana kolumna i zostaje z szansą prob[i],
+    inaczej zamienia się na alias[i].
+    """
+    count = len(weights)
+    total = sum(weights)
+    scaled = [weight * count / total for weight in weights]
+    prob = [1.0] * count
+    alias = list(range(count))
+
+    small = [i for i, value in enumerate(scaled) if value < 1.0]
+    large = [i for i, value in enumerate(scaled) if value >= 1.0]
+    while small and large:
+        less = small.pop()
+        more = large.pop()
+        prob[less] = scaled[less]
+        alias[less] = more
+        scaled[more] += scaled[less] - 1.0
+        (small if scaled[more] < 1.0 else large).append(more)
+    # Pozostałe mają (z dokładnością do zaokrągleń) pełną kolumnę - prob 1.0
+    return prob, alias
+
+
+class PatternTable:
+    """
+    Skompilowana tablica przejść między wzorcami.
+
+    Pola (listy, indeksy całkowite):
+        prob[poziom][stan][kolumna]   - szansa, że kolumna zostaje
+        alias[poziom][stan][kolumna]  - wzorzec zamiast kolumny
+        next_state[stan][wzorzec]     - stan po wylosowaniu wzorca
+    """
+
+    def __init__(self, patterns, weights=None, tiers=None, memory=1):
+        """
+        Parametry:
+            patterns - lista wzorców jak OBSTACLE_PATTERNS
+            weights - {nazwa: waga} (brak = 1.0)
+            tiers - {nazwa: poziom trudności, od którego wzorzec się pojawia}
+            memory - ilu ostatnich wzorców nie powtarzać (0 = bez ograniczeń)
+        """
+        weights = weights or {}
+        tiers = tiers or {}
+        names = [pattern[2] for pattern in patterns]
+        for name in list(weights) + list(tiers):
+            if name not in names:
+                raise ValueError(f"Nieznany wzorzec przeszkód: {name}")
+
+        self.count = len(patterns)
+        self.memory = memory
+        base = self.count + 1
+        self.num_states = base ** memory
+
+        pattern_weights = [float(weights.get(name, 1.0)) for name in names]
+        pattern_tiers = [int(tiers.get(name, 0)) for name in names]
+        if any(weight < 0 for weight in pattern_weights) or not any(pattern_weights):
+            raise ValueError("Wagi wzorców muszą być nieujemne, a choć jedna dodatnia")
+
+        # Stan -> ostatnie wzorce (od najnowszego) i stan po każdym wzorcu
+        self.next_state = []
+        recent = []
+        for state in range(self.num_states):
+            history = []
+            rest = state
+            for _ in range(memory):
+                if rest % base:
+                    history.append(rest % base - 1)
+                rest //= base
+            recent.append(history)
+            shifted = (state * base) % self.num_states
+            self.next_state.append([shifted + pattern + 1 if memory else 0
+                                    for pattern in range(self.count)])
+
+        # Dla każdego poziomu trudności: wiersz aliasów na każdy stan
+        self.top_level = max(pattern_tiers)
+        self.prob = []
+        self.alias = []
+        for level in range(self.top_level + 1):
+            unlocked = [weight if tier <= level else 0.0
+                        for weight, tier in zip(pattern_weights, pattern_tiers)]
+            if not any(unlocked):
+                # Nic jeszcze nie odblokowane - najłatwiejsze, jakie są
+                lowest = min(tier for weight, tier in zip(pattern_weights, pattern_tiers) if weight)
+                unlocked = [weight if tier == lowest else 0.0
+                            for weight, tier in zip(pattern_weights, pattern_tiers)]
+            level_prob = []
+            level_alias = []
+            for history in recent:
+                row = [0.0 if pattern in history else weight
+                       for pattern, weight in enumerate(unlocked)]
+                if not any(row) and history:
+                    # Za mało wzorców na całą pamięć - nie powtarzamy choć ostatniego
+                    row = [0.0 if pattern == history[0] else weight
+                           for pattern, weight in enumerate(unlocked)]
+                if not any(row):
+                    row = unlocked
+                prob, alias = _alias_table(row)
+                level_prob.append(prob)
+                level_alias.append(alias)
+            self.prob.append(level_prob)
+            self.alias.append(level_alias)
+
+        # Te same tablice dla NumPy (sample_many, generate)
+        self.prob_array = np.array(self.prob)
+        self.alias_array = np.array(self.alias, dtype=np.int64)
+        self.next_state_array = np.array(self.next_state, dtype=np.int64)
+
+    def sample(self, rng, state, level):
+        """
+        Losuje następny wzorzec (indeks w OBSTACLE_PATTERNS).
+
+        Parametry:
+            rng - random.Random (zużywa jedną liczbę rng.random())
+            state - stan historii (0 = jeszcze nic)
+            level - poziom trudności (difficulty_level)
+        """
+        level = level if level < self.top_level else self.top_level
+        u = rng.random() * self.count
+        column = int(u)
+        if u - column < self.prob[level][state][column]:
+            return column
+        return self.alias[level][state][column]
+
+    # =========================================================================
+    # WERSJA NUMPY (wiele ciągów naraz)
+    # =========================================================================
+
+    def sample_many(self, states, levels, uniforms):
+        """
+        Losuje po jednym wzorcu dla każdego ciągu naraz.
+        Zwraca (wzorce, nowe stany) - tablice jak states.
+
+        Parametry:
+            states - stany historii (tablica int)
+            levels - poziomy trudności (tablica int albo jedna liczba)
+            uniforms - liczby losowe z [0, 1) (tablica float)
+        """
+        levels = np.minimum(levels, self.top_level)
+        u = uniforms * self.count
+        columns = u.astype(np.int64)
+        keep = (u - columns) < self.prob_array[levels, states, columns]
+        patterns = np.where(keep, columns, self.alias_array[levels, states, columns])
+        return patterns, self.next_state_array[states, patterns]
+
+    def generate(self, chains, length, level=0, seed=None):
+        """
+        Losuje chains niezależnych ciągów po length wzorców (od pustej
+        historii, na stałym poziomie trudności). Zwraca tablicę
+        (chains, length) z indeksami wzorców.
+        """
+        rng = np.random.default_rng(seed)
+        uniforms = rng.random((length, chains))
+        states = np.zeros(chains, dtype=np.int64)
+        sequences = np.empty((length, chains), dtype=np.int64)
+        for step in range(length):
+            sequences[step], states = self.sample_many(states, level, uniforms[step])
+        return sequences.T
+
+
+def pattern_table():
+    """
+    Tablica dla bieżących ustawień (kompilowana raz, potem z pamięci -
+    także po zmianie ustawień przez --set, bo klucz to same ustawienia).
+    """
+    key = (tuple((tuple(lanes), name) for lanes, _, name in OBSTACLE_PATTERNS),
+           tuple(sorted(OBSTACLE_PATTERN_WEIGHTS.items())),
+           tuple(sorted(OBSTACLE_PATTERN_TIERS.items())),
+           OBSTACLE_PATTERN_MEMORY)
+    table = _tables.get(key)
+    if table is None:
+        table = _tables[key] = PatternTable(OBSTACLE_PATTERNS, OBSTACLE_PATTERN_WEIGHTS,
+                                            OBSTACLE_PATTERN_TIERS, OBSTACLE_PATTERN_MEMORY)
+    return table
@@ -11,6 +11,18 @@ import pygame
 from .config import *
 
 
+def player_hitbox():
+    """
+    Hitbox gracza względem jego prostokąta: (przesunięcie x, przesunięcie y,
+    szerokość, wysokość). Wspólne dla Player, jądra NumPy, autopilota
+    i sprawdzania ucieczki.
+    """
+    width = int(PLAYER_WIDTH * PLAYER_HITBOX_SCALE)
+    height = int(PLAYER_HEIGHT * PLAYER_HITBOX_SCALE)
+    # Wyśrodkuj hitbox w obrazku
+    return (PLAYER_WIDTH - width) // 2, (PLAYER_HEIGHT - height) // 2, width, height
+
+
 class Player:
     """
     Gracz - Hugo wspinający się po linach.
@@ -32,18 +44,18 @@ class Player:
         
         # Hitbox do kolizji - MNIEJSZY niż obrazek!
         # Dzięki temu gra jest sprawiedliwa - możesz "otrzeć się" o przeszkodę
-        hitbox_width = int(PLAYER_WIDTH * PLAYER_HITBOX_SCALE)
-        hitbox_height = int(PLAYER_HEIGHT * PLAYER_HITBOX_SCALE)
-        
-        # Wyśrodkuj hitbox w obrazku
-        offset_x = (PLAYER_WIDTH - hitbox_width) // 2
-        offset_y = (PLAYER_HEIGHT - hitbox_height) // 2
+        offset_x, offset_y, hitbox_width, hitbox_height = player_hitbox()
         self.hitbox = pygame.Rect(x + offset_x, y + offset_y, hitbox_width, hitbox_height)
         
+        # Pozycja z poprzedniego kroku (do interpolacji rysowania)
+        self.prev_x = x
+        self.prev_y = y
+        
         # -----------------------------------------
         # STAN GRACZA
         # -----------------------------------------
         self.current_rope = 1  # Na której linie jest gracz (0, 1, 2)
+        self.previous_rope = 1  # Z której liny skoczył ostatnio
         
         # Nieśmiertelność (z powerupa)
         self.invincible = False
@@ -61,13 +73,25 @@ class Player:
         # -----------------------------------------
         self.is_jumping = False
         self.jump_direction = None  # 'left' lub 'right'
-        self.jump_progress = 0      # 0-20 (postęp animacji)
+        self.jump_progress = 0      # 0-PLAYER_JUMP_DURATION (postęp animacji)
         
         # -----------------------------------------
         # ANIMACJA OGÓLNA
         # -----------------------------------------
         self.sprite_manager = sprite_manager
         self.animation_counter = 0  # Licznik do animacji
+        
+        # Klipy animacji (bez grafik - w trybie headless - nie ma klipów)
+        if sprite_manager:
+            self.climb_clip = sprite_manager.get_clip('player_climb')
+            self.jump_clips = {
+                'left': sprite_manager.get_clip('player_jump_left'),
+                'right': sprite_manager.get_clip('player_jump_right'),
+            }
+        else:
+            self.climb_clip = None
+            self.jump_clips = None
+        self.jump_clip = None  # Klip aktualnego skoku (kierunek wybrany przy starcie)
 
     def handle_input(self, keys, ropes):
         """
@@ -77,6 +101,10 @@ class Player:
             keys - stan klawiszy (z pygame.key.get_pressed())
             ropes - lista lin (żeby wiedzieć gdzie się przesunąć)
         """
+        # Zapamiętaj pozycję sprzed kroku (do interpolacji)
+        self.prev_x = self.rect.x
+        self.prev_y = self.rect.y
+        
         # -----------------------------------------
         # RUCH GÓRA/DÓŁ
         # -----------------------------------------
@@ -107,12 +135,14 @@ class Player:
             # Skok w lewo
             if keys[pygame.K_LEFT] or keys[pygame.K_a]:
                 if self.current_rope > 0:  # Nie jesteśmy na lewej skrajnej
+                    self.previous_rope = self.current_rope
                     self.current_rope -= 1
                     self._start_jump('left', ropes)
             
             # Skok w prawo
             if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
                 if self.current_rope < NUM_ROPES - 1:  # Nie jesteśmy na prawej skrajnej
+                    self.previous_rope = self.current_rope
                     self.current_rope += 1
                     self._start_jump('right', ropes)
 
@@ -123,9 +153,9 @@ class Player:
             # Oblicz odległość do celu
             distance = abs(self.rect.x - self.target_x)
             
-            if distance > 2:
+            if distance > PLAYER_JUMP_SNAP_DISTANCE:
                 # Ruszaj się w stronę celu
-                speed = min(7, distance)  # Max 7 pikseli na klatkę
+                speed = min(PLAYER_JUMP_SPEED, distance)  # Max pikseli na klatkę
                 
                 if self.rect.x < self.target_x:
                     self.rect.x += speed  # W prawo
@@ -142,7 +172,7 @@ class Player:
         if self.is_jumping:
             self.jump_progress += 1
             
-            if self.jump_progress > 20:
+            if self.jump_progress > PLAYER_JUMP_DURATION:
                 # Koniec animacji skoku
                 self.is_jumping = False
                 self.jump_progress = 0
@@ -151,26 +181,33 @@ class Player:
         # AKTUALIZUJ POZYCJĘ HITBOXA
         # -----------------------------------------
         # Hitbox musi "podążać" za obrazkiem
-        hitbox_width = int(PLAYER_WIDTH * PLAYER_HITBOX_SCALE)
-        hitbox_height = int(PLAYER_HEIGHT * PLAYER_HITBOX_SCALE)
-        offset_x = (PLAYER_WIDTH - hitbox_width) // 2
-        offset_y = (PLAYER_HEIGHT - hitbox_height) // 2
-        
+        offset_x, offset_y, _, _ = player_hitbox()
         self.hitbox.x = self.rect.x + offset_x
         self.hitbox.y = self.rect.y + offset_y
 
     def _start_jump(self, direction, ropes):
         """Rozpoczyna skok na inną linę."""
-        self.move_cooldown = 30  # Poczekaj 30 klatek przed następnym skokiem
+        self.move_cooldown = PLAYER_JUMP_COOLDOWN  # Poczekaj przed następnym skokiem
         self.is_moving = True
         self.is_jumping = True
         self.jump_direction = direction
         self.jump_progress = 0
+        if self.jump_clips:
+            self.jump_clip = self.jump_clips[direction]
         
         # Oblicz gdzie mamy dolecieć (środek nowej liny)
         target_rope = ropes[self.current_rope]
         self.target_x = target_rope.x + ROPE_WIDTH // 2 - PLAYER_WIDTH // 2
 
+    def get_lanes(self):
+        """
+        Zwraca liny, na których może być hitbox gracza.
+        W trakcie skoku - linę docelową i tę, z której skoczył.
+        """
+        if self.is_moving:
+            return (self.previous_rope, self.current_rope)
+        return (self.current_rope,)
+
     def update(self):
         """Aktualizuje stan gracza (wywoływane co klatkę)."""
         # Zwiększ licznik animacji
@@ -187,23 +224,28 @@ class Player:
     def activate_invincibility(self):
         """Włącza nieśmiertelność na 3 sekundy."""
         self.invincible = True
-        self.invincible_timer = 180  # 3 sekundy * 60 FPS = 180 klatek
-
-    def draw(self, screen):
-        """Rysuje gracza na ekranie."""
-        # Pobierz odpowiednią klatkę animacji
-        sprite = self.sprite_manager.get_player_frame(
-            self.animation_counter,
-            self.is_jumping,
-            self.jump_direction,
-            self.jump_progress
-        )
+        self.invincible_timer = INVINCIBILITY_FRAMES
+
+    def draw(self, screen, alpha=1.0):
+        """
+        Rysuje gracza na ekranie. Zwraca zamalowany prostokąt (albo None).
+        
+        Parametry:
+            alpha - postęp między krokami symulacji (1.0 = ostatni krok)
+        """
+        # Pobierz odpowiednią klatkę animacji (skok albo wspinaczka)
+        if self.is_jumping:
+            sprite = self.jump_clip.frame(self.jump_progress)
+        else:
+            sprite = self.climb_clip.frame(self.animation_counter)
 
         # Efekt migania podczas nieśmiertelności
         if self.invincible:
             # Migaj co 10 klatek (5 klatek widoczny, 5 niewidoczny)
             if self.invincible_timer % 10 < 5:
-                return  # Nie rysuj - gracz "znika" na chwilę
+                return None  # Nie rysuj - gracz "znika" na chwilę
 
-        # Narysuj gracza
-        screen.blit(sprite, self.rect)
+        # Narysuj gracza (między poprzednią a aktualną pozycją)
+        x = self.prev_x + (self.rect.x - self.prev_x) * alpha
+        y = self.prev_y + (self.rect.y - self.prev_y) * alpha
+        return screen.blit(sprite, (x, y))
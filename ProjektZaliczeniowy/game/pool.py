@@ -0,0 +1,36 @@
+"""
+HUGO - Pule obiektów
+====================
+Tworzenie nowych obiektów co klatkę (pociski, monety, nietoperze)
+zaśmieca pamięć i co jakiś czas wywołuje odśmiecacz (GC) - gra się
+wtedy na chwilę "zacina".
+
+Pula trzyma listę wolnych obiektów. Obiekt, który zniknął z gry, wraca
+do puli, a następny spawn bierze go z powrotem (razem z jego pygame.Rect)
+zamiast tworzyć nowy. Po rozgrzaniu gra nie tworzy już nowych obiektów.
+"""
+
+
+class ObjectPool:
+    """
+    Pula obiektów wielokrotnego użytku (lista wolnych obiektów).
+    """
+
+    def __init__(self, factory, prefill=0):
+        """
+        Parametry:
+            factory - funkcja tworząca nowy obiekt (gdy pula jest pusta)
+            prefill - ile obiektów utworzyć od razu
+        """
+        self.factory = factory
+        self.free = [factory() for _ in range(prefill)]
+
+    def acquire(self):
+        """Zwraca wolny obiekt (z puli albo nowy)."""
+        if self.free:
+            return self.free.pop()
+        return self.factory()
+
+    def release(self, obj):
+        """Oddaje obiekt do puli."""
+        self.free.append(obj)
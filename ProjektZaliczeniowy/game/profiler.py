@@ -0,0 +1,229 @@
+"""
+HUGO - Profiler klatki
+======================
+Pokazuje, na co idzie czas jednej klatki (16.6 ms przy 60 FPS):
+obsługa eventów, sterowanie, każdy manager, spawn, kolizje, każda grupa
+rysowania i wysłanie obrazu na ekran.
+
+Jak używać w kodzie gry:
+    t = profiler.now()
+    ... faza A ...
+    t = profiler.record('faza_a', t)   # zapisuje czas i zwraca "teraz"
+    ... faza B ...
+    t = profiler.record('faza_b', t)
+
+Czasy (time.perf_counter_ns) trafiają do z góry zaalokowanych buforów
+cyklicznych - ostatnie PROFILER_HISTORY próbek każdej fazy. Z nich liczymy
+medianę (p50) i p99 na nakładce (klawisz F3). Dodatkowo każda faza ma
+histogram całej sesji (przedziały potęg dwójki w mikrosekundach), który
+export() zapisuje do pliku JSON - do porównywania wersji gry na tym samym
+komputerze.
+
+Gdy profiler jest wyłączony, gra używa NullProfiler - te same metody,
+które nic nie robią.
+"""
+import json
+import platform
+import time
+from array import array
+import pygame
+from .config import *
+
+
+def machine_info():
+    """Opis komputera i wersji (do porównywania pomiarów z różnych uruchomień)."""
+    return {
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+    }
+
+
+class PhaseTimings:
+    """
+    Czasy jednej fazy: bufor cykliczny ostatnich próbek + histogram sesji.
+    """
+
+    def __init__(self, history):
+        """
+        Parametry:
+            history - ile ostatnich próbek trzymać (do p50/p99)
+        """
+        self.samples = array('q', bytes(8 * history))  # Nanosekundy
+        self.index = 0   # Gdzie zapisać następną próbkę
+        self.count = 0   # Ile próbek jest w buforze (max history)
+
+        # Histogram całej sesji: przedział i = czasy o i bitach w mikrosekundach,
+        # czyli [2^(i-1), 2^i) us (przedział 0 - poniżej mikrosekundy)
+        self.buckets = array('q', bytes(8 * PROFILER_HISTOGRAM_BUCKETS))
+        self.total_count = 0
+        self.total_ns = 0
+
+    def add(self, duration_ns):
+        """Zapisuje jedną próbkę."""
+        samples = self.samples
+        samples[self.index] = duration_ns
+        self.index += 1
+        if self.index == len(samples):
+            self.index = 0
+        if self.count < len(samples):
+            self.count += 1
+
+        bucket = (duration_ns // 1000).bit_length()
+        if bucket >= PROFILER_HISTOGRAM_BUCKETS:
+            bucket = PROFILER_HISTOGRAM_BUCKETS - 1
+        self.buckets[bucket] += 1
+        self.total_count += 1
+        self.total_ns += duration_ns
+
+    def percentiles(self, *fractions):
+        """Zwraca percentyle ostatnich próbek w milisekundach (np. 0.5, 0.99)."""
+        if self.count == 0:
+            return tuple(0.0 for _ in fractions)
+        ordered = sorted(self.samples[:self.count])
+        last = self.count - 1
+        return tuple(ordered[int(fraction * last)] / 1e6 for fraction in fractions)
+
+
+class FrameProfiler:
+    """
+    Mierzy czasy faz klatki, rysuje nakładkę i zapisuje histogramy.
+    """
+
+    enabled = True
+
+    def __init__(self, history=None):
+        """
+        Parametry:
+            history - ile ostatnich próbek każdej fazy trzymać (None = PROFILER_HISTORY)
+        """
+        self.history = PROFILER_HISTORY if history is None else history
+        self.phases = {}  # Nazwa fazy -> PhaseTimings (w kolejności pierwszego pomiaru)
+        self.now = time.perf_counter_ns
+
+        # Nakładka (F3) - składana co PROFILER_OVERLAY_REFRESH klatek
+        self.overlay_visible = False
+        self._overlay_surface = None
+        self._overlay_age = 0
+        self._font = None
+
+    def record(self, phase, start_ns):
+        """
+        Zapisuje czas fazy od start_ns do teraz. Zwraca "teraz"
+        (początek następnej fazy).
+        """
+        end_ns = time.perf_counter_ns()
+        timings = self.phases.get(phase)
+        if timings is None:
+            timings = self.phases[phase] = PhaseTimings(self.history)
+        timings.add(end_ns - start_ns)
+        return end_ns
+
+    # =========================================================================
+    # NAKŁADKA
+    # =========================================================================
+
+    def toggle_overlay(self):
+        """Pokazuje / chowa nakładkę z czasami."""
+        self.overlay_visible = not self.overlay_visible
+        self._overlay_surface = None
+
+    def draw_overlay(self, screen):
+        """Rysuje nakładkę w prawym górnym rogu. Zwraca zamalowany prostokąt."""
+        if self._overlay_surface is None or self._overlay_age >= PROFILER_OVERLAY_REFRESH:
+            self._overlay_surface = self._compose_overlay()
+            self._overlay_age = 0
+        self._overlay_age += 1
+
+        x = screen.get_width() - self._overlay_surface.get_width() - 5
+        return screen.blit(self._overlay_surface, (x, 5))
+
+    def _compose_overlay(self):
+        """Składa nakładkę: jedna linia na fazę - nazwa, p50 i p99 w ms."""
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+        font = self._font
+
+        rows = [("faza", "p50 ms", "p99 ms")]
+        for name, timings in self.phases.items():
+            p50, p99 = timings.percentiles(0.5, 0.99)
+            rows.append((name, f"{p50:.3f}", f"{p99:.3f}"))
+        rendered = [[font.render(text, True, WHITE) for text in row] for row in rows]
+
+        # Kolumny: nazwa wyrównana do lewej, liczby do prawej
+        widths = [max(row[column].get_width() for row in rendered) for column in range(3)]
+        line_height = font.get_linesize()
+        width = sum(widths) + 2 * 15 + 10
+        height = line_height * len(rendered) + 10
+
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 180))
+        for i, (name, p50, p99) in enumerate(rendered):
+            y = 5 + i * line_height
+            surface.blit(name, (5, y))
+            right = 5 + widths[0] + 15 + widths[1]
+            surface.blit(p50, (right - p50.get_width(), y))
+            right += 15 + widths[2]
+            surface.blit(p99, (right - p99.get_width(), y))
+        return surface
+
+    # =========================================================================
+    # ZAPIS DO PLIKU
+    # =========================================================================
+
+    def export(self, path):
+        """
+        Zapisuje statystyki i histogramy wszystkich faz do pliku JSON.
+
+        Parametry:
+            path - ścieżka pliku wynikowego
+        """
+        phases = {}
+        for name, timings in self.phases.items():
+            p50, p90, p99 = timings.percentiles(0.5, 0.9, 0.99)
+            histogram = []
+            for bucket, count in enumerate(timings.buckets):
+                if count:
+                    low_us = 0 if bucket == 0 else 1 << (bucket - 1)
+                    histogram.append([low_us, 1 << bucket, count])
+            phases[name] = {
+                'count': timings.total_count,
+                'mean_ms': timings.total_ns / timings.total_count / 1e6,
+                'recent_p50_ms': p50,
+                'recent_p90_ms': p90,
+                'recent_p99_ms': p99,
+                # [od us, do us, liczba próbek]
+                'histogram_us': histogram,
+            }
+
+        report = {
+            'machine': machine_info(),
+            'phases': phases,
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+
+class NullProfiler:
+    """
+    Profiler wyłączony - te same metody co FrameProfiler, ale nic nie mierzą.
+    """
+
+    enabled = False
+    overlay_visible = False
+
+    def now(self):
+        return 0
+
+    def record(self, phase, start_ns):
+        return 0
+
+    def toggle_overlay(self):
+        pass
+
+    def draw_overlay(self, screen):
+        return None
+
+    def export(self, path):
+        pass
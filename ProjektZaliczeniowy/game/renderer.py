@@ -0,0 +1,76 @@
+"""
+HUGO - Odświeżanie ekranu "brudnymi prostokątami"
+=================================================
+pygame.display.flip() wysyła na ekran całą klatkę 1000x1000, nawet jeśli
+zmieniło się kilka pikseli. Na wyświetlaczach bez akceleracji to najdroższa
+część klatki.
+
+DirtyRectRenderer dostaje listę prostokątów, po których coś rysowało
+w tej klatce, i wysyła na ekran tylko je (razem z prostokątami z poprzedniej
+klatki - tam obiekty były wcześniej i trzeba je "zmazać").
+Gdy zmian jest dużo, jeden flip jest tańszy - wtedy robimy flip.
+"""
+import pygame
+from .config import *
+
+
+class DirtyRectRenderer:
+    """
+    Wysyła na ekran tylko zmienione fragmenty klatki.
+    """
+
+    def __init__(self, screen, full_update_ratio=None, max_rects=None):
+        """
+        Parametry:
+            screen - ekran pygame
+            full_update_ratio - jaka część powierzchni ekranu wystarczy,
+                                żeby zamiast prostokątów zrobić pełny flip
+                                (None = DIRTY_RECT_FULL_UPDATE_RATIO)
+            max_rects - powyżej tylu prostokątów też robimy pełny flip
+                        (None = DIRTY_RECT_MAX_RECTS)
+        """
+        if full_update_ratio is None:
+            full_update_ratio = DIRTY_RECT_FULL_UPDATE_RATIO
+        if max_rects is None:
+            max_rects = DIRTY_RECT_MAX_RECTS
+        self.screen = screen
+        self.full_update_area = screen.get_width() * screen.get_height() * full_update_ratio
+        self.max_rects = max_rects
+
+        self._previous_rects = []  # Prostokąty z poprzedniej klatki
+        self._full_update = True   # Pierwsza klatka - zawsze cały ekran
+
+        # Statystyki (do podglądu ile pracy oszczędzamy)
+        self.full_updates = 0
+        self.partial_updates = 0
+
+    def invalidate(self):
+        """Wymusza odświeżenie całego ekranu w następnej klatce."""
+        self._full_update = True
+
+    def present(self, rects):
+        """
+        Pokazuje klatkę na ekranie.
+
+        Parametry:
+            rects - prostokąty, po których rysowano w tej klatce
+                    (None i puste prostokąty są pomijane)
+        """
+        current = [rect for rect in rects if rect]
+
+        # Stare pozycje + nowe pozycje
+        dirty = self._previous_rects + current
+        self._previous_rects = current
+
+        # Zakładki liczymy podwójnie - szacunek jest "na bezpieczną stronę"
+        area = 0
+        for rect in dirty:
+            area += rect.width * rect.height
+
+        if self._full_update or area >= self.full_update_area or len(dirty) > self.max_rects:
+            pygame.display.flip()
+            self._full_update = False
+            self.full_updates += 1
+        elif dirty:
+            pygame.display.update(dirty)
+            self.partial_updates += 1
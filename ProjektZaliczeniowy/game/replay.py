@@ -0,0 +1,200 @@
+"""
+HUGO - Nagrywanie i odtwarzanie rozgrywek (replay)
+==================================================
+Rozgrywka jest w pełni powtarzalna, jeśli znamy:
+- ziarno losowości rozgrywki (seed)
+- stan klawiszy w każdej klatce symulacji
+
+Stan klawiszy to maska bitowa (UP/DOWN/LEFT/RIGHT - patrz controls.py).
+Zapisujemy ją jako ciąg "serii" (RLE): maska + ile klatek była trzymana.
+Gracz zmienia klawisze kilka razy na sekundę, więc minuta gry to zwykle
+kilkaset bajtów.
+
+Co KEYFRAME_INTERVAL klatek zaczynamy nową serię i zapamiętujemy jej
+położenie w pliku (klatka kluczowa). Przewijanie do dowolnej klatki
+dekoduje więc najwyżej KEYFRAME_INTERVAL klatek.
+
+Format pliku (little-endian):
+    nagłówek: magic (8B), seed (int64), liczba klatek (uint32),
+              odstęp klatek kluczowych (uint32), liczba klatek kluczowych (uint32)
+    tabela klatek kluczowych: przesunięcia w strumieniu serii (uint32 każde)
+    strumień serii: [maska (1B)][długość serii (varint)] ...
+"""
+import struct
+from .controls import KeyState, mask_from_keys
+
+# Wersja 2: świat z generatora poziomu (level.py), wersja 3: wzorce
+# nietoperzy z tablicy przejść (patterns.py) - starsze nagrania
+# odtworzyłyby się w innym świecie; wersja 4: ziarno jako int64
+REPLAY_MAGIC = b'HUGOREP4'
+KEYFRAME_INTERVAL = 600  # Co 10 sekund (przy 60 krokach na sekundę)
+
+# Zakres ziarna, które mieści się w nagłówku (int64 - jak w snapshot.py)
+SEED_MIN = -2 ** 63
+SEED_MAX = 2 ** 63 - 1
+
+_HEADER = struct.Struct('<8sqIII')
+
+
+def _write_varint(buffer, value):
+    """Zapisuje liczbę nieujemną w kodowaniu varint (7 bitów na bajt)."""
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data, pos):
+    """Odczytuje varint. Zwraca (wartość, nowa_pozycja)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class ReplayRecorder:
+    """
+    Nagrywa stan klawiszy klatka po klatce.
+
+    Użycie:
+        recorder.start(seed)   # na początku rozgrywki
+        recorder.record(keys)  # co klatkę symulacji
+        recorder.save(path)    # na koniec
+    """
+
+    def __init__(self, keyframe_interval=KEYFRAME_INTERVAL):
+        self.keyframe_interval = keyframe_interval
+        self.start(0)
+
+    def start(self, seed):
+        """Zaczyna nowe nagranie (poprzednie jest porzucane)."""
+        # Sprawdzamy od razu - save() po całej rozgrywce byłoby za późno
+        if not SEED_MIN <= seed <= SEED_MAX:
+            raise ValueError(f"Ziarno {seed} nie mieści się w nagraniu (int64)")
+        self.seed = seed
+        self.frame_count = 0
+        self.stream = bytearray()
+        self.keyframes = []
+
+        # Aktualna (jeszcze niezapisana) seria
+        self._run_mask = 0
+        self._run_length = 0
+
+    def record(self, keys):
+        """Zapisuje stan klawiszy w jednej klatce."""
+        mask = mask_from_keys(keys)
+
+        # Klatka kluczowa - zamknij serię i zapamiętaj miejsce w strumieniu
+        if self.frame_count % self.keyframe_interval == 0:
+            self._flush_run()
+            self.keyframes.append(len(self.stream))
+
+        if mask == self._run_mask and self._run_length > 0:
+            self._run_length += 1
+        else:
+            self._flush_run()
+            self._run_mask = mask
+            self._run_length = 1
+
+        self.frame_count += 1
+
+    def _flush_run(self):
+        """Dopisuje bieżącą serię do strumienia."""
+        if self._run_length > 0:
+            self.stream.append(self._run_mask)
+            _write_varint(self.stream, self._run_length)
+            self._run_length = 0
+
+    def to_bytes(self):
+        """Zwraca nagranie w formacie pliku."""
+        self._flush_run()
+        header = _HEADER.pack(REPLAY_MAGIC, self.seed, self.frame_count,
+                              self.keyframe_interval, len(self.keyframes))
+        table = struct.pack(f'<{len(self.keyframes)}I', *self.keyframes)
+        return header + table + bytes(self.stream)
+
+    def save(self, path):
+        """Zapisuje nagranie do pliku."""
+        with open(path, 'wb') as file:
+            file.write(self.to_bytes())
+
+
+class ReplayPlayer:
+    """
+    Odtwarza nagranie - działa jak źródło sterowania (jak ScriptedInput).
+
+    Po końcu nagrania zwraca "żadne klawisze nie są wciśnięte".
+    """
+
+    def __init__(self, data):
+        """
+        Parametry:
+            data - zawartość pliku z nagraniem (bytes)
+        """
+        magic, seed, frame_count, interval, num_keyframes = _HEADER.unpack_from(data, 0)
+        if magic[:7] == REPLAY_MAGIC[:7] and magic != REPLAY_MAGIC:
+            raise ValueError("Nagranie ze starszej wersji gry")
+        if magic != REPLAY_MAGIC:
+            raise ValueError("To nie jest plik z nagraniem HUGO")
+
+        self.seed = seed
+        self.frame_count = frame_count
+        self.keyframe_interval = interval
+
+        table_start = _HEADER.size
+        self.keyframes = struct.unpack_from(f'<{num_keyframes}I', data, table_start)
+        self.stream = data[table_start + 4 * num_keyframes:]
+
+        self._keys = KeyState()
+        self.seek(0)
+
+    @classmethod
+    def from_file(cls, path):
+        """Wczytuje nagranie z pliku."""
+        with open(path, 'rb') as file:
+            return cls(file.read())
+
+    def seek(self, frame):
+        """Przewija do podanej klatki (dekoduje najwyżej jeden odcinek)."""
+        self.frame = frame
+        self._run_left = 0
+        self._run_mask = 0
+
+        if frame >= self.frame_count or not self.keyframes:
+            self._pos = len(self.stream)
+            return
+
+        # Zacznij od najbliższej wcześniejszej klatki kluczowej
+        keyframe = frame // self.keyframe_interval
+        self._pos = self.keyframes[keyframe]
+
+        to_skip = frame - keyframe * self.keyframe_interval
+        while True:
+            self._next_run()
+            if to_skip < self._run_left:
+                self._run_left -= to_skip
+                return
+            to_skip -= self._run_left
+
+    def _next_run(self):
+        """Wczytuje następną serię ze strumienia."""
+        self._run_mask = self.stream[self._pos]
+        self._run_left, self._pos = _read_varint(self.stream, self._pos + 1)
+
+    def get_keys(self):
+        """Zwraca stan klawiszy w tej klatce i przechodzi do następnej."""
+        if self.frame >= self.frame_count:
+            self._keys.mask = 0
+        else:
+            if self._run_left == 0:
+                self._next_run()
+            self._keys.mask = self._run_mask
+            self._run_left -= 1
+
+        self.frame += 1
+        return self._keys
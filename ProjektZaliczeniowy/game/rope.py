@@ -4,7 +4,6 @@ HUGO - Klasa Liny
 Lina po której wspina się gracz.
 Liny wyglądają jakby się przesuwały w dół - to tworzy iluzję wspinaczki.
 """
-import pygame
 from .config import *
 
 
@@ -16,17 +15,19 @@ class Rope:
     co tworzy efekt ruchu/wspinaczki.
     """
 
-    def __init__(self, x, sprite_manager):
+    def __init__(self, x, sprite_manager, texture='rope'):
         """
         Tworzy linę.
         
         Parametry:
             x - pozycja pozioma liny
             sprite_manager - obiekt do pobierania grafik
+            texture - nazwa tekstury liny
         """
         self.x = x  # Pozycja X (nie zmienia się)
         self.scroll_offset = 0  # Przesunięcie tekstury (animacja)
         self.sprite_manager = sprite_manager
+        self.texture = texture
 
     def update(self, scroll_speed):
         """
@@ -38,18 +39,20 @@ class Rope:
         # Przesuń teksturę
         self.scroll_offset += scroll_speed
         
-        # Zapętl (tekstura ma 100px wysokości)
-        if self.scroll_offset > 100:
-            self.scroll_offset -= 100
+        # Zapętl (po jednym kafelku tekstura wygląda tak samo)
+        if self.scroll_offset > ROPE_TILE_HEIGHT:
+            self.scroll_offset -= ROPE_TILE_HEIGHT
 
-    def draw(self, screen):
-        """Rysuje linę na ekranie."""
-        rope_sprite = self.sprite_manager.get_sprite('rope')
+    def draw(self, screen, offset_y=0):
+        """
+        Rysuje linę na ekranie. Zwraca zamalowany prostokąt.
+        
+        Parametry:
+            offset_y - przesunięcie interpolacji (między krokami symulacji)
+        """
+        # Gotowy pasek z kafelków (sklejony przez SpriteManager przy starcie)
+        strip = self.sprite_manager.get_rope_strip(self.texture)
         
-        # Rysuj teksturę liny wielokrotnie (od góry do dołu ekranu)
-        # Zaczynamy od -200 żeby nie było "dziury" na górze
-        y = -200
-        while y < SCREEN_HEIGHT + 200:
-            draw_y = y + int(self.scroll_offset)
-            screen.blit(rope_sprite, (self.x, draw_y))
-            y += 100  # Tekstura ma 100px wysokości
+        # Zaczynamy kafelek wyżej, żeby nie było "dziury" na górze
+        draw_y = int(self.scroll_offset + offset_y) - ROPE_TILE_HEIGHT
+        return screen.blit(strip, (self.x, draw_y))
@@ -0,0 +1,384 @@
+"""
+HUGO - Zapis i odtwarzanie stanu gry (snapshot / rewind)
+========================================================
+snapshot(game) pakuje CAŁY stan rozgrywki do zwartego bloku bajtów
+(struct + kolumny NumPy), a restore(game, data) przywraca go w istniejącej
+grze. Zapisujemy tylko to, co wpływa na dalszą symulację albo na obraz:
+
+    nagłówek   - stan gry, wynik, dystans, prędkość, timery, managery, liny
+    gracz      - pozycja, lina, skok, nieśmiertelność
+    losowość   - stan Game.rng i źródła ziaren (MT19937: 624 słowa + pozycja)
+    magazyny   - kolumny monet, powerupów i nietoperzy (y, lina, rodzaj,
+                 animacja, czy aktywny)
+    przeciwnicy i pociski - po jednym rekordzie struct
+    zdarzenia  - świat wygenerowany z wyprzedzeniem, który jeszcze się
+                 nie pojawił (kopiec z level.py, rekord struct na zdarzenie)
+
+Nagłówek, gracz i losowość mają stały rozmiar i są na początku - dzięki
+temu kolejne zapisy różnią się tylko w kilku miejscach.
+
+RewindBuffer trzyma ostatnie zapisy (bufor cykliczny). Co kilkadziesiąt
+klatek zapis jest pełny ("klatka kluczowa"), a pozostałe to tylko różnice
+względem ostatniej klatki kluczowej (zmienione 8-bajtowe słowa). Odtworzenie
+dowolnej klatki z bufora to skopiowanie klatki kluczowej i podmiana słów.
+
+Stan sterowania (np. pozycja w scenariuszu) i nagrywanie replay nie są
+częścią zapisu - sterowanie podaje ten, kto przywraca stan.
+"""
+import struct
+import numpy as np
+from .config import *
+from .entity_store import KIND_POWERUP_INVINCIBLE, KIND_BAT_1
+from .enemy import Enemy
+
+GAME_STATES = ('menu', 'playing', 'game_over')
+DEATH_CAUSES = (None, 'obstacle', 'projectile')
+JUMP_DIRECTIONS = (None, 'left', 'right')
+
+# Nagłówek: stan, przyczyna końca, podwójne punkty, ziarno rozgrywki,
+# klatka, wynik, timer podwójnych punktów, dystans, ostatni krok, prędkość,
+# tło, generator poziomu (następny kawałek, następne nietoperze, stan
+# historii wzorców), liny, przesunięcia magazynów, liczby monet / powerupów /
+# nietoperzy / przeciwników / pocisków / czekających zdarzeń
+HEADER = struct.Struct(f'<BB?qiiiddddiqi{NUM_ROPES}d3d6H')
+PLAYER = struct.Struct('<iiiibb?i?ii?bii')
+RANDOM_STATE = struct.Struct('<625I')
+ENEMY = struct.Struct('<dddddd???iii')
+PROJECTILE = struct.Struct('<dddb')
+EVENT = struct.Struct('<dBbbiB')  # Zdarzenie z level.py: dystans, rodzaj, lina, wariant, y, dodatek
+
+# Kolumny magazynu: nazwa -> typ (kolejność zapisu)
+STORE_COLUMNS = (('y', np.float64), ('lane', np.int8), ('kind', np.int8),
+                 ('anim', np.int32), ('alive', np.bool_))
+
+
+# =============================================================================
+# ZAPIS
+# =============================================================================
+
+def _packed_seed_source(game):
+    """
+    Stan źródła ziaren jako bajty. Źródło zmienia się tylko przy starcie
+    nowej rozgrywki, więc pakujemy je raz i trzymamy do następnego losowania.
+    """
+    cached = game._packed_seed_source
+    if cached is None or cached[0] != game._seed_source_draws:
+        cached = (game._seed_source_draws, RANDOM_STATE.pack(*game._seed_source.getstate()[1]))
+        game._packed_seed_source = cached
+    return cached[1]
+
+
+def snapshot(game):
+    """Zwraca stan gry jako bajty (do restore albo RewindBuffer)."""
+    obstacles = game.obstacle_manager
+    enemies = game.enemy_manager
+    level = game.level
+    events = level.timeline.events
+    stores = (game.coin_store, game.powerup_store, obstacles.store)
+
+    parts = [HEADER.pack(
+        GAME_STATES.index(game.game_state),
+        DEATH_CAUSES.index(game.death_cause),
+        game.double_points_active,
+        game.run_seed,
+        game.frame_count,
+        game.score,
+        game.double_points_timer,
+        game.distance_pixels,
+        game.last_scroll_step,
+        game.scroll_speed,
+        game.background_y,
+        level.next_chunk,
+        level.next_obstacle,
+        level.pattern_state,
+        *[rope.scroll_offset for rope in game.ropes],
+        *[store.scrolled for store in stores],
+        *[store.count for store in stores],
+        len(enemies.enemies),
+        len(enemies.projectiles),
+        len(events),
+    )]
+
+    player = game.player
+    parts.append(PLAYER.pack(
+        player.rect.x, player.rect.y, player.prev_x, player.prev_y,
+        player.current_rope, player.previous_rope,
+        player.invincible, player.invincible_timer,
+        player.is_moving, player.target_x, player.move_cooldown,
+        player.is_jumping, JUMP_DIRECTIONS.index(player.jump_direction),
+        player.jump_progress, player.animation_counter,
+    ))
+
+    parts.append(RANDOM_STATE.pack(*game.rng.getstate()[1]))
+    parts.append(_packed_seed_source(game))
+
+    for store in stores:
+        for name, _ in STORE_COLUMNS:
+            parts.append(getattr(store, name)[:store.count].tobytes())
+
+    for enemy in enemies.enemies:
+        parts.append(ENEMY.pack(
+            enemy.x, enemy.y, enemy.prev_x, enemy.prev_y,
+            getattr(enemy, 'target_x', 0), getattr(enemy, 'target_y', 0),
+            enemy.from_bottom, enemy.direction == 'left', enemy.has_entered,
+            enemy.shoot_cooldown, enemy.time_on_screen, enemy.animation_counter,
+        ))
+    for projectile in enemies.projectiles:
+        parts.append(PROJECTILE.pack(projectile.x, projectile.prev_x,
+                                     projectile.y, projectile.direction))
+    # Kolejność tablicy kopca - po odtworzeniu to ten sam kopiec
+    for event in events:
+        parts.append(EVENT.pack(*event))
+
+    return b''.join(parts)
+
+
+# =============================================================================
+# ODTWARZANIE
+# =============================================================================
+
+def restore(game, data):
+    """
+    Przywraca stan zapisany przez snapshot() w istniejącej grze.
+    Obiekty wracają do pul i są brane z nich na nowo.
+    """
+    header = HEADER.unpack_from(data, 0)
+    (state, death_cause, game.double_points_active, game.run_seed,
+     game.frame_count, game.score, game.double_points_timer,
+     game.distance_pixels, game.last_scroll_step, game.scroll_speed,
+     game.background_y, next_chunk, next_obstacle, pattern_state) = header[:14]
+    rope_offsets = header[14:14 + NUM_ROPES]
+    scrolled = header[14 + NUM_ROPES:17 + NUM_ROPES]
+    store_counts = header[17 + NUM_ROPES:20 + NUM_ROPES]
+    enemy_count, projectile_count, event_count = header[20 + NUM_ROPES:]
+    offset = HEADER.size
+
+    game.game_state = GAME_STATES[state]
+    game.death_cause = DEATH_CAUSES[death_cause]
+    for rope, scroll_offset in zip(game.ropes, rope_offsets):
+        rope.scroll_offset = scroll_offset
+
+    # -----------------------------------------
+    # GRACZ
+    # -----------------------------------------
+    player = game.player
+    (x, y, player.prev_x, player.prev_y, player.current_rope, player.previous_rope,
+     player.invincible, player.invincible_timer, player.is_moving, player.target_x,
+     player.move_cooldown, player.is_jumping, jump_direction, player.jump_progress,
+     player.animation_counter) = PLAYER.unpack_from(data, offset)
+    offset += PLAYER.size
+    player.rect.topleft = (x, y)
+    player.hitbox.x = x + (PLAYER_WIDTH - player.hitbox.width) // 2
+    player.hitbox.y = y + (PLAYER_HEIGHT - player.hitbox.height) // 2
+    player.jump_direction = JUMP_DIRECTIONS[jump_direction]
+    if player.jump_clips and player.jump_direction:
+        player.jump_clip = player.jump_clips[player.jump_direction]
+
+    # -----------------------------------------
+    # LOSOWOŚĆ (ustawiana na końcu)
+    # -----------------------------------------
+    rng_state = RANDOM_STATE.unpack_from(data, offset)
+    offset += RANDOM_STATE.size
+    seed_source = bytes(data[offset:offset + RANDOM_STATE.size])
+    offset += RANDOM_STATE.size
+
+    # -----------------------------------------
+    # MONETY, POWERUPY, NIETOPERZE
+    # -----------------------------------------
+    sprite_manager = game.sprite_manager
+    geometry = game.lane_geometry
+    obstacles = game.obstacle_manager
+
+    def spawn_coin(coin, lane, y, kind):
+        coin.spawn(lane, y, sprite_manager, game.coin_store, geometry)
+
+    def spawn_powerup(powerup, lane, y, kind):
+        powerup_type = 'invincible' if kind == KIND_POWERUP_INVINCIBLE else 'double_points'
+        powerup.spawn(lane, y, powerup_type, sprite_manager, game.powerup_store, geometry)
+
+    def spawn_obstacle(obstacle, lane, y, kind):
+        bat_type = 'bat_1' if kind == KIND_BAT_1 else 'bat_2'
+        obstacle.spawn(lane, y, bat_type, sprite_manager, 0, obstacles.store, geometry)
+
+    targets = ((game.coin_store, game.coin_pool, spawn_coin),
+               (game.powerup_store, game.powerup_pool, spawn_powerup),
+               (obstacles.store, obstacles.pool, spawn_obstacle))
+    for (store, pool, spawn), count, store_scrolled in zip(targets, store_counts, scrolled):
+        columns = {}
+        for name, dtype in STORE_COLUMNS:
+            columns[name] = np.frombuffer(data, dtype, count, offset)
+            offset += columns[name].nbytes
+
+        store.clear(pool.release)
+        store.scrolled = store_scrolled
+        for lane, y, kind in zip(columns['lane'].tolist(), columns['y'].tolist(),
+                                 columns['kind'].tolist()):
+            spawn(pool.acquire(), lane, y, kind)
+        store.anim[:count] = columns['anim']
+        store.alive[:count] = columns['alive']
+
+
+    # -----------------------------------------
+    # PRZECIWNICY I POCISKI
+    # -----------------------------------------
+    enemies = game.enemy_manager
+    enemies.enemies = []
+    for _ in range(enemy_count):
+        (x, y, prev_x, prev_y, target_x, target_y, from_bottom, facing_left,
+         has_entered, shoot_cooldown, time_on_screen, animation_counter) = ENEMY.unpack_from(data, offset)
+        offset += ENEMY.size
+        enemy = Enemy(y, 'left' if facing_left else 'right', sprite_manager, game.rng)
+        enemy.x, enemy.y, enemy.prev_x, enemy.prev_y = x, y, prev_x, prev_y
+        enemy.target_x, enemy.target_y = target_x, target_y
+        enemy.from_bottom = from_bottom
+        enemy.has_entered = has_entered
+        enemy.shoot_cooldown = shoot_cooldown
+        enemy.time_on_screen = time_on_screen
+        enemy.animation_counter = animation_counter
+        enemy.rect.x = x
+        enemy.rect.y = y
+        enemies.enemies.append(enemy)
+
+    for projectile in enemies.projectiles:
+        enemies.projectile_pool.release(projectile)
+    enemies.projectiles.clear()
+    for index in range(projectile_count):
+        x, prev_x, y, direction = PROJECTILE.unpack_from(data, offset)
+        offset += PROJECTILE.size
+        projectile = enemies.projectile_pool.acquire()
+        projectile.spawn(x, y, direction)
+        projectile.prev_x = prev_x
+        projectile.index = index
+        enemies.projectiles.append(projectile)
+
+    # -----------------------------------------
+    # GENERATOR POZIOMU
+    # -----------------------------------------
+    level = game.level
+    level.seed = game.run_seed
+    level.next_chunk = next_chunk
+    level.next_obstacle = next_obstacle
+    level.pattern_state = pattern_state
+    level.timeline.events = [EVENT.unpack_from(data, offset + i * EVENT.size)
+                             for i in range(event_count)]
+
+    game.rng.setstate((3, rng_state, None))
+    if seed_source != _packed_seed_source(game):
+        game._seed_source.setstate((3, RANDOM_STATE.unpack(seed_source), None))
+        game._seed_source_draws += 1
+        game._packed_seed_source = (game._seed_source_draws, seed_source)
+
+    # Ekran trzeba narysować od nowa
+    game._static_screen_key = None
+    if game.menu:
+        game.menu.invalidate_game_over()
+    if game.renderer:
+        game.renderer.invalidate()
+
+
+# =============================================================================
+# BUFOR COFANIA
+# =============================================================================
+
+def _to_words(data):
+    """Bajty jako tablica słów 8-bajtowych (dopełniona zerami)."""
+    padding = -len(data) % 8
+    if padding:
+        data = data + bytes(padding)
+    return np.frombuffer(data, dtype=np.uint64)
+
+
+class RewindBuffer:
+    """
+    Ostatnie zapisy stanu gry: co keyframe_interval zapis pełny,
+    pomiędzy - tylko słowa różniące się od ostatniego pełnego zapisu.
+    """
+
+    def __init__(self, capacity=None, keyframe_interval=None):
+        """
+        Parametry:
+            capacity - ile ostatnich zapisów trzymać (None = REWIND_BUFFER_FRAMES)
+            keyframe_interval - co ile zapisów robić pełny zapis
+                                (None = REWIND_KEYFRAME_INTERVAL)
+        """
+        if capacity is None:
+            capacity = REWIND_BUFFER_FRAMES
+        if keyframe_interval is None:
+            keyframe_interval = REWIND_KEYFRAME_INTERVAL
+        self.capacity = capacity
+        self.keyframe_interval = keyframe_interval
+        # Wpis: (słowa klatki kluczowej, numery zmienionych słów, ich wartości,
+        # długość w bajtach); dla klatki kluczowej numery i wartości to None
+        self.entries = [None] * capacity
+        self.start = 0   # Indeks najstarszego wpisu
+        self.count = 0
+        self._keyframe = None
+        self._since_keyframe = 0
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Usuwa wszystkie zapisy."""
+        self.entries = [None] * self.capacity
+        self.start = 0
+        self.count = 0
+        self._keyframe = None
+
+    def push(self, data):
+        """Dodaje zapis (bajty ze snapshot()) - najstarszy wypada, gdy bufor jest pełny."""
+        words = _to_words(data)
+        base = self._keyframe
+        if base is None or self._since_keyframe >= self.keyframe_interval:
+            entry = (words, None, None, len(data))
+            self._keyframe = words
+            self._since_keyframe = 0
+        else:
+            length = len(words)
+            if len(base) != length:
+                # Różna liczba obiektów - porównujemy z dopełnieniem zerami
+                size = max(len(base), len(words))
+                padded_base = np.zeros(size, dtype=np.uint64)
+                padded_base[:len(base)] = base
+                padded = np.zeros(size, dtype=np.uint64)
+                padded[:len(words)] = words
+                base, words = padded_base, padded
+            changed = (base != words).nonzero()[0]
+            changed = changed[changed < length].astype(np.uint32)
+            entry = (self._keyframe, changed, words[changed], len(data))
+        self._since_keyframe += 1
+
+        if self.count == self.capacity:
+            self.entries[self.start] = entry
+            self.start = (self.start + 1) % self.capacity
+        else:
+            self.entries[(self.start + self.count) % self.capacity] = entry
+            self.count += 1
+
+    def get(self, frames_back=1):
+        """
+        Zwraca zapis sprzed frames_back zapisów (1 = najnowszy).
+        """
+        if not 1 <= frames_back <= self.count:
+            raise IndexError(f"W buforze jest {self.count} zapisów, a chcemy {frames_back}.")
+        keyframe, changed, values, length = self.entries[
+            (self.start + self.count - frames_back) % self.capacity]
+        if changed is None:
+            return keyframe.tobytes()[:length]
+
+        words = np.zeros((length + 7) // 8, dtype=np.uint64)
+        shared = min(len(words), len(keyframe))
+        words[:shared] = keyframe[:shared]
+        words[changed] = values
+        return words.tobytes()[:length]
+
+    def rewind(self, frames_back):
+        """
+        Cofa bufor: zwraca zapis sprzed frames_back zapisów (albo najstarszy)
+        i usuwa go razem z nowszymi - po przywróceniu gra zapisze je od nowa.
+        """
+        frames_back = min(frames_back, self.count)
+        data = self.get(frames_back)
+        self.count -= frames_back
+        self._keyframe = None  # Następny zapis będzie pełny
+        return data
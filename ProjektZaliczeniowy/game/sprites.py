@@ -3,10 +3,24 @@ HUGO - Manager Sprite'ów (grafik)
 =================================
 Ta klasa ładuje wszystkie obrazki z folderu sprites/
 i udostępnia je innym częściom gry.
+
+Jeśli istnieje aktualna paczka grafik (asset_bundle.py), obrazki są brane
+z niej - bez dekodowania PNG i bez cięcia/obracania przy starcie.
+
+Ładowanie w tle (background_loading=True): od razu ładujemy tylko grafiki
+menu (MENU_SPRITES), a resztę PNG dekoduje osobny wątek. Zdekodowane
+obrazki kończy (convert_alpha, cięcie na klatki) główny wątek - po kawałku
+między klatkami, w finish_loading(). Menu pokazuje się od razu, niezależnie
+od tego, ile grafik ma gra.
 """
 import pygame
 import os
+import queue
+import threading
+import time
 from .config import *
+from .asset_bundle import AssetBundle
+from .animation import AnimationClip
 
 
 class SpriteManager:
@@ -15,176 +29,283 @@ class SpriteManager:
     
     Jak działa:
     1. Przy tworzeniu ładuje wszystkie obrazki z dysku
+       (z paczki grafik, a gdy jej brak - z plików PNG)
     2. Dzieli duże obrazki (sprite sheets) na mniejsze klatki
     3. Inne klasy pobierają grafiki przez metody get_*()
     """
 
-    def __init__(self):
+    def __init__(self, use_bundle=True, background_loading=False):
+        """
+        Parametry:
+            use_bundle - czy próbować ładować z paczki grafik
+                         (False - zawsze z PNG, np. przy budowaniu paczki)
+            background_loading - czy dekodować PNG gry w osobnym wątku
+                                 (od razu gotowe są tylko grafiki menu)
+        """
         # Słownik przechowujący wszystkie grafiki
         # Klucz = nazwa, Wartość = obrazek lub lista obrazków
         self.sprites = {}
+        self.rope_strips = {}
+        self.coin_frames = []
+        
+        # Klipy animacji - tworzone od razu (bez klatek), żeby obiekty mogły
+        # trzymać do nich referencje jeszcze przed końcem ładowania
+        self.clips = {name: AnimationClip(ticks_per_frame, loop)
+                      for name, (ticks_per_frame, loop) in ANIMATION_CLIPS.items()}
+        
+        # Czy wszystkie grafiki są gotowe (w tle - dopiero po finish_loading)
+        self.ready = False
+        self._decoded = None       # Kolejka (nazwa, obrazek) z wątku dekodującego
+        self._remaining = 0        # Ile grafik czeka jeszcze na dokończenie
         
         # Załaduj wszystkie grafiki
-        self._load_all_sprites()
+        self.bundle = AssetBundle.open() if use_bundle else None
+        if self.bundle:
+            # Paczka ładuje się praktycznie od razu - nie ma czego robić w tle
+            self._load_bundle()
+        elif background_loading:
+            self._start_background_loading()
+        else:
+            self._load_all_sprites()
+
+    def _load_bundle(self):
+        """Tworzy wszystkie grafiki z paczki (bez dekodowania i przeliczania)."""
+        bundle = self.bundle
+        index = bundle.index
+        
+        for name, entry in index['sprites'].items():
+            self.sprites[name] = bundle.surface(entry)
+        for name, entries in index['animations'].items():
+            self.sprites[name] = [bundle.surface(entry) for entry in entries]
+        
+        self.rope_strips = {name: bundle.surface(entry)
+                            for name, entry in index['rope_strips'].items()}
+        self.coin_frames = [(bundle.surface(entry), tuple(entry[3:5]))
+                            for entry in index['coin_frames']]
+        self._bind_clips()
+
+        self.ready = True
+        print("[SPRITES] Wszystkie grafiki załadowane z paczki!")
+
+    @staticmethod
+    def _decode_image(name):
+        """Dekoduje plik PNG (bez convert_alpha - to robi główny wątek)."""
+        return pygame.image.load(os.path.join(SPRITES_DIR, SPRITE_FILES[name]))
 
     def _load_all_sprites(self):
         """Ładuje wszystkie grafiki z folderu sprites/"""
+        for name in SPRITE_FILES:
+            self._prepare_image(name, self._decode_image(name))
         
-        # Prosta funkcja pomocnicza do ładowania pliku
-        def load_image(filename):
-            path = os.path.join(SPRITES_DIR, filename)
-            image = pygame.image.load(path)
-            return image.convert_alpha()  # convert_alpha() przyspiesza rysowanie
+        self.ready = True
+        print("[SPRITES] Wszystkie grafiki załadowane!")
 
-        # -------------------------------------------
-        # GRACZ - animacja wspinaczki (7 klatek)
-        # -------------------------------------------
-        # Obrazek player_climb.png zawiera 7 klatek obok siebie
-        # Musimy go pociąć na pojedyncze klatki
-        climb_sheet = load_image(SPRITE_FILES['player_climb'])
+    # =========================================================================
+    # ŁADOWANIE W TLE
+    # =========================================================================
+
+    def _start_background_loading(self):
+        """Ładuje grafiki menu od razu, a resztę zleca wątkowi dekodującemu."""
+        for name in MENU_SPRITES:
+            self._prepare_image(name, self._decode_image(name))
+        
+        names = [name for name in SPRITE_FILES if name not in MENU_SPRITES]
+        self._remaining = len(names)
+        self._decoded = queue.Queue()
+        
+        worker = threading.Thread(target=self._decode_worker, args=(names,),
+                                  name="sprite-loader", daemon=True)
+        worker.start()
+
+    def _decode_worker(self, names):
+        """Wątek dekodujący: wczytuje PNG i oddaje je przez kolejkę."""
+        for name in names:
+            try:
+                image = self._decode_image(name)
+            except Exception as error:  # Błąd zgłosi główny wątek
+                image = error
+            self._decoded.put((name, image))
+
+    def finish_loading(self, time_budget=None):
+        """
+        Kończy grafiki zdekodowane w tle (wołać między klatkami).
+        Zwraca True, gdy wszystkie grafiki są gotowe.
         
-        self.sprites['player_climb'] = []
-        for i in range(PLAYER_CLIMB_FRAMES):
+        Parametry:
+            time_budget - ile sekund najwyżej poświęcić w tej klatce
+                          (None = ASSET_FINALIZE_BUDGET)
+        """
+        if self.ready:
+            return True
+        
+        if time_budget is None:
+            time_budget = ASSET_FINALIZE_BUDGET
+        deadline = time.perf_counter() + time_budget
+        while self._remaining:
+            try:
+                name, image = self._decoded.get_nowait()
+            except queue.Empty:
+                return False  # Wątek jeszcze dekoduje
+            if isinstance(image, Exception):
+                raise image
+            
+            self._prepare_image(name, image)
+            self._remaining -= 1
+            if time.perf_counter() >= deadline:
+                break
+        
+        if self._remaining == 0:
+            self.ready = True
+            print("[SPRITES] Wszystkie grafiki załadowane!")
+        return self.ready
+
+    # =========================================================================
+    # PRZYGOTOWANIE GRAFIK (cięcie na klatki, odbicia, obroty)
+    # =========================================================================
+
+    def _cut_frames(self, sheet, count, width, height):
+        """Tnie poziomy arkusz (sprite sheet) na count klatek."""
+        frames = []
+        for i in range(count):
             # Wycinamy prostokąt: (x, y, szerokość, wysokość)
-            x = i * PLAYER_FRAME_WIDTH
-            frame = climb_sheet.subsurface((x, 0, PLAYER_FRAME_WIDTH, PLAYER_HEIGHT))
-            self.sprites['player_climb'].append(frame)
+            frames.append(sheet.subsurface((i * width, 0, width, height)))
+        return frames
 
-        # -------------------------------------------
-        # GRACZ - animacja skoku w lewo (4 klatki)
-        # -------------------------------------------
-        jump_left_sheet = load_image(SPRITE_FILES['player_jump_left'])
+    def _prepare_image(self, name, image):
+        """
+        Zamienia zdekodowany obrazek na format ekranu i tnie go na klatki.
         
-        self.sprites['player_jump_left'] = []
-        for i in range(PLAYER_JUMP_FRAMES):
-            x = i * PLAYER_JUMP_FRAME_WIDTH
-            frame = jump_left_sheet.subsurface((x, 0, PLAYER_JUMP_FRAME_WIDTH, PLAYER_HEIGHT))
-            self.sprites['player_jump_left'].append(frame)
+        Parametry:
+            name - klucz z SPRITE_FILES
+            image - obrazek prosto z pygame.image.load
+        """
+        image = image.convert_alpha()  # convert_alpha() przyspiesza rysowanie
 
         # -------------------------------------------
-        # GRACZ - animacja skoku w prawo (4 klatki)
+        # GRACZ - animacja wspinaczki (7 klatek)
         # -------------------------------------------
-        jump_right_sheet = load_image(SPRITE_FILES['player_jump_right'])
-        
-        self.sprites['player_jump_right'] = []
-        for i in range(PLAYER_JUMP_FRAMES):
-            x = i * PLAYER_JUMP_FRAME_WIDTH
-            frame = jump_right_sheet.subsurface((x, 0, PLAYER_JUMP_FRAME_WIDTH, PLAYER_HEIGHT))
-            self.sprites['player_jump_right'].append(frame)
+        # Obrazek player_climb.png zawiera 7 klatek obok siebie
+        # Musimy go pociąć na pojedyncze klatki
+        if name == 'player_climb':
+            self.sprites[name] = self._cut_frames(
+                image, PLAYER_CLIMB_FRAMES, PLAYER_FRAME_WIDTH, PLAYER_HEIGHT)
 
         # -------------------------------------------
-        # TŁO I LINY - pojedyncze obrazki
+        # GRACZ - animacja skoku w lewo / w prawo (4 klatki)
         # -------------------------------------------
-        self.sprites['background'] = load_image(SPRITE_FILES['background'])
-        self.sprites['rope'] = load_image(SPRITE_FILES['rope'])
+        elif name in ('player_jump_left', 'player_jump_right'):
+            self.sprites[name] = self._cut_frames(
+                image, PLAYER_JUMP_FRAMES, PLAYER_JUMP_FRAME_WIDTH, PLAYER_HEIGHT)
 
         # -------------------------------------------
-        # MONETA - pojedynczy obrazek
+        # LINY - kafelek + gotowy pasek
         # -------------------------------------------
-        self.sprites['coin'] = load_image(SPRITE_FILES['coin'])
+        elif name == 'rope':
+            self.sprites[name] = image
+            self._build_rope_strips([name])
 
         # -------------------------------------------
-        # NIETOPERZE - animacja 3 klatek (każdy typ)
+        # MONETA - obrazek + gotowe obrócone klatki
         # -------------------------------------------
-        # Nietoperz typu 1 (czerwony)
-        bat1_sheet = load_image(SPRITE_FILES['bat_1'])
-        self.sprites['bat_1'] = []
-        for i in range(BAT_ANIMATION_FRAMES):
-            x = i * BAT_FRAME_SIZE
-            frame = bat1_sheet.subsurface((x, 0, BAT_FRAME_SIZE, BAT_FRAME_SIZE))
-            self.sprites['bat_1'].append(frame)
-
-        # Nietoperz typu 2 (fioletowy)
-        bat2_sheet = load_image(SPRITE_FILES['bat_2'])
-        self.sprites['bat_2'] = []
-        for i in range(BAT_ANIMATION_FRAMES):
-            x = i * BAT_FRAME_SIZE
-            frame = bat2_sheet.subsurface((x, 0, BAT_FRAME_SIZE, BAT_FRAME_SIZE))
-            self.sprites['bat_2'].append(frame)
+        elif name == 'coin':
+            self.sprites[name] = image
+            self._build_coin_frames()
 
         # -------------------------------------------
-        # POWERUPY - pojedyncze obrazki
+        # NIETOPERZE - animacja 3 klatek (każdy typ)
         # -------------------------------------------
-        self.sprites['powerup_shield'] = load_image(SPRITE_FILES['powerup_shield'])
-        self.sprites['powerup_star'] = load_image(SPRITE_FILES['powerup_star'])
+        # bat_1 - czerwony, bat_2 - fioletowy
+        elif name in ('bat_1', 'bat_2'):
+            self.sprites[name] = self._cut_frames(
+                image, BAT_ANIMATION_FRAMES, BAT_FRAME_SIZE, BAT_FRAME_SIZE)
 
         # -------------------------------------------
         # PRZECIWNIK (ENEMY) - 2 klatki + odbicie lustrzane
         # -------------------------------------------
-        enemy_sheet = load_image(SPRITE_FILES['enemy'])
-        
-        # Wersja patrząca w lewo (oryginał)
-        self.sprites['enemy_left'] = []
-        for i in range(ENEMY_ANIMATION_FRAMES):
-            x = i * ENEMY_WIDTH
-            frame = enemy_sheet.subsurface((x, 0, ENEMY_WIDTH, ENEMY_HEIGHT))
-            self.sprites['enemy_left'].append(frame)
-        
-        # Wersja patrząca w prawo (odbicie lustrzane)
-        self.sprites['enemy_right'] = []
-        for frame in self.sprites['enemy_left']:
+        elif name == 'enemy':
+            # Wersja patrząca w lewo (oryginał)
+            self.sprites['enemy_left'] = self._cut_frames(
+                image, ENEMY_ANIMATION_FRAMES, ENEMY_WIDTH, ENEMY_HEIGHT)
+            
+            # Wersja patrząca w prawo (odbicie lustrzane)
             # flip(obrazek, odbij_poziomo, odbij_pionowo)
-            flipped = pygame.transform.flip(frame, True, False)
-            self.sprites['enemy_right'].append(flipped)
+            self.sprites['enemy_right'] = [pygame.transform.flip(frame, True, False)
+                                           for frame in self.sprites['enemy_left']]
 
-        print("[SPRITES] Wszystkie grafiki załadowane!")
+        # -------------------------------------------
+        # TŁO I POWERUPY - pojedyncze obrazki
+        # -------------------------------------------
+        else:
+            self.sprites[name] = image
+        
+        self._bind_clips()
 
-    # =========================================================================
-    # METODY DO POBIERANIA GRAFIK
-    # =========================================================================
+    def _bind_clips(self):
+        """Daje klatki klipom animacji, których grafiki są już gotowe."""
+        for name, clip in self.clips.items():
+            if not clip.frames and name in self.sprites:
+                clip.set_frames(self.sprites[name])
 
-    def get_player_frame(self, animation_counter, is_jumping, jump_direction, jump_progress):
+    def _build_rope_strips(self, texture_names):
         """
-        Zwraca odpowiednią klatkę animacji gracza.
+        Skleja kafelki tekstur lin w jeden wysoki pasek (raz, przy ładowaniu).
         
-        Parametry:
-            animation_counter - licznik do animacji (rośnie co klatkę)
-            is_jumping - czy gracz skacze między linami
-            jump_direction - 'left' lub 'right'
-            jump_progress - jak daleko jest w skoku (0-20)
-        """
-        # Jeśli gracz skacze - użyj animacji skoku
-        if is_jumping and jump_direction:
-            # Oblicz która klatka skoku (0, 1, 2 lub 3)
-            frame_number = int((jump_progress / 20.0) * PLAYER_JUMP_FRAMES)
-            frame_number = min(frame_number, PLAYER_JUMP_FRAMES - 1)  # Nie przekrocz maksimum
-            
-            if jump_direction == 'left':
-                return self.sprites['player_jump_left'][frame_number]
-            else:
-                return self.sprites['player_jump_right'][frame_number]
+        Pasek jest wyższy od ekranu o dwa kafelki, więc linę przesuniętą
+        o dowolne scroll_offset rysujemy JEDNYM blitem zamiast kilkunastu.
+        """
+        num_tiles = SCREEN_HEIGHT // ROPE_TILE_HEIGHT + 3
+        
+        for name in texture_names:
+            tile = self.sprites[name]
+            strip = pygame.Surface((tile.get_width(), num_tiles * ROPE_TILE_HEIGHT), pygame.SRCALPHA)
+            for i in range(num_tiles):
+                strip.blit(tile, (0, i * ROPE_TILE_HEIGHT))
+            self.rope_strips[name] = strip.convert_alpha()
+
+    def _build_coin_frames(self):
+        """
+        Przygotowuje obrócone klatki monety (raz, przy ładowaniu).
+        
+        Moneta obraca się zawsze o COIN_ROTATION_STEP stopni, więc istnieje
+        tylko 360 / COIN_ROTATION_STEP różnych obrazków. Obracanie w każdej
+        klatce gry (pygame.transform.rotate) było bardzo kosztowne.
+        
+        Każda klatka to (obrazek, przesunięcie) - przesunięcie mówi, gdzie
+        narysować lewy górny róg względem środka monety.
+        """
+        coin_sprite = self.sprites['coin']
+        self.coin_frames = []
+        for angle in range(0, 360, COIN_ROTATION_STEP):
+            rotated = pygame.transform.rotate(coin_sprite, angle)
+            offset = (-(rotated.get_width() // 2), -(rotated.get_height() // 2))
+            self.coin_frames.append((rotated, offset))
 
-        # Normalnie - animacja wspinaczki
-        # Zmieniamy klatkę co PLAYER_ANIMATION_SPEED klatek gry
-        frame_number = (animation_counter // PLAYER_ANIMATION_SPEED) % PLAYER_CLIMB_FRAMES
-        return self.sprites['player_climb'][frame_number]
+    # =========================================================================
+    # METODY DO POBIERANIA GRAFIK
+    # =========================================================================
 
-    def get_bat_frame(self, animation_counter, bat_type):
+    def get_clip(self, name):
         """
-        Zwraca klatkę animacji nietoperza.
+        Zwraca klip animacji (AnimationClip) o podanej nazwie
+        (klucze ANIMATION_CLIPS, np. 'player_climb', 'enemy_left').
         
-        Parametry:
-            animation_counter - licznik animacji
-            bat_type - 'bat_1' lub 'bat_2'
+        Klip istnieje od utworzenia SpriteManager - przy ładowaniu w tle
+        dostaje klatki, gdy tylko jego grafika będzie gotowa.
         """
-        # Zmieniamy klatkę co 10 klatek gry
-        frame_number = (animation_counter // 10) % BAT_ANIMATION_FRAMES
-        return self.sprites[bat_type][frame_number]
+        return self.clips[name]
+
+    def get_rope_strip(self, name='rope'):
+        """Zwraca gotowy pasek liny (sklejone kafelki tekstury)."""
+        return self.rope_strips[name]
 
-    def get_enemy_frame(self, animation_counter, direction):
+    def get_coin_frame(self, rotation):
         """
-        Zwraca klatkę animacji przeciwnika.
+        Zwraca obróconą klatkę monety: (obrazek, przesunięcie od środka).
         
         Parametry:
-            animation_counter - licznik animacji
-            direction - 'left' lub 'right'
+            rotation - kąt obrotu (wielokrotność COIN_ROTATION_STEP)
         """
-        frame_number = (animation_counter // ENEMY_ANIMATION_SPEED) % ENEMY_ANIMATION_FRAMES
-        
-        if direction == 'left':
-            return self.sprites['enemy_left'][frame_number]
-        else:
-            return self.sprites['enemy_right'][frame_number]
+        return self.coin_frames[rotation // COIN_ROTATION_STEP]
 
     def get_sprite(self, name):
         """
@@ -0,0 +1,81 @@
+"""
+HUGO - Zmiana ustawień w trakcie działania
+==========================================
+Moduły gry robią "from .config import *", więc każdy ma WŁASNĄ kopię
+stałych z config.py. Zmiana samego config.ENEMY_SHOOT_CHANCE niczego
+by nie zmieniła - trzeba ją wpisać we wszystkie moduły gry, które tę
+nazwę zaimportowały.
+
+Używane przez testy balansu (balance.py) i sprawdzanie poziomów
+(verify.py) do zmiany ustawień bez edytowania config.py - także
+parametrem --set NAZWA=WARTOŚĆ (parse_assignment, parse_value).
+
+Zmiana działa na wszystko, co czyta stałą w trakcie działania - także
+na domyślne parametry klas (np. Autopilot(budget=None) bierze
+AUTOPILOT_BUDGET przy tworzeniu bota, nie przy imporcie autopilot.py).
+
+Uwaga:
+- wartości wyliczane w config.py z innych stałych (np. PLAYER_MAX_Y
+  z SCREEN_HEIGHT) NIE przeliczają się same - zmieniaj je osobno,
+- stałych z IMPORT_TIME_SETTINGS nie da się zmienić - moduły budują
+  z nich układy danych przy imporcie (apply_config_overrides zgłasza błąd),
+- obiekt, który zapamiętał wartość przy tworzeniu (np. Autopilot.budget),
+  nie widzi zmian zrobionych później.
+"""
+import ast
+import sys
+from . import config
+
+# Stałe, z których moduły budują układy danych przy imporcie -> gdzie
+IMPORT_TIME_SETTINGS = {
+    'NUM_ROPES': "układ zapisu stanu w snapshot.py i obserwacji w env.py",
+    'ENV_OBSTACLES_PER_LANE': "układ obserwacji w env.py",
+    'ENV_PROJECTILES': "układ obserwacji w env.py",
+}
+
+
+def override_error(name):
+    """Dlaczego ustawienia name nie można zmienić (None = można)."""
+    if not hasattr(config, name):
+        return f"Nieznane ustawienie: {name}"
+    if name in IMPORT_TIME_SETTINGS:
+        return (f"Ustawienia {name} nie można zmienić w trakcie działania "
+                f"({IMPORT_TIME_SETTINGS[name]}) - zmień je w config.py")
+    return None
+
+
+def apply_config_overrides(overrides):
+    """
+    Ustawia nowe wartości stałych w config i we wszystkich modułach gry.
+    Zwraca słownik z poprzednimi wartościami (do przywrócenia tą samą funkcją).
+
+    Parametry:
+        overrides - słownik {nazwa stałej: nowa wartość}
+    """
+    previous = {}
+    for name, value in overrides.items():
+        error = override_error(name)
+        if error:
+            raise ValueError(error)
+        previous[name] = getattr(config, name)
+
+        for module_name, module in list(sys.modules.items()):
+            if module_name.startswith(__package__ + '.') and hasattr(module, name):
+                setattr(module, name, value)
+    return previous
+
+
+def parse_value(text):
+    """Zamienia napis na liczbę / wartość Pythona ("0.03" -> 0.03)."""
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+def parse_assignment(text):
+    """Rozdziela "NAZWA=wartości" na nazwę i napis z wartościami."""
+    name, separator, values = text.partition('=')
+    if not separator or not values:
+        raise SystemExit(f"Oczekiwano NAZWA=WARTOŚĆ, a jest: {text!r}")
+    return name.strip(), values
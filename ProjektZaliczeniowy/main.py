@@ -5,27 +5,179 @@ HUGO - Gra
 Wymagania:
 - Python 3.x
 - Pygame (pip install pygame)
+- NumPy (pip install numpy)
 
 Jak uruchomić:
     python main.py
+
+Tryb bez okna (symulacja, np. na serwerze):
+    python main.py --headless --frames 10000 --seed 42
+    python main.py --headless --frames 10000 --script sterowanie.txt
+
+Nagrywanie i odtwarzanie rozgrywki:
+    python main.py --seed 7 --record gra.hrp
+    python main.py --replay gra.hrp              # w oknie
+    python main.py --headless --replay gra.hrp   # bez okna, pełna prędkość
+
+Szybszy start (paczka gotowych grafik, budować po zmianie PNG):
+    python main.py --build-assets
+
+Pomiar czasów faz klatki (F3 - nakładka, wynik zapisany przy wyjściu):
+    python main.py --profile profil.json
+
+Cofanie rozgrywki (Backspace cofa o sekundę, także po przegranej):
+    python main.py --rewind
+
+Autopilot (gra sam - pokaz albo długi test bez okna):
+    python main.py --autopilot
+    python main.py --headless --autopilot --frames 100000 --record test.hrp
 """
+import argparse
+import os
+import time
 import pygame
 import sys
 from game.game import Game
+from game.config import *
+from game.sprites import SpriteManager
+from game.asset_bundle import build_bundle
+from game.controls import ScriptedInput
+from game.autopilot import Autopilot
+from game.replay import ReplayRecorder, ReplayPlayer, SEED_MIN, SEED_MAX
+
+
+def parse_args():
+    """Wczytuje parametry z linii poleceń."""
+    parser = argparse.ArgumentParser(description="HUGO - Wspinaczka po Linach")
+    parser.add_argument('--headless', action='store_true',
+                        help="symulacja bez okna i rysowania")
+    parser.add_argument('--frames', type=int, default=None,
+                        help="ile klatek symulować w trybie headless "
+                             "(domyślnie 3600 albo długość nagrania)")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="ziarno losowości (powtarzalne rozgrywki)")
+    parser.add_argument('--script', default=None,
+                        help="plik ze scenariuszem sterowania (linie: '<klatka> <klawisze>')")
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help="odświeżaj tylko zmienione fragmenty ekranu")
+    parser.add_argument('--record', default=None,
+                        help="nagraj sterowanie ostatniej rozgrywki do pliku")
+    parser.add_argument('--replay', default=None,
+                        help="odtwórz nagraną rozgrywkę z pliku")
+    parser.add_argument('--profile', default=None,
+                        help="mierz czasy faz klatki i zapisz histogramy do pliku przy wyjściu")
+    parser.add_argument('--autopilot', action='store_true',
+                        help="gra sam bot (co klatkę szuka ruchu, max 1 ms)")
+    parser.add_argument('--rewind', action='store_true',
+                        help="pamiętaj ostatnie klatki - Backspace cofa grę")
+    parser.add_argument('--build-assets', action='store_true',
+                        help="zbuduj paczkę grafik (szybszy start) i zakończ")
+    return parser.parse_args()
+
+
+def create_input(args):
+    """
+    Wybiera źródło sterowania i ziarno na podstawie parametrów.
+    Zwraca (input_source, seed) - None oznacza ustawienia domyślne.
+    """
+    if args.replay:
+        # Nagranie zawiera własne ziarno - bez niego rozgrywka byłaby inna
+        player = ReplayPlayer.from_file(args.replay)
+        return player, player.seed
+    if args.script:
+        return ScriptedInput.from_file(args.script), args.seed
+    if args.autopilot:
+        return Autopilot(), args.seed
+    return None, args.seed
+
+
+def run_headless(args):
+    """Uruchamia symulację bez okna i wypisuje wynik."""
+    input_source, seed = create_input(args)
+    recorder = ReplayRecorder() if args.record else None
+    game = Game(headless=True, seed=seed, input_source=input_source, recorder=recorder,
+                profile=bool(args.profile))
+    if args.autopilot:
+        input_source.attach(game)
+
+    frames = args.frames
+    if frames is None:
+        frames = input_source.frame_count if args.replay else 3600
+
+    start = time.perf_counter()
+    stats = game.run_headless(frames)
+    elapsed = time.perf_counter() - start
+
+    if recorder:
+        recorder.save(args.record)
+    if args.profile:
+        game.profiler.export(args.profile)
+
+    fps = stats['frames'] / elapsed if elapsed > 0 else float('inf')
+    print(f"[HEADLESS] klatki: {stats['frames']}, dystans: {stats['distance_m']} m, "
+          f"wynik: {stats['score']}, koniec gry: {stats['game_over']}, "
+          f"{fps:.0f} klatek/s")
+
+
+def build_assets():
+    """Ładuje grafiki z PNG i zapisuje je jako paczkę grafik."""
+    pygame.init()
+    # convert_alpha() potrzebuje ekranu - format pikseli paczki to format ekranu
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    start = time.perf_counter()
+    sprite_manager = SpriteManager(use_bundle=False)
+    build_bundle(sprite_manager, ASSET_BUNDLE_PATH)
+    elapsed = time.perf_counter() - start
+
+    print(f"[ASSETS] zapisano {ASSET_BUNDLE_PATH} "
+          f"({os.path.getsize(ASSET_BUNDLE_PATH) // 1024} KB, {elapsed:.2f} s)")
+    pygame.quit()
 
 
 def main():
     """Główna funkcja - uruchamia grę."""
-    
+    args = parse_args()
+
+    if args.build_assets:
+        build_assets()
+        return
+
+    # Ziarno trafia do nagrania i do zapisów stanu jako int64
+    if args.seed is not None and not SEED_MIN <= args.seed <= SEED_MAX:
+        raise SystemExit(f"--seed musi być z zakresu {SEED_MIN}..{SEED_MAX}")
+
+    # Cofnięta gra nie zgadza się z nagraniem (klatki sterowania idą dalej)
+    if args.rewind and (args.record or args.replay):
+        raise SystemExit("--rewind nie działa razem z --record ani --replay")
+    if args.autopilot and (args.replay or args.script):
+        raise SystemExit("--autopilot nie działa razem z --replay ani --script")
+
+    if args.headless:
+        # Bez okna nie potrzebujemy pygame.init()
+        run_headless(args)
+        return
+
     # Zainicjuj Pygame
     pygame.init()
-    
+
     # Utwórz grę
-    game = Game()
-    
+    input_source, seed = create_input(args)
+    recorder = ReplayRecorder() if args.record else None
+    game = Game(seed=seed, input_source=input_source, recorder=recorder,
+                dirty_rects=args.dirty_rects or USE_DIRTY_RECTS,
+                profile=bool(args.profile), rewind=args.rewind)
+    if args.autopilot:
+        input_source.attach(game)
+
     # Uruchom główną pętlę
     game.run()
-    
+
+    if recorder:
+        recorder.save(args.record)
+    if args.profile:
+        game.profiler.export(args.profile)
+
     # Sprzątanie po zakończeniu
     pygame.quit()
     sys.exit()
@@ -0,0 +1,137 @@
+"""
+HUGO - Sprawdzanie, czy poziom da się przejść
+=============================================
+Dla każdej gry (ziarna) nagrywa układ nietoperzy i pocisków, a potem
+sprawdza WSZYSTKIE możliwe ruchy gracza naraz (game/escape.py): czy jest
+choć jedna droga, która przeżywa do końca. Gdy nie ma - szuka
+najkrótszego okna klatek, które zamyka każdą drogę (kontrprzykład).
+
+Przykłady:
+    python verify.py --games 200
+    python verify.py --games 100 --frames 18000 --set MIN_OBSTACLE_DISTANCE=250 \\
+                     --out kontrprzyklady.json
+
+Wyniki (plik .json) - lista gier bez ucieczki, od najkrótszego okna:
+    seed          - ziarno gry
+    dead_frame    - klatka, w której nie ma już żadnej drogi
+    window_start  - od tej klatki nawet gracz stojący gdziekolwiek nie ucieknie
+    threats_start - zagrożenia w klatce window_start
+    threats_dead  - zagrożenia w klatce dead_frame
+      (zagrożenie: {"kind": "bat"/"projectile", "rect": [lewo, góra, prawo, dół]})
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from game.escape import EscapeChecker, record_world, THREAT_BAT
+from game.tuning import apply_config_overrides, override_error, parse_assignment, parse_value
+
+# Ile najkrótszych kontrprzykładów wypisać na ekran
+SHOW_COUNTEREXAMPLES = 5
+
+
+def parse_args():
+    """Wczytuje parametry z linii poleceń."""
+    parser = argparse.ArgumentParser(description="HUGO - sprawdzanie, czy poziom da się przejść")
+    parser.add_argument('--games', type=int, default=100,
+                        help="ile gier sprawdzić")
+    parser.add_argument('--frames', type=int, default=36000,
+                        help="ile klatek każdej gry sprawdzić (36000 = 10 minut)")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="ziarno pierwszej gry (kolejne: seed+1, seed+2, ...)")
+    parser.add_argument('--set', action='append', default=[], metavar='NAZWA=WARTOŚĆ',
+                        help="zmiana ustawienia (można powtarzać)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="ile procesów (domyślnie tyle, ile rdzeni)")
+    parser.add_argument('--out', default='kontrprzyklady.json',
+                        help="plik z kontrprzykładami (.json)")
+    return parser.parse_args()
+
+
+# =============================================================================
+# PRACA JEDNEGO PROCESU
+# =============================================================================
+
+def describe_threats(world, tick):
+    """Zagrożenia z klatki tick w postaci do zapisu w JSON."""
+    return [{'kind': 'bat' if kind == THREAT_BAT else 'projectile',
+             'rect': [int(left), int(top), int(right), int(bottom)]}
+            for kind, left, top, right, bottom in world.threats(tick)]
+
+
+def run_job(job):
+    """
+    Sprawdza jedną grę (wywoływane w procesie roboczym).
+    Zwraca (ziarno, kontrprzykład albo None, liczba stanów, czas szukania).
+    """
+    seed, overrides, max_frames = job
+
+    previous = apply_config_overrides(overrides)
+    try:
+        world = record_world(seed, max_frames)
+        checker = EscapeChecker(world)
+        start = time.perf_counter()
+        dead_frame = checker.check()
+        counterexample = None
+        if dead_frame is not None:
+            window_start = checker.find_window(dead_frame)
+            counterexample = {
+                'seed': seed,
+                'dead_frame': dead_frame,
+                'window_start': window_start,
+                'threats_start': describe_threats(world, window_start) if window_start else [],
+                'threats_dead': describe_threats(world, dead_frame),
+            }
+        elapsed = time.perf_counter() - start
+    finally:
+        apply_config_overrides(previous)
+
+    return seed, counterexample, checker.states_visited, elapsed
+
+
+# =============================================================================
+# PODSUMOWANIE
+# =============================================================================
+
+def main():
+    args = parse_args()
+
+    overrides = {}
+    for text in args.set:
+        name, value = parse_assignment(text)
+        error = override_error(name)
+        if error:
+            raise SystemExit(error)
+        overrides[name] = parse_value(value)
+
+    jobs = [(seed, overrides, args.frames)
+            for seed in range(args.seed, args.seed + args.games)]
+
+    counterexamples = []
+    total_states = 0
+    search_time = 0.0
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.workers) as pool:
+        for seed, counterexample, states, elapsed in pool.imap_unordered(run_job, jobs):
+            total_states += states
+            search_time += elapsed
+            if counterexample:
+                counterexamples.append(counterexample)
+    elapsed = time.perf_counter() - start
+
+    # Najkrótsze okno = najprostszy do obejrzenia kontrprzykład
+    counterexamples.sort(key=lambda c: (c['dead_frame'] - c['window_start'], c['seed']))
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(counterexamples, f, indent=1)
+
+    print(f"[WERYFIKACJA] {args.games} gier po {args.frames} klatek w {elapsed:.1f} s "
+          f"({total_states / max(search_time, 1e-9):.0f} stanów/s, {args.workers} procesów)")
+    print(f"[WERYFIKACJA] bez ucieczki: {len(counterexamples)} z {args.games} gier -> {args.out}")
+    for c in counterexamples[:SHOW_COUNTEREXAMPLES]:
+        print(f"              ziarno {c['seed']}: klatki {c['window_start']}-{c['dead_frame']}, "
+              f"{len(c['threats_dead'])} zagrożeń w klatce {c['dead_frame']}")
+
+
+if __name__ == "__main__":
+    main()